@@ -0,0 +1 @@
+"""Benchmark harnesses for the indexing service (run with python -m benchmarks.<name>)."""
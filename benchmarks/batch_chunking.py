@@ -0,0 +1,82 @@
+"""
+Compare per-document and batched sentence chunking of many short records.
+
+"per-document" calls SentenceChunker.chunk_document once per record, as the
+chunk stage did before micro-batching; "batched" chunks the same records with
+one chunk_documents call per --batch-size records. The boundary cache is
+cleared before every run so both modes segment every record.
+
+Usage:
+    python -m benchmarks.batch_chunking [--documents 5000] [--batch-size 256] [--repeat 5]
+"""
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.chunking.sentence_chunker import SentenceChunker
+
+PHRASES = [
+    "My order has not arrived yet", "The app crashes when I open settings",
+    "How do I reset my password", "Refunds are processed within 5 days",
+    "Please attach a screenshot of the error", "Dr. Lee approved the request",
+    "The invoice total was $12.50", "Thanks for the quick reply",
+]
+
+def make_records(count: int, seed: int = 7) -> List[Tuple[str, Dict[str, Any]]]:
+    """Build short ticket-like records of one to three sentences."""
+    rng = random.Random(seed)
+    return [
+        (" ".join(rng.choice(PHRASES) + rng.choice(".?!") for _ in range(rng.randint(1, 3))),
+         {'source': f'ticket-{index}.txt'})
+        for index in range(count)
+    ]
+
+def per_document(chunker: SentenceChunker, records, params, batch_size: int) -> int:
+    chunks = 0
+    for content, metadata in records:
+        chunks += len(chunker.chunk_document(content, metadata, params))
+    return chunks
+
+def batched(chunker: SentenceChunker, records, params, batch_size: int) -> int:
+    chunks = 0
+    for start in range(0, len(records), batch_size):
+        chunks += len(chunker.chunk_documents(records[start:start + batch_size], params))
+    return chunks
+
+def measure(modes: Dict[str, Callable], chunker: SentenceChunker, records, params,
+            batch_size: int, repeat: int) -> Dict[str, float]:
+    """Return each mode's best observed throughput in records per second.
+
+    Modes are interleaved within every repeat so machine noise hits both alike.
+    """
+    best = dict.fromkeys(modes, float('inf'))
+    for _ in range(repeat):
+        for name, mode in modes.items():
+            chunker.boundary_cache.clear()
+            start = time.perf_counter()
+            mode(chunker, records, params, batch_size)
+            best[name] = min(best[name], time.perf_counter() - start)
+    return {name: len(records) / elapsed for name, elapsed in best.items()}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--documents', type=int, default=5000)
+    parser.add_argument('--batch-size', type=int, default=256)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    chunker = SentenceChunker()
+    chunker.load_resources()
+    records = make_records(args.documents)
+
+    print(f"{'segmenter':<10} {'per-document/s':>15} {'batched/s':>10} {'speedup':>8}")
+    for segmenter in chunker.segmenters:
+        params = {'segmenter': segmenter}
+        rates = measure({'per-document': per_document, 'batched': batched},
+                        chunker, records, params, args.batch_size, args.repeat)
+        single, batch = rates['per-document'], rates['batched']
+        print(f"{segmenter:<10} {single:>15.0f} {batch:>10.0f} {batch / single:>7.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Compare the memory held by chunks as plain dicts and as slotted Chunk records.
+
+Both modes chunk the same synthetic corpus (documents with the metadata a PDF
+or file upload typically carries) with the sentence chunker and stamp every
+chunk with 'chunk_id' and 'content_hash', as the chunk_id and dedup stages
+do, keeping all chunks alive. "dicts" copies the full metadata into every
+chunk at each step, as the stages did before records; "records" runs the
+pipeline stages, whose chunks share one metadata dict per document.
+"retained" is the memory still held by the chunks afterwards and "peak" the
+highest allocation while producing them, both measured with tracemalloc.
+
+Usage:
+    python -m benchmarks.chunk_records [--documents 2000] [--sentences 60]
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.chunking.base import make_chunk_id
+from src.chunking.sentence_chunker import SentenceChunker
+from src.pipeline.stages import ChunkIdStage, ChunkStage, DedupStage
+from src.records import Document
+
+WORDS = ("index service document chunk sentence metadata request stream client vector "
+         "embedding search result page report quarterly revenue region customer order").split()
+
+def make_documents(count: int, sentences: int, seed: int = 5) -> List[Tuple[str, Dict[str, Any]]]:
+    """Build documents of short sentences with realistic per-document metadata."""
+    rng = random.Random(seed)
+    documents = []
+    for index in range(count):
+        text = ' '.join(' '.join(rng.choice(WORDS) for _ in range(rng.randint(6, 16))).capitalize() + '.'
+                        for _ in range(sentences))
+        documents.append((text, {
+            'source': f'reports/2024/report-{index:05d}.pdf',
+            'file_path': f'/data/uploads/reports/2024/report-{index:05d}.pdf',
+            'document_id': f'doc-{index:05d}',
+            'title': f'Quarterly report {index}',
+            'author': rng.choice(['Finance Team', 'Operations', 'Legal Department']),
+            'timestamp': '2024-05-01T12:00:00',
+            'tags': ['finance', 'quarterly', rng.choice(['emea', 'apac', 'amer'])],
+            'pdf_version': '1.7',
+            'page_count': rng.randint(1, 40)
+        }))
+    return documents
+
+def dicts(chunker: SentenceChunker, documents, params) -> List[Dict[str, Any]]:
+    chunks = []
+    for content, metadata in documents:
+        for chunk in chunker.chunk_document(content, metadata, params):
+            chunk['metadata'] = {**chunk['metadata'],
+                                 'chunk_id': make_chunk_id(chunk['metadata'], chunk['content'])}
+            digest = DedupStage.content_hash(chunk['content'])
+            chunk['metadata'] = {**chunk['metadata'], 'content_hash': digest.hex()}
+            chunks.append(chunk)
+    return chunks
+
+def records(chunker: SentenceChunker, documents, params) -> List[Any]:
+    stream = ChunkStage(chunker, params).process(Document(content, metadata) for content, metadata in documents)
+    return list(DedupStage('mark').process(ChunkIdStage().process(stream)))
+
+def measure(mode: Callable, chunker: SentenceChunker, documents, params) -> Tuple[int, int, int]:
+    """Return (chunks, retained bytes, peak bytes) of one run."""
+    gc.collect()
+    tracemalloc.start()
+    chunks = mode(chunker, documents, params)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(chunks), retained, peak
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--documents', type=int, default=2000)
+    parser.add_argument('--sentences', type=int, default=60)
+    args = parser.parse_args()
+
+    documents = make_documents(args.documents, args.sentences)
+    chunker = SentenceChunker()
+    params = {'segmenter': 'regex', 'max_sentences_per_chunk': 3, 'overlap_sentences': 0}
+    # Warm the boundary cache so both modes measure chunk memory only
+    chunker.chunk_documents(documents, params)
+
+    print(f"{'mode':>8} {'chunks':>8} {'retained MB':>12} {'bytes/chunk':>12} {'peak MB':>8}")
+    for name, mode in (('dicts', dicts), ('records', records)):
+        count, retained, peak = measure(mode, chunker, documents, params)
+        print(f"{name:>8} {count:>8} {retained / 2**20:>12.1f} {retained / count:>12.0f} {peak / 2**20:>8.1f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Measure the per-request overhead removed by the app-scoped ComponentRegistry.
+
+"per-request" rebuilds what an ingest request used to construct on every call
+(PreprocessingModule with its extractors, StrategyManager, OutputFormatter, a
+fresh SentenceChunker and a fresh SimpleDirectoryReader); "registry" performs
+the lookups a request now does against components built once at startup.
+
+Usage:
+    python -m benchmarks.component_reuse [--requests 20]
+"""
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Dict
+
+from src.chunking.sentence_chunker import SentenceChunker
+from src.indexing.strategies import SimpleDirectoryReader
+from src.indexing.strategy_manager import StrategyManager
+from src.output.formatter import OutputFormatter
+from src.preprocessing.processor import PreprocessingModule
+from src.registry import ComponentRegistry
+
+def per_request_construction() -> None:
+    PreprocessingModule()
+    StrategyManager()
+    OutputFormatter()
+    SentenceChunker()
+    SimpleDirectoryReader()
+
+def make_registry_lookup(registry: ComponentRegistry) -> Callable[[], None]:
+    def registry_lookup() -> None:
+        registry.preprocessor
+        registry.strategy_manager.get_strategy('simple_directory')
+        registry.output_formatter
+        registry.chunker_manager.get_strategy('sentence_chunker')
+    return registry_lookup
+
+def measure(func: Callable[[], None], requests: int) -> Dict[str, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(requests):
+        func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocations = sum(stat.count for stat in snapshot.statistics('filename'))
+    return {
+        'ms_per_request': elapsed * 1000 / requests,
+        'peak_kib': peak / 1024,
+        'live_blocks': allocations
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=20)
+    args = parser.parse_args()
+
+    registry = ComponentRegistry()
+    results = {
+        'per-request': measure(per_request_construction, args.requests),
+        'registry': measure(make_registry_lookup(registry), args.requests)
+    }
+
+    print(f"{'mode':<12} {'ms/request':>11} {'peak KiB':>10} {'live blocks':>12}")
+    for mode, row in results.items():
+        print(f"{mode:<12} {row['ms_per_request']:>11.3f} {row['peak_kib']:>10.1f} {row['live_blocks']:>12}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Compare fixed-size chunking against a per-window search and sentence chunking.
+
+Boundary computation alone: "bounds/numpy" snaps all cut points at once as
+FixedSizeChunker does; "bounds/per-window" searches for whitespace around
+each cut in a Python loop with str.rfind/str.find. End to end (chunk dicts
+included): "fixed_size" is FixedSizeChunker.chunk_document and
+"sentence/regex" is SentenceChunker with the regex segmenter, the fastest
+sentence-aware option. The input is synthetic log lines.
+
+Usage:
+    python -m benchmarks.fixed_size_chunking [--megabytes 8] [--chunk-size 1000] [--repeat 5]
+"""
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+from src.chunking.fixed_size_chunker import FixedSizeChunker
+from src.chunking.sentence_chunker import SentenceChunker
+
+LEVELS = ['INFO', 'DEBUG', 'WARN', 'ERROR']
+MESSAGES = ['request served', 'cache miss for key', 'retrying upstream call', 'connection reset by peer',
+            'user logged in', 'job finished in', 'queue depth is']
+
+def make_log(megabytes: float, seed: int = 5) -> str:
+    """Build log lines totalling about megabytes of text."""
+    rng = random.Random(seed)
+    lines, size = [], 0
+    while size < megabytes * 1_000_000:
+        line = (f"2024-05-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00Z "
+                f"{rng.choice(LEVELS)} worker-{rng.randint(1, 16)} {rng.choice(MESSAGES)} {rng.randint(1, 99999)}")
+        lines.append(line)
+        size += len(line) + 1
+    return '\n'.join(lines)
+
+def per_window(text: str, size: int, tolerance: int) -> List[int]:
+    """Return cut points snapped to the nearest whitespace one window at a time."""
+    def snap(point: int) -> int:
+        candidates = []
+        before = max(text.rfind(' ', point - tolerance - 1, point), text.rfind('\n', point - tolerance - 1, point))
+        if before >= 0:
+            candidates.append(before + 1)
+        after = [found for found in (text.find(' ', point - 1, point + tolerance),
+                                     text.find('\n', point - 1, point + tolerance)) if found >= 0]
+        if after:
+            candidates.append(min(after) + 1)
+        candidates = [cut for cut in candidates if abs(cut - point) <= tolerance]
+        return min(candidates, key=lambda cut: (abs(cut - point), cut)) if candidates else point
+
+    return [0] + [snap(point) for point in range(size, len(text), size)] + [len(text)]
+
+def measure(modes: Dict[str, Callable[[], int]], repeat: int) -> Dict[str, float]:
+    """Return each mode's best time in seconds, interleaving modes within every repeat."""
+    best = dict.fromkeys(modes, float('inf'))
+    for _ in range(repeat):
+        for name, mode in modes.items():
+            start = time.perf_counter()
+            mode()
+            best[name] = min(best[name], time.perf_counter() - start)
+    return best
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--megabytes', type=float, default=8)
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--tolerance', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    text = make_log(args.megabytes)
+    fixed = FixedSizeChunker()
+    sentences = SentenceChunker()
+    params = {'chunk_size': args.chunk_size, 'snap_tolerance': args.tolerance}
+
+    def sentence_mode() -> int:
+        sentences.boundary_cache.clear()
+        return len(sentences.chunk_document(text, {}, {'segmenter': 'regex'}))
+
+    resolved = {**params, 'chunk_overlap': 0}
+    times = measure({
+        'bounds/numpy': lambda: len(fixed._bounds(text, 'chars', resolved)),
+        'bounds/per-window': lambda: len(per_window(text, args.chunk_size, args.tolerance)),
+        'fixed_size': lambda: len(fixed.chunk_document(text, {}, params)),
+        'sentence/regex': sentence_mode,
+    }, args.repeat)
+
+    print(f"{'mode':<18} {'seconds':>8} {'MB/s':>8}")
+    for name, elapsed in times.items():
+        print(f"{name:<18} {elapsed:>8.3f} {len(text) / 1e6 / elapsed:>8.1f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Import-time profile of the service.
+
+Runs `python -X importtime` in a fresh interpreter for each target module and
+reports the total import time, the slowest top-level imports, and which
+heavyweight dependencies were loaded eagerly.
+
+Usage:
+    python -m benchmarks.import_profile [module ...] [--top 15]
+"""
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+HEAVY_MODULES = ['llama_index.core', 'nltk', 'PyPDF2', 'pypdf', 'pypdfium2', 'pdfminer', 'numpy']
+
+def profile(module: str) -> Tuple[List[Tuple[str, int, int]], List[str]]:
+    """Return (name, self_us, cumulative_us) rows and the heavy modules loaded."""
+    probe = (
+        f"import {module}, sys; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', probe],
+        capture_output=True, text=True, check=True
+    )
+
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((name.rstrip(), int(self_us), int(cumulative_us)))
+
+    loaded = [m for m in completed.stdout.strip().split(',') if m]
+    return rows, loaded
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('modules', nargs='*', default=['src.main'])
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        rows, loaded = profile(module)
+        totals: Dict[str, int] = {name.strip(): cumulative for name, _, cumulative in rows}
+        print(f"== {module}: {totals.get(module, 0) / 1000:.1f} ms")
+        print(f"   heavy modules loaded: {', '.join(loaded) or 'none'}")
+        for name, _, cumulative in sorted(rows, key=lambda r: r[2], reverse=True)[:args.top]:
+            print(f"   {cumulative / 1000:>9.1f} ms  {name}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Measure near-duplicate detection speed and accuracy on synthetic chunks.
+
+Each corpus holds distinct random chunks plus lightly edited copies of
+earlier chunks (a fraction --edit-rate of their words replaced). The
+NearDedupStage runs in 'drop' mode over the whole corpus as one request;
+recall is the share of edited copies dropped, precision the share of
+dropped chunks that really were copies. Throughput at growing corpus sizes
+shows how the stage scales.
+
+Usage:
+    python -m benchmarks.near_dedup [--sizes 25000 50000 100000 200000] [--copy-fraction 0.2]
+"""
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+from src.pipeline.stages import NearDedupStage
+from src.records import Chunk
+
+def make_corpus(size: int, copy_fraction: float, edit_rate: float,
+                seed: int = 11) -> Tuple[List[Chunk], set]:
+    """Return chunks and the indices of chunks that are edited copies."""
+    rng = random.Random(seed)
+    vocabulary = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 9)))
+                  for _ in range(20000)]
+    chunks, copies, originals = [], set(), []
+    for index in range(size):
+        if originals and rng.random() < copy_fraction:
+            words = list(rng.choice(originals))
+            for position in rng.sample(range(len(words)), max(1, int(len(words) * edit_rate))):
+                words[position] = rng.choice(vocabulary)
+            copies.add(index)
+        else:
+            words = [rng.choice(vocabulary) for _ in range(rng.randint(60, 140))]
+            originals.append(words)
+        chunks.append(Chunk(' '.join(words), {'source': 'corpus.txt', 'chunk_index': index}))
+    return chunks, copies
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[25000, 50000, 100000, 200000])
+    parser.add_argument('--copy-fraction', type=float, default=0.2)
+    parser.add_argument('--edit-rate', type=float, default=0.02)
+    parser.add_argument('--threshold', type=float, default=None)
+    args = parser.parse_args()
+
+    print(f"{'chunks':>8} {'seconds':>8} {'chunks/s':>9} {'precision':>9} {'recall':>7}")
+    for size in args.sizes:
+        chunks, copies = make_corpus(size, args.copy_fraction, args.edit_rate)
+        stage = NearDedupStage('drop', threshold=args.threshold)
+        start = time.perf_counter()
+        kept = {chunk.get('chunk_index') for chunk in stage.process(chunks)}
+        elapsed = time.perf_counter() - start
+
+        dropped = set(range(size)) - kept
+        precision = len(dropped & copies) / len(dropped) if dropped else 1.0
+        recall = len(dropped & copies) / len(copies) if copies else 1.0
+        print(f"{size:>8} {elapsed:>8.2f} {size / elapsed:>9.0f} {precision:>9.3f} {recall:>7.3f}")
+
+if __name__ == '__main__':
+    main()
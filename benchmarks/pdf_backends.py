@@ -0,0 +1,71 @@
+"""
+Compare PDF extraction backends on a sample corpus.
+
+Reports pages/sec for every installed backend and text fidelity against a
+reference backend (word-sequence similarity, 1.0 = identical words in the
+same order).
+
+Usage:
+    python -m benchmarks.pdf_backends [corpus_dir] [--reference pypdf2] [--repeat 3]
+"""
+import argparse
+import difflib
+import glob
+import os
+import time
+from typing import Dict, List
+
+from src.preprocessing.extractors.pdf_backends import BackendSelector
+
+def word_similarity(reference: str, candidate: str) -> float:
+    """Return the similarity ratio of two texts compared word by word."""
+    matcher = difflib.SequenceMatcher(None, reference.split(), candidate.split(), autojunk=False)
+    return matcher.ratio()
+
+def run(corpus_dir: str, reference: str, repeat: int) -> List[Dict[str, float]]:
+    paths = sorted(glob.glob(os.path.join(corpus_dir, '**', '*.pdf'), recursive=True))
+    if not paths:
+        raise SystemExit(f"No PDF files found under {corpus_dir}")
+
+    selector = BackendSelector()
+    backends = selector.get_available_backends()
+    reference_texts = {path: selector.get_backend(reference).extract_file(path).text for path in paths}
+
+    results = []
+    for name in backends:
+        backend = selector.get_backend(name)
+        pages = 0
+        elapsed = 0.0
+        fidelity = []
+        for path in paths:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                extracted = backend.extract_file(path)
+                elapsed += time.perf_counter() - start
+            pages += len(extracted.pages) * repeat
+            fidelity.append(word_similarity(reference_texts[path], extracted.text))
+
+        results.append({
+            'backend': name,
+            'pages': pages,
+            'seconds': elapsed,
+            'pages_per_sec': pages / elapsed if elapsed else float('inf'),
+            'fidelity': sum(fidelity) / len(fidelity)
+        })
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('corpus_dir', nargs='?', default='test_docs')
+    parser.add_argument('--reference', default='pypdf2', help='backend used as the fidelity baseline')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    results = run(args.corpus_dir, args.reference, args.repeat)
+    print(f"{'backend':<10} {'pages':>7} {'seconds':>9} {'pages/sec':>10} {'fidelity':>9}")
+    for row in sorted(results, key=lambda r: r['pages_per_sec'], reverse=True):
+        print(f"{row['backend']:<10} {row['pages']:>7} {row['seconds']:>9.3f} "
+              f"{row['pages_per_sec']:>10.1f} {row['fidelity']:>9.3f}")
+
+if __name__ == '__main__':
+    main()
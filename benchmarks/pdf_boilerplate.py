@@ -0,0 +1,62 @@
+"""
+Measure repeated header/footer stripping on synthetic report pages.
+
+Every page carries a two-line running header, a footer with the page
+number and a copyright line, around body paragraphs; some pages omit the
+header, as title and section pages do. Reports the stripping throughput,
+the share of bytes removed, whether exactly the injected lines were removed,
+and how many sentence chunks the document yields before and after.
+
+Usage:
+    python -m benchmarks.pdf_boilerplate [--pages 100 1000 10000]
+"""
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+from src.chunking.sentence_chunker import SentenceChunker
+from src.preprocessing.extractors.pdf_backends import PDFContent
+from src.preprocessing.extractors.pdf_boilerplate import BoilerplateStripper
+
+WORDS = ("revenue margin customer region growth quarter forecast segment operating cost "
+         "product market supply demand investment strategy risk compliance").split()
+
+def make_pages(count: int, seed: int = 3) -> Tuple[List[str], List[str]]:
+    """Return pages with boilerplate and the same pages' bodies alone."""
+    rng = random.Random(seed)
+    pages, bodies = [], []
+    for number in range(1, count + 1):
+        body = '\n'.join(' '.join(rng.choice(WORDS) for _ in range(rng.randint(8, 14))).capitalize() + '.'
+                         for _ in range(rng.randint(15, 30)))
+        header = [] if rng.random() < 0.1 else ['ACME Corporation', 'Annual Report 2024 | Confidential']
+        footer = [f'Page {number} of {count}', '© 2024 ACME Corporation. All rights reserved.']
+        pages.append('\n'.join(header + [body] + footer))
+        bodies.append(body)
+    return pages, bodies
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, nargs='+', default=[100, 1000, 10000])
+    args = parser.parse_args()
+
+    stripper = BoilerplateStripper()
+    chunker = SentenceChunker()
+    params = {'segmenter': 'regex'}
+    print(f"{'pages':>7} {'seconds':>8} {'pages/s':>9} {'removed':>8} {'exact':>6} {'chunks before':>14} {'after':>7}")
+    for count in args.pages:
+        pages, bodies = make_pages(count)
+        content = PDFContent(list(pages))
+        start = time.perf_counter()
+        stripper.apply(content)
+        elapsed = time.perf_counter() - start
+
+        original = '\n'.join(pages)
+        removed = content.metadata['boilerplate_bytes_removed'] / len(original.encode('utf-8'))
+        before = len(chunker.chunk_document(original, {}, params))
+        after = len(chunker.chunk_document(content.text, {}, params))
+        print(f"{count:>7} {elapsed:>8.3f} {count / elapsed:>9.0f} {removed:>8.1%} "
+              f"{str(content.pages == bodies):>6} {before:>14} {after:>7}")
+
+if __name__ == '__main__':
+    main()
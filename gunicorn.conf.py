@@ -1,7 +1,12 @@
 # Gunicorn configuration file
+import gc
 import multiprocessing
 import os
 
+# Keep the collector from touching (and un-sharing) preloaded objects before
+# they are frozen in when_ready; each worker re-enables it after the fork
+gc.disable()
+
 # Server socket
 bind = "0.0.0.0:5000"
 backlog = 2048
@@ -41,3 +46,12 @@ reload_engine = 'auto'
 preload_app = True
 capture_output = True
 enable_stdio_inheritance = True
+
+# Server hooks
+def when_ready(server):
+    """Load shared models in the master (preload_app) and freeze them for copy-on-write."""
+    from src.registry import prefork_warmup
+    prefork_warmup(server.app.wsgi())
+
+def post_fork(server, worker):
+    gc.enable()
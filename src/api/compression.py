@@ -0,0 +1,153 @@
+import io
+import zlib
+from typing import BinaryIO, Iterable, Iterator, Optional, List
+
+READ_SIZE = 64 * 1024
+
+class UnsupportedEncodingError(ValueError):
+    """Raised for a Content-Encoding the service cannot decode."""
+
+class DecompressionLimitError(ValueError):
+    """Raised when a compressed body inflates beyond the allowed size."""
+
+def _zstd_available() -> bool:
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def supported_encodings() -> List[str]:
+    """Return the content codings this service can decode and produce, best first."""
+    return (['zstd'] if _zstd_available() else []) + ['gzip']
+
+class _DecompressingReader(io.RawIOBase):
+    """Raw stream that inflates a compressed source on demand, with an output size cap."""
+
+    def __init__(self, source: BinaryIO, encoding: str, max_bytes: int):
+        self._source = source
+        self._encoding = encoding
+        self._max_bytes = max_bytes
+        self._produced = 0
+        self._pending = b''
+        self._source_done = False
+
+        if encoding == 'zstd':
+            import zstandard
+            self._zstd_reader = zstandard.ZstdDecompressor().stream_reader(source, read_across_frames=True)
+        else:
+            self._gzip = zlib.decompressobj(wbits=31)
+            self._member_started = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = len(buffer)
+        if self._encoding == 'zstd':
+            count = self._zstd_reader.readinto(buffer)
+        else:
+            data = self._inflate_gzip(size)
+            count = len(data)
+            buffer[:count] = data
+
+        self._produced += count
+        if self._produced > self._max_bytes:
+            raise DecompressionLimitError(
+                f"Decompressed request body exceeds {self._max_bytes} bytes"
+            )
+        return count
+
+    def _inflate_gzip(self, size: int) -> bytes:
+        """Inflate at most size bytes, reading compressed input only as needed."""
+        while True:
+            if not self._pending and not self._source_done:
+                self._pending = self._source.read(READ_SIZE)
+                if not self._pending:
+                    self._source_done = True
+
+            if not self._pending:
+                if self._member_started:
+                    raise zlib.error("Truncated gzip request body")
+                return b''
+
+            self._member_started = True
+            data = self._gzip.decompress(self._pending, size)
+            self._pending = self._gzip.unconsumed_tail
+            if self._gzip.eof:
+                # Concatenated gzip members are one body (RFC 1952)
+                self._pending = self._gzip.unused_data
+                self._gzip = zlib.decompressobj(wbits=31)
+                self._member_started = False
+            if data:
+                return data
+
+def open_decompressed(source: BinaryIO, encoding: str, max_bytes: int) -> BinaryIO:
+    """
+    Wrap a compressed request stream in a buffered, size-capped decompressing reader.
+
+    Args:
+        source: Compressed input stream
+        encoding: Content-Encoding of the body ('gzip', 'x-gzip' or 'zstd')
+        max_bytes: Largest allowed decompressed size
+
+    Raises:
+        UnsupportedEncodingError: If the encoding cannot be decoded here
+    """
+    encoding = encoding.strip().lower()
+    if encoding == 'x-gzip':
+        encoding = 'gzip'
+    if encoding not in supported_encodings():
+        raise UnsupportedEncodingError(f"Unsupported Content-Encoding: {encoding}")
+    return io.BufferedReader(_DecompressingReader(source, encoding, max_bytes), buffer_size=READ_SIZE)
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the response coding from an Accept-Encoding header.
+
+    Returns:
+        'zstd' or 'gzip', preferring zstd when installed, or None for identity
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for part in accept_encoding.split(','):
+        token, _, params = part.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token.strip().lower()] = quality
+
+    for encoding in supported_encodings():
+        if accepted.get(encoding, accepted.get('*', 0.0)) > 0:
+            return encoding
+    return None
+
+def compress_stream(chunks: Iterable[bytes], encoding: str, level: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Compress a byte stream incrementally.
+
+    Args:
+        chunks: Uncompressed pieces, e.g. a streamed response body
+        encoding: 'gzip' or 'zstd'
+        level: Compression level (default 6 for gzip, 3 for zstd)
+
+    Yields:
+        Compressed pieces as the compressor emits them
+    """
+    if encoding == 'zstd':
+        import zstandard
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+    else:
+        compressor = zlib.compressobj(6 if level is None else level, zlib.DEFLATED, 31)
+
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,46 @@
+import json
+from typing import BinaryIO, Dict, Any, Iterator
+
+NDJSON_MIMETYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonl')
+
+class NDJSONError(ValueError):
+    """Raised when an NDJSON request body is malformed."""
+
+def iter_ndjson_documents(stream: BinaryIO, max_line_bytes: int) -> Iterator[Dict[str, Any]]:
+    """
+    Parse an NDJSON body incrementally, one document per line.
+
+    Lines are read from the stream only as documents are consumed, so
+    downstream stages start working while later lines are still arriving.
+
+    Args:
+        stream: Request input stream
+        max_line_bytes: Largest accepted single line (one document)
+
+    Yields:
+        One document dict per non-empty line
+
+    Raises:
+        NDJSONError: If a line is too long, not valid JSON, or not an object
+    """
+    line_number = 0
+    while True:
+        line = stream.readline(max_line_bytes + 1)
+        if not line:
+            return
+        line_number += 1
+
+        if len(line) > max_line_bytes and not line.endswith(b'\n'):
+            raise NDJSONError(f"Line {line_number} exceeds {max_line_bytes} bytes")
+
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            document = json.loads(line)
+        except ValueError as e:
+            raise NDJSONError(f"Invalid JSON on line {line_number}: {str(e)}")
+        if not isinstance(document, dict):
+            raise NDJSONError(f"Line {line_number} must be a JSON object")
+        yield document
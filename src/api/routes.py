@@ -1,50 +1,299 @@
-from flask import Blueprint, request, jsonify
-from src.indexing.strategy_manager import StrategyManager
-from src.preprocessing.processor import PreprocessingModule
-from src.output.formatter import OutputFormatter
+import itertools
+import json
+import logging
+import zlib
+from typing import Iterator, Iterable, Dict, Any, Optional, Tuple, BinaryIO
+from flask import Blueprint, request, jsonify, Response, current_app
+from werkzeug.exceptions import RequestEntityTooLarge
+from src.api.compression import (
+    UnsupportedEncodingError, DecompressionLimitError,
+    open_decompressed, negotiate_encoding, compress_stream
+)
+from src.api.ndjson import NDJSON_MIMETYPES, NDJSONError, iter_ndjson_documents
+from src.cache import ResultCache, request_cache_key
+from src.chunking.sentence_chunker import UnsupportedLanguageError
+from src.pipeline import Pipeline
+from src.pipeline.diff import diff_chunks
+from src.registry import get_components
 
 api_bp = Blueprint('api', __name__)
+logger = logging.getLogger(__name__)
+
+class RequestError(ValueError):
+    """Raised for malformed ingest requests; reported as 400."""
+
+# Status codes for errors found while reading the request body or its
+# first document
+REQUEST_ERROR_STATUS = (
+    (UnsupportedEncodingError, 415),
+    (DecompressionLimitError, 413),
+    (RequestEntityTooLarge, 413),
+    (RequestError, 400),
+    (NDJSONError, 400),
+    (UnsupportedLanguageError, 400)
+)
+
+# Request options besides the documents (JSON body fields or NDJSON query args)
+REQUEST_OPTIONS = ('client_id', 'indexing_strategy', 'chunk_params', 'dedup',
+                   'near_dedup', 'near_dedup_threshold')
+
+# Options /diff accepts; it compares against the client's manifest, so the
+# seen-history and near-duplicate options of ingest do not apply
+DIFF_OPTIONS = ('indexing_strategy', 'chunk_params', 'manifest')
+
+def _request_error_status(error: Exception) -> Optional[int]:
+    for error_type, status in REQUEST_ERROR_STATUS:
+        if isinstance(error, error_type):
+            return status
+    return None
 
 @api_bp.route('/ingest', methods=['POST'])
 def ingest():
-    """Handle document ingestion requests."""
-    data = request.get_json()
-
-    # Validate request
-    if not data or 'documents' not in data or 'indexing_strategy' not in data:
-        return jsonify({'error': 'Invalid request parameters'}), 400
+    """Handle document ingestion requests by streaming them through the pipeline."""
+    is_ndjson = request.mimetype in NDJSON_MIMETYPES
+    try:
+        if is_ndjson:
+            documents, options = _parse_ndjson_request()
+        else:
+            documents, options = _parse_json_request()
+    except (RequestError, NDJSONError, UnsupportedEncodingError, DecompressionLimitError,
+            RequestEntityTooLarge) as e:
+        return jsonify({'error': str(e)}), _request_error_status(e)
 
+    components = get_components()
+    builder = components.pipeline_builder
+    strategy_name, chunk_params = options['indexing_strategy'], options['chunk_params']
     try:
-        # Initialize components
-        preprocessor = PreprocessingModule()
-        strategy_manager = StrategyManager()
-        output_formatter = OutputFormatter()
+        pipeline = builder.build(strategy_name, chunk_params,
+                                 dedup=options['dedup'], client_id=options['client_id'],
+                                 near_dedup=options['near_dedup'],
+                                 near_dedup_threshold=options['near_dedup_threshold'])
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
 
-        # Add debug prints
-        print("\nIncoming documents:", data['documents'])
+    # Exact repeats of a JSON request are answered from the shared result
+    # cache; NDJSON bodies are streamed and cannot be keyed up front, and
+    # output deduplicated against the client's history changes every time
+    cache_key = None
+    if (components.result_cache is not None and not is_ndjson
+            and not builder.uses_client_history(options['dedup'], options['client_id'])):
+        cache_key = request_cache_key(documents, strategy_name, chunk_params,
+                                      namespace={'stages': builder.stage_config,
+                                                 'settings': components.cache_namespace,
+                                                 'dedup': [options['dedup'], options['near_dedup'],
+                                                           options['near_dedup_threshold']]})
+    if cache_key:
+        etag = _entity_tag(cache_key, _response_encoding())
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+            response.set_etag(etag)
+            response.vary.add('Accept-Encoding')
+            return response
+        cached_body = components.result_cache.get(cache_key)
+        if cached_body is not None:
+            return _json_response(iter([cached_body]), cache_key, 'HIT')
 
-        # Process documents
-        preprocessed_docs = preprocessor.process(data['documents'])
-        print("\nAfter preprocessing:", preprocessed_docs)
+    output = pipeline.run(documents)
+    try:
+        # Run the first document through every stage before committing to a
+        # 200, so invalid parameters and unreadable documents get a real error
+        first = next(output, b'')
+    except Exception as e:
+        output.close()
+        status = _request_error_status(e)
+        if status is None:
+            logger.exception("Error during processing")
+            status = 500
+        return jsonify({'error': str(e)}), status
 
-        indexed_data = strategy_manager.apply_strategy(
-            data['indexing_strategy'],
-            preprocessed_docs
-        )
-        print("\nAfter indexing:", indexed_data)
+    writer = _CacheWriter(components.result_cache, cache_key) if cache_key else None
+    return _json_response(_stream(first, output, pipeline, writer), cache_key, 'MISS' if cache_key else None)
 
-        formatted_output = output_formatter.format(indexed_data)
-        print("\nFinal formatted output:", formatted_output)
+@api_bp.route('/diff', methods=['POST'])
+def diff():
+    """
+    Re-chunk documents and return only the chunks that changed since a previous ingest.
 
-        return jsonify(formatted_output)
+    The JSON body is an ingest request plus 'manifest', mapping each
+    document's identity (metadata 'document_id', else 'source') to the
+    'chunk_id's the client already holds. The response lists per document
+    the added chunks, the removed ids and the full new manifest.
+    """
+    try:
+        documents, options = _parse_json_request(REQUEST_OPTIONS + ('manifest',))
+        unsupported = [option for option in REQUEST_OPTIONS
+                       if option not in DIFF_OPTIONS and options[option] is not None]
+        if unsupported:
+            raise RequestError(f"Options not supported by /diff: {', '.join(unsupported)}")
+        manifest = _parse_manifest(options['manifest'])
+    except (RequestError, UnsupportedEncodingError, DecompressionLimitError, RequestEntityTooLarge) as e:
+        return jsonify({'error': str(e)}), _request_error_status(e)
 
+    builder = get_components().pipeline_builder
+    try:
+        pipeline = builder.build(options['indexing_strategy'], options['chunk_params'], serialize=False)
+        results = diff_chunks(pipeline.run(documents), manifest)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
-        print(f"\nError during processing: {str(e)}")
+        logger.exception("Error during diff")
         return jsonify({'error': str(e)}), 500
+    return jsonify({'documents': results})
+
+def _parse_manifest(manifest: Any) -> Dict[str, Any]:
+    """Return the request's chunk id manifest, checking its shape."""
+    manifest = manifest or {}
+    if not isinstance(manifest, dict) or not all(
+            isinstance(ids, list) and all(isinstance(chunk_id, str) for chunk_id in ids)
+            for ids in manifest.values()):
+        raise RequestError('manifest must map document ids to lists of chunk ids')
+    return manifest
+
+def _response_encoding() -> Optional[str]:
+    """Return the content coding to compress the response with, per Accept-Encoding."""
+    if not current_app.config['COMPRESS_RESPONSES']:
+        return None
+    return negotiate_encoding(request.headers.get('Accept-Encoding'))
+
+def _entity_tag(cache_key: str, encoding: Optional[str]) -> str:
+    """Return the strong ETag of a cached result sent with encoding; each coding is its own entity."""
+    return f"{cache_key}-{encoding}" if encoding else cache_key
+
+def _json_response(body: Iterator[bytes], cache_key: Optional[str], cache_status: Optional[str]) -> Response:
+    """Build the streamed JSON response, compressed per Accept-Encoding."""
+    encoding = _response_encoding()
+    response = Response(compress_stream(body, encoding) if encoding else body, mimetype='application/json')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    if cache_key:
+        response.set_etag(_entity_tag(cache_key, encoding))
+    if cache_status:
+        response.headers['X-Cache'] = cache_status
+    return response
+
+def _request_stream(max_bytes: int) -> BinaryIO:
+    """Return the request body stream, decompressed if it has a Content-Encoding."""
+    encoding = request.headers.get('Content-Encoding', '').strip().lower()
+    if not encoding or encoding == 'identity':
+        return request.stream
+    # Bound the inflated size too, so a small compressed body cannot expand without limit
+    return open_decompressed(request.stream, encoding, max_bytes)
+
+def _parse_json_request(option_names: Tuple[str, ...] = REQUEST_OPTIONS
+                        ) -> Tuple[Iterable[Dict[str, Any]], Dict[str, Any]]:
+    """Read a JSON request body holding the documents and the options in option_names."""
+    if not request.is_json:
+        raise RequestError('Content-Type must be application/json')
+
+    try:
+        if request.headers.get('Content-Encoding'):
+            stream = _request_stream(current_app.config['MAX_CONTENT_LENGTH'])
+            data = json.loads(stream.read())
+        else:
+            data = request.get_json(force=True)
+    except (UnsupportedEncodingError, DecompressionLimitError, RequestEntityTooLarge):
+        raise
+    except Exception:
+        raise RequestError('Invalid JSON format')
+
+    if not isinstance(data, dict):
+        raise RequestError('Invalid request parameters')
+
+    documents = data.get('documents', [])
+    if not documents:
+        raise RequestError('No documents provided')
+
+    return documents, {option: data.get(option) for option in option_names}
+
+def _parse_ndjson_request() -> Tuple[Iterable[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Prepare an NDJSON request: one document per body line, options in the query string.
+
+    The body is parsed lazily while the pipeline runs, so bulk uploads are
+    processed as they arrive and never held in memory as a whole.
+    """
+    request.max_content_length = current_app.config['MAX_NDJSON_CONTENT_LENGTH']
+
+    options = {option: request.args.get(option) for option in REQUEST_OPTIONS}
+    if options['chunk_params'] is not None:
+        try:
+            options['chunk_params'] = json.loads(options['chunk_params'])
+        except ValueError:
+            raise RequestError('chunk_params must be valid JSON')
+
+    stream = _request_stream(current_app.config['MAX_NDJSON_CONTENT_LENGTH'])
+    documents = iter_ndjson_documents(stream, current_app.config['MAX_CONTENT_LENGTH'])
+    try:
+        first = next(documents, None)
+    except (zlib.error, OSError) as e:
+        raise RequestError(f'Invalid compressed request body: {str(e)}')
+    if first is None:
+        raise RequestError('No documents provided')
+
+    return itertools.chain([first], documents), options
+
+class _CacheWriter:
+    """Collects a streamed response body and stores it once the stream completes."""
+
+    def __init__(self, cache: ResultCache, key: str):
+        self.cache = cache
+        self.key = key
+        self._parts = []
+        self._size = 0
+        self._overflow = False
+
+    def add(self, piece: bytes) -> None:
+        if self._overflow:
+            return
+        self._size += len(piece)
+        if self._size > self.cache.max_entry_bytes:
+            # Too large to cache; stop holding on to the body
+            self._overflow = True
+            self._parts = []
+        else:
+            self._parts.append(piece)
+
+    def commit(self) -> None:
+        if self._overflow:
+            return
+        try:
+            self.cache.put(self.key, b''.join(self._parts))
+        except Exception:
+            logger.exception("Failed to store ingest result in cache")
+
+def _stream(first: bytes, output: Iterator[bytes], pipeline: Pipeline,
+            writer: Optional[_CacheWriter] = None) -> Iterator[bytes]:
+    """
+    Yield the already computed first piece, then the rest of the pipeline output.
+
+    Once the last piece was handed to the server, the pipeline is committed
+    (e.g. dedup records what the client received) and the body is cached.
+    """
+    completed = False
+    try:
+        for piece in itertools.chain([first], output):
+            if writer:
+                writer.add(piece)
+            yield piece
+        completed = True
+    except Exception:
+        # Headers are already sent; all we can do is log and cut the response short
+        logger.exception("Error while streaming ingest response")
+    finally:
+        output.close()
+
+    # Only complete responses are committed and cached
+    if completed:
+        try:
+            pipeline.commit()
+        except Exception:
+            logger.exception("Failed to commit ingest pipeline")
+        if writer:
+            writer.commit()
 
 @api_bp.route('/list-strategies', methods=['GET'])
 def list_strategies():
-    """List available indexing strategies."""
-    strategy_manager = StrategyManager()
-    available_strategies = strategy_manager.get_available_strategies()
+    """List available indexing and chunking strategies."""
+    available_strategies = get_components().pipeline_builder.get_available_strategies()
     return jsonify(available_strategies)
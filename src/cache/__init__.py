@@ -0,0 +1,6 @@
+"""Caching package initialization."""
+from .keys import request_cache_key
+from .result_cache import ResultCache
+from .seen_hashes import BloomFilter, SeenHashStore
+
+__all__ = ['request_cache_key', 'ResultCache', 'BloomFilter', 'SeenHashStore']
@@ -0,0 +1,53 @@
+import hashlib
+import json
+import os
+from typing import Iterable, Dict, Any, Optional
+
+def _canonical(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def request_cache_key(documents: Iterable[Dict[str, Any]],
+                      strategy_name: Optional[str],
+                      chunk_params: Any,
+                      namespace: Any = None) -> Optional[str]:
+    """
+    Return a canonical hash identifying an ingest request's result.
+
+    Documents are hashed one at a time in canonical JSON form (sorted keys),
+    so key order and whitespace in the request body do not matter. Documents
+    that point at a file are keyed by the file's size and modification time
+    as well; directory documents make a request uncacheable because their
+    contents cannot be fingerprinted cheaply.
+
+    Args:
+        documents: Request documents
+        strategy_name: Indexing or chunking strategy
+        chunk_params: Strategy parameters
+        namespace: Anything else the output depends on (e.g. pipeline configuration)
+
+    Returns:
+        Hex digest, or None if the request cannot be cached
+    """
+    hasher = hashlib.sha256()
+    hasher.update(_canonical({'strategy': strategy_name, 'chunk_params': chunk_params,
+                              'namespace': namespace}))
+
+    for doc in documents:
+        if not isinstance(doc, dict):
+            return None
+        metadata = doc.get('metadata') or {}
+        if doc.get('type') == 'directory' or metadata.get('directory_path'):
+            return None
+
+        hasher.update(b'\x1e')
+        hasher.update(_canonical(doc))
+
+        file_path = metadata.get('file_path')
+        if file_path:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                return None
+            hasher.update(_canonical([stat.st_size, stat.st_mtime_ns]))
+
+    return hasher.hexdigest()
@@ -0,0 +1,114 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+class ResultCache:
+    """Size-bounded LRU cache of serialized ingest responses with a TTL.
+
+    Entries live in a local SQLite database, so every worker process on the
+    host shares one cache. Each thread (and forked process) opens its own
+    connection.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float, max_bytes: int, max_entry_bytes: int):
+        """
+        Args:
+            path: SQLite database file, created if missing
+            ttl_seconds: Age after which an entry is no longer served
+            max_bytes: Total body size kept before least recently used entries are evicted
+            max_entry_bytes: Responses larger than this are never stored
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        if max_entry_bytes <= 0 or max_bytes < max_entry_bytes:
+            raise ValueError("max_bytes must be at least max_entry_bytes, which must be positive")
+
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY, body BLOB NOT NULL, size INTEGER NOT NULL,"
+                " created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body for key, or None if missing or expired."""
+        now = time.time()
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT body, created FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        body, created = row
+        if now - created > self.ttl_seconds:
+            connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            return None
+
+        connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        return bytes(body)
+
+    def put(self, key: str, body: bytes) -> bool:
+        """
+        Store a response body, evicting least recently used entries as needed.
+
+        Returns:
+            True if the body was stored, False if it exceeds max_entry_bytes
+        """
+        if len(body) > self.max_entry_bytes:
+            return False
+
+        now = time.time()
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, body, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, body, len(body), now, now)
+            )
+            connection.execute("DELETE FROM entries WHERE created < ?", (now - self.ttl_seconds,))
+            total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > self.max_bytes:
+                self._evict(connection, total - self.max_bytes)
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        return True
+
+    def _evict(self, connection: sqlite3.Connection, excess: int) -> None:
+        """Delete least recently used entries until at least excess bytes are freed."""
+        freed = 0
+        doomed = []
+        for key, size in connection.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            doomed.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        connection.executemany("DELETE FROM entries WHERE key = ?", doomed)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._connection().execute("DELETE FROM entries")
@@ -0,0 +1,189 @@
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import List, Sequence
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 16-byte (or longer) digests.
+
+    The k bit positions are derived from the digest itself by double hashing,
+    so no further hashing is done per lookup.
+    """
+
+    def __init__(self, num_bits: int, num_hashes: int):
+        if num_bits <= 0 or num_hashes <= 0:
+            raise ValueError("num_bits and num_hashes must be positive")
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self._bits = bytearray((num_bits + 7) // 8)
+
+    def _positions(self, digest: bytes):
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:16], 'little') | 1
+        for index in range(self.num_hashes):
+            yield (first + index * second) % self.num_bits
+
+    def add(self, digest: bytes) -> None:
+        for position in self._positions(digest):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, digest: bytes) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+class _ClientFilter:
+    """A client's Bloom filter and the store sequence number it is complete up to."""
+
+    __slots__ = ('bloom', 'seq')
+
+    def __init__(self, bloom: BloomFilter):
+        self.bloom = bloom
+        self.seq = 0
+
+class SeenHashStore:
+    """Per-client record of chunk hashes already emitted, shared by all workers.
+
+    The exact set lives in a local SQLite database. Each process keeps one
+    Bloom filter per recently active client in front of it (at most
+    max_clients filters of bloom_bits bits, so memory stays bounded: with the
+    default 32 clients of 1MB, 32MB per worker process). Every record() call
+    takes the client's next sequence number; before a lookup, a filter loads
+    the hashes recorded under newer numbers, by this or any other worker.
+    Hashes the filter has not seen are therefore new, and the hashes it has
+    seen are confirmed with one read per batch, so answers are always exact.
+
+    Lookups (check) never write. Callers record hashes once the chunks they
+    belong to have actually been delivered, so a response cut short does not
+    mark its undelivered chunks as seen.
+    """
+
+    # SQLite host parameters per statement stay well below the default limit
+    _MAX_PARAMS = 500
+
+    def __init__(self, path: str, bloom_bits: int, bloom_hashes: int, max_clients: int):
+        """
+        Args:
+            path: SQLite database file, created if missing
+            bloom_bits: Size of each client's Bloom filter in bits
+            bloom_hashes: Bit positions set per hash
+            max_clients: Filters kept in memory (least recently used are dropped)
+        """
+        if max_clients <= 0:
+            raise ValueError("max_clients must be positive")
+        self.path = path
+        self.bloom_bits = bloom_bits
+        self.bloom_hashes = bloom_hashes
+        self.max_clients = max_clients
+        self._filters: 'OrderedDict[str, _ClientFilter]' = OrderedDict()
+        self._filters_lock = threading.Lock()
+        self._local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS seen_hashes ("
+            " client_id TEXT NOT NULL, hash BLOB NOT NULL, seq INTEGER NOT NULL,"
+            " PRIMARY KEY (client_id, hash)) WITHOUT ROWID"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS seen_hashes_seq ON seen_hashes (client_id, seq)")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS seen_clients ("
+            " client_id TEXT PRIMARY KEY, seq INTEGER NOT NULL) WITHOUT ROWID"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _filter(self, connection: sqlite3.Connection, client_id: str) -> _ClientFilter:
+        """Return the client's filter, brought up to date with every recorded hash."""
+        with self._filters_lock:
+            client = self._filters.get(client_id)
+            if client is None:
+                client = _ClientFilter(BloomFilter(self.bloom_bits, self.bloom_hashes))
+                self._filters[client_id] = client
+            self._filters.move_to_end(client_id)
+            while len(self._filters) > self.max_clients:
+                self._filters.popitem(last=False)
+
+        row = connection.execute("SELECT seq FROM seen_clients WHERE client_id = ?", (client_id,)).fetchone()
+        latest = row[0] if row else 0
+        if latest > client.seq:
+            # Hashes recorded since the filter was last brought up to date
+            rows = connection.execute("SELECT hash FROM seen_hashes WHERE client_id = ? AND seq > ?",
+                                      (client_id, client.seq)).fetchall()
+            with self._filters_lock:
+                for (digest,) in rows:
+                    client.bloom.add(bytes(digest))
+                client.seq = max(client.seq, latest)
+        return client
+
+    def check(self, client_id: str, digests: Sequence[bytes]) -> List[bool]:
+        """
+        Report which digests were recorded for client_id, without recording them.
+
+        Args:
+            client_id: Client the hashes belong to
+            digests: Chunk hashes (at least 16 bytes each)
+
+        Returns:
+            One flag per digest: True if the client had already emitted it
+        """
+        connection = self._connection()
+        bloom = self._filter(connection, client_id).bloom
+        candidates = [digest for digest in digests if digest in bloom]
+        recorded = set()
+        for start in range(0, len(candidates), self._MAX_PARAMS):
+            part = candidates[start:start + self._MAX_PARAMS]
+            recorded.update(bytes(digest) for (digest,) in connection.execute(
+                "SELECT hash FROM seen_hashes WHERE client_id = ? AND hash IN (%s)" % ','.join('?' * len(part)),
+                (client_id, *part)))
+        return [digest in recorded for digest in digests]
+
+    def record(self, client_id: str, digests: Sequence[bytes]) -> None:
+        """
+        Record digests as emitted to client_id.
+
+        Args:
+            client_id: Client the hashes belong to
+            digests: Chunk hashes (at least 16 bytes each); ones already recorded are ignored
+        """
+        if not digests:
+            return
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute("SELECT seq FROM seen_clients WHERE client_id = ?", (client_id,)).fetchone()
+            seq = (row[0] if row else 0) + 1
+            connection.executemany("INSERT OR IGNORE INTO seen_hashes (client_id, hash, seq) VALUES (?, ?, ?)",
+                                   ((client_id, digest, seq) for digest in digests))
+            connection.execute("INSERT OR REPLACE INTO seen_clients (client_id, seq) VALUES (?, ?)",
+                               (client_id, seq))
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+        with self._filters_lock:
+            client = self._filters.get(client_id)
+            if client is not None:
+                for digest in digests:
+                    client.bloom.add(digest)
+                # Only if no other worker recorded in between is the filter complete up to seq
+                if client.seq == seq - 1:
+                    client.seq = seq
+
+    def clear(self, client_id: str) -> None:
+        """Forget every hash recorded for client_id."""
+        # The client's sequence number is kept, so other workers' filters stay consistent
+        self._connection().execute("DELETE FROM seen_hashes WHERE client_id = ?", (client_id,))
+        with self._filters_lock:
+            self._filters.pop(client_id, None)
@@ -1,5 +1,66 @@
+import hashlib
+import re
+import unicodedata
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple, Union
+from src.records import Chunk
+
+ConfigId = Union[int, str]
+
+_WHITESPACE = re.compile(r'\s+')
+
+def normalize_chunk_text(text: str) -> str:
+    """Return text NFKC-normalized, case-folded and with whitespace runs collapsed."""
+    return _WHITESPACE.sub(' ', unicodedata.normalize('NFKC', text).casefold()).strip()
+
+def document_identity(metadata: Dict[str, Any]) -> str:
+    """Return the identity chunk ids of a document are scoped to: 'document_id', else 'source'."""
+    identity = metadata.get('document_id', metadata.get('source'))
+    return '' if identity is None else str(identity)
+
+def make_chunk_id(metadata: Dict[str, Any], text: str) -> str:
+    """
+    Return the deterministic id of a chunk.
+
+    The id hashes the document identity and the chunk's normalized text, so
+    it does not depend on where the chunk sits in the document.
+
+    Args:
+        metadata: Metadata of the chunk (or its document, or the Chunk
+            record itself; only get() is used)
+        text: Chunk text
+
+    Returns:
+        32 hex characters
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(document_identity(metadata).encode('utf-8', 'surrogatepass'))
+    hasher.update(b'\0')
+    hasher.update(normalize_chunk_text(text).encode('utf-8', 'surrogatepass'))
+    return hasher.hexdigest()
+
+def iter_chunk_configs(param_sets: List[Dict[str, Any]]) -> Iterator[Tuple[ConfigId, Dict[str, Any]]]:
+    """
+    Pair each parameter set of a sweep with its configuration id.
+
+    A set may name itself with a 'config_id' key; otherwise its position in
+    the list is used. The key is removed from the parameters handed on.
+
+    Raises:
+        ValueError: If param_sets is empty, holds a non-dict or repeats an id
+    """
+    if not param_sets:
+        raise ValueError("chunk_params list must not be empty")
+    seen = set()
+    for index, params in enumerate(param_sets):
+        if not isinstance(params, dict):
+            raise ValueError("chunk_params list entries must be objects")
+        params = dict(params)
+        config_id = params.pop('config_id', index)
+        if config_id in seen:
+            raise ValueError(f"Duplicate chunk config_id: {config_id}")
+        seen.add(config_id)
+        yield config_id, params
 
 class BaseChunker(ABC):
     """Base interface for document chunking strategies."""
@@ -26,6 +87,96 @@ class BaseChunker(ABC):
         """
         pass
 
+    def chunk_records(self, content: str, metadata: Dict[str, Any],
+                      chunk_params: Optional[Dict[str, Any]] = None) -> List[Chunk]:
+        """
+        Chunk the document like chunk_document, returning Chunk records.
+
+        This is what the pipeline calls. The default wraps the dicts of
+        chunk_document; strategies that build records directly override it
+        (and derive chunk_document from it, so chunks of one document share
+        their metadata instead of each copying it).
+
+        Args:
+            content: The document content to chunk
+            metadata: Document metadata
+            chunk_params: Optional parameters to control chunking behavior
+
+        Returns:
+            List of chunk records
+        """
+        return [Chunk.from_dict(chunk) for chunk in self.chunk_document(content, metadata, chunk_params)]
+
+    def chunk_documents(self, documents: List[Tuple[str, Dict[str, Any]]],
+                        chunk_params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Chunk many documents with the same parameters.
+
+        Args:
+            documents: (content, metadata) pairs
+            chunk_params: Optional parameters to control chunking behavior
+
+        Returns:
+            The chunks of every document, in document order
+        """
+        return [chunk.to_dict() for chunk in self.chunk_record_batch(documents, chunk_params)]
+
+    def chunk_record_batch(self, documents: List[Tuple[str, Dict[str, Any]]],
+                           chunk_params: Optional[Dict[str, Any]] = None) -> List[Chunk]:
+        """
+        Chunk many documents with the same parameters, returning Chunk records.
+
+        Strategies with a fixed per-call cost should override this to share it
+        across the batch; the default simply chunks each document in turn.
+
+        Args:
+            documents: (content, metadata) pairs
+            chunk_params: Optional parameters to control chunking behavior
+
+        Returns:
+            The chunk records of every document, in document order
+        """
+        chunks = []
+        for content, metadata in documents:
+            chunks.extend(self.chunk_records(content, metadata, chunk_params))
+        return chunks
+
+    def chunk_variants(self, content: str, metadata: Dict[str, Any],
+                       param_sets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Chunk the document once per parameter set (a "param sweep").
+
+        Every chunk's metadata carries 'chunk_config_id' naming the parameter
+        set it came from.
+
+        Args:
+            content: The document content to chunk
+            metadata: Document metadata
+            param_sets: Parameter sets, each as accepted by chunk_document
+
+        Returns:
+            Chunks of every variant, grouped by parameter set
+
+        Raises:
+            ValueError: If param_sets or any set in it is invalid
+        """
+        return [chunk.to_dict() for chunk in self.chunk_variant_records(content, metadata, param_sets)]
+
+    def chunk_variant_records(self, content: str, metadata: Dict[str, Any],
+                              param_sets: List[Dict[str, Any]]) -> List[Chunk]:
+        """
+        Chunk the document once per parameter set, returning Chunk records.
+
+        Strategies that can share work between variants should override
+        this; the default simply chunks once per set. See chunk_variants.
+        """
+        chunks = []
+        for config_id, chunk_params in iter_chunk_configs(param_sets):
+            for chunk in self.chunk_records(content, metadata, chunk_params):
+                chunk.set('chunk_config_id', config_id)
+                chunks.append(chunk)
+        return chunks
+
     @abstractmethod
     def validate_params(self, chunk_params: Dict[str, Any]) -> None:
         """
@@ -0,0 +1,133 @@
+import hashlib
+from typing import List, Dict, Any, Optional
+from src.config import Config
+from src.records import Chunk
+from .sentence_chunker import SentenceChunker
+
+_HASH_RANGE = 1 << 64
+
+def sentence_fingerprint(sentence: str) -> int:
+    """Return a 64-bit hash of sentence, ignoring differences in whitespace."""
+    normalized = ' '.join(sentence.split()).encode('utf-8', 'surrogatepass')
+    return int.from_bytes(hashlib.blake2b(normalized, digest_size=8).digest(), 'little')
+
+class CDCChunker(SentenceChunker):
+    """Content-defined chunking: boundaries are picked by hashing sentences.
+
+    Sentences are segmented as in SentenceChunker, but instead of fixed
+    windows a chunk ends after a sentence whose fingerprint falls below a
+    cut threshold proportional to the sentence's length. Whether a sentence
+    ends a chunk thus depends on its own text, not on its position, so an
+    edit only moves the boundaries of the chunks around it and later chunks
+    come out unchanged.
+
+    As in FastCDC, sizes are bounded and normalized: no cut happens before
+    min_chunk_chars, the threshold is stricter below avg_chunk_chars and
+    looser above it (keeping sizes close to the average), and a chunk is
+    closed before a sentence that would take it past max_chunk_chars.
+    Sentences are never split, so a single sentence longer than
+    max_chunk_chars forms a chunk of its own. Chunks do not overlap.
+    """
+
+    @property
+    def strategy_name(self) -> str:
+        return "cdc_chunker"
+
+    def validate_params(self, chunk_params: Dict[str, Any]) -> None:
+        """
+        Validate chunking parameters.
+
+        Args:
+            chunk_params: Dictionary containing:
+                - min_sentence_length: Minimum length of a sentence to be considered
+                - min_chunk_chars: Size below which a chunk is never cut
+                - avg_chunk_chars: Target average chunk size
+                - max_chunk_chars: Size a chunk is closed before exceeding
+                - language, segmenter: As for sentence_chunker
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        if chunk_params:
+            self._validate_segmentation_params(chunk_params)
+
+            min_length = chunk_params.get('min_sentence_length', 0)
+            min_chars = chunk_params.get('min_chunk_chars', 0)
+            avg_chars = chunk_params.get('avg_chunk_chars', 0)
+            max_chars = chunk_params.get('max_chunk_chars', 0)
+
+            if min_length < 0:
+                raise ValueError("min_sentence_length must be non-negative")
+            if min_chars < 0:
+                raise ValueError("min_chunk_chars must be non-negative")
+            if not min_chars < avg_chars < max_chars:
+                raise ValueError("chunk sizes must satisfy min_chunk_chars < avg_chunk_chars < max_chunk_chars")
+
+    def _resolve_params(self, chunk_params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge chunk_params over the defaults and validate the result."""
+        params = {
+            'min_sentence_length': 0,
+            'min_chunk_chars': Config.CDC_MIN_CHUNK_CHARS,
+            'avg_chunk_chars': Config.CDC_AVG_CHUNK_CHARS,
+            'max_chunk_chars': Config.CDC_MAX_CHUNK_CHARS,
+            'language': 'english',
+            'segmenter': 'punkt'
+        }
+        if chunk_params:
+            params.update(chunk_params)
+
+        self.validate_params(params)
+        return params
+
+    @staticmethod
+    def cut_points(sentences: List[str], params: Dict[str, Any]) -> List[int]:
+        """
+        Return the index of the first sentence of every chunk.
+
+        Args:
+            sentences: Sentences of the document, in order
+            params: Resolved parameters with min/avg/max_chunk_chars
+
+        Returns:
+            Ascending sentence indices, starting with 0 (empty if no sentences)
+        """
+        min_chars = params['min_chunk_chars']
+        avg_chars = params['avg_chunk_chars']
+        max_chars = params['max_chunk_chars']
+        # Cut probability per character: half the base rate below the
+        # average size, twice the base rate above it
+        gap = avg_chars - min_chars
+        strict_rate = _HASH_RANGE // (2 * gap)
+        loose_rate = 2 * _HASH_RANGE // gap
+
+        starts = [0] if sentences else []
+        size = 0
+        for index, sentence in enumerate(sentences):
+            if size and size + 1 + len(sentence) > max_chars:
+                starts.append(index)
+                size = 0
+            size += len(sentence) + (1 if size else 0)
+            if size < min_chars or index + 1 == len(sentences):
+                continue
+            rate = strict_rate if size < avg_chars else loose_rate
+            if sentence_fingerprint(sentence) < len(sentence) * rate:
+                starts.append(index + 1)
+                size = 0
+        return starts
+
+    def _pack_sentences(self, content: str, sentences: List[str], base: Dict[str, Any],
+                        params: Dict[str, Any]) -> List[Chunk]:
+        """Group sentences into chunks ending at content-defined cut points."""
+        if not sentences:
+            return [Chunk(content, base)]
+
+        starts = self.cut_points(sentences, params)
+        chunks = []
+        for start, end in zip(starts, starts[1:] + [len(sentences)]):
+            chunk_sentences = sentences[start:end]
+            chunks.append(Chunk(' '.join(chunk_sentences), base, {
+                'chunk_index': len(chunks),
+                'sentences_count': len(chunk_sentences),
+                'start_sentence_index': start
+            }))
+        return chunks
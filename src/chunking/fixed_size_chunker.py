@@ -0,0 +1,195 @@
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+from src.config import Config
+from src.records import Chunk
+from .base import BaseChunker
+
+UNITS = ('chars', 'bytes')
+
+@lru_cache(maxsize=None)
+def _whitespace_table(unit: str) -> Any:
+    """Return a boolean lookup table of whitespace codes for the unit.
+
+    In 'bytes' mode only ASCII whitespace counts, since bytes of multi-byte
+    characters must never be taken for it. The last entry of the 'chars'
+    table is False and stands for every code beyond it.
+    """
+    import numpy as np
+    limit = 0x80 if unit == 'bytes' else 0x3001
+    table = np.zeros(256 if unit == 'bytes' else limit + 1, dtype=bool)
+    table[[code for code in range(limit) if chr(code).isspace()]] = True
+    return table
+
+def window_bounds(length: int, size: int, overlap: int) -> Tuple[Any, Any]:
+    """
+    Return the nominal (starts, ends) arrays of fixed-size windows over length units.
+
+    Windows advance by size - overlap; the last one ends at length, and no
+    window is added that would only repeat the previous window's overlap.
+    """
+    import numpy as np
+    stride = size - overlap
+    count = 1 if length <= size else -(-(length - overlap) // stride)
+    starts = np.arange(count, dtype=np.int64) * stride
+    ends = np.minimum(starts + size, length)
+    ends[-1] = length
+    return starts, ends
+
+def snap_to_whitespace(points: Any, codes: Any, table: Any, tolerance: int) -> Any:
+    """
+    Move each cut point to just after the nearest whitespace within tolerance.
+
+    The 2 * tolerance + 1 candidate cuts around every point, ordered by
+    distance, are gathered into one (points, candidates) matrix and
+    classified with a table lookup; the first hit in each row is the nearest
+    whitespace. All points are thus snapped at once and only their
+    neighbourhoods are read. Points without whitespace in reach stay put;
+    ties go to the earlier cut.
+    """
+    import numpy as np
+    if tolerance <= 0 or not len(points):
+        return points
+    # Offsets by distance: 0, -1, +1, -2, +2, ...
+    order = np.arange(2, 2 * tolerance + 2) // 2
+    order[::2] *= -1
+    order = np.concatenate(([0], order))
+    candidates = points[:, None] + order
+    # A cut at c follows whitespace if codes[c - 1] is whitespace
+    previous = codes[np.clip(candidates - 1, 0, len(codes) - 1)]
+    if len(table) < 256 ** previous.itemsize:
+        previous = np.minimum(previous, len(table) - 1)
+    follows_space = table[previous]
+    if points[0] - tolerance <= 0 or points[-1] + tolerance >= len(codes):
+        follows_space &= (candidates > 0) & (candidates < len(codes))
+    first = follows_space.argmax(axis=1)
+    rows = np.arange(len(points))
+    return np.where(follows_space[rows, first], candidates[rows, first], points)
+
+class FixedSizeChunker(BaseChunker):
+    """Splits text into fixed-size character or byte windows, optionally snapped to whitespace.
+
+    All window boundaries of a document are computed in bulk with NumPy: the
+    nominal cut points come from one arange, and snapping classifies the
+    neighbourhoods of all of them in one gathered matrix. Starts and
+    ends go through the same snapping, so without overlap the chunks tile
+    the text exactly. This ignores sentence structure and suits logs, CSV
+    dumps and other content where sentences don't matter.
+
+    In 'bytes' mode sizes count UTF-8 bytes; cut points that do not land on
+    whitespace are moved back to the nearest character boundary.
+    """
+
+    @property
+    def strategy_name(self) -> str:
+        return "fixed_size_chunker"
+
+    def validate_params(self, chunk_params: Dict[str, Any]) -> None:
+        """
+        Validate chunking parameters.
+
+        Args:
+            chunk_params: Dictionary containing:
+                - chunk_size: Window size in units
+                - chunk_overlap: Units shared by consecutive windows
+                - unit: 'chars' or 'bytes'
+                - snap_tolerance: How far a cut may move to reach whitespace
+                  (0 disables snapping; default Config.FIXED_CHUNK_SNAP_TOLERANCE,
+                  reduced to fit the window)
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        if chunk_params:
+            size = chunk_params.get('chunk_size', 0)
+            overlap = chunk_params.get('chunk_overlap', 0)
+            tolerance = chunk_params.get('snap_tolerance')
+
+            if chunk_params.get('unit', 'chars') not in UNITS:
+                raise ValueError(f"unit must be one of {list(UNITS)}")
+            if not isinstance(size, int) or size <= 0:
+                raise ValueError("chunk_size must be a positive integer")
+            if not isinstance(overlap, int) or overlap < 0 or overlap >= size:
+                raise ValueError("chunk_overlap must be non-negative and less than chunk_size")
+            if tolerance is not None and (not isinstance(tolerance, int) or tolerance < 0
+                                          or 2 * tolerance >= size - overlap):
+                raise ValueError("snap_tolerance must be non-negative and less than half of "
+                                 "chunk_size - chunk_overlap")
+
+    def chunk_document(self, content: str, metadata: Dict[str, Any],
+                      chunk_params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Chunk the document into fixed-size windows.
+
+        Args:
+            content: Document content to chunk
+            metadata: Document metadata
+            chunk_params: Optional parameters controlling chunking behavior
+
+        Returns:
+            List of chunks with their metadata; 'span' gives each chunk's
+            [start, end) offsets in the chosen unit
+        """
+        return [chunk.to_dict() for chunk in self.chunk_records(content, metadata, chunk_params)]
+
+    def chunk_records(self, content: str, metadata: Dict[str, Any],
+                      chunk_params: Optional[Dict[str, Any]] = None) -> List[Chunk]:
+        """Chunk the document like chunk_document, returning Chunk records sharing one metadata dict."""
+        params = {
+            'chunk_size': Config.DEFAULT_CHUNK_SIZE,
+            'chunk_overlap': Config.FIXED_CHUNK_OVERLAP,
+            'unit': 'chars',
+            'snap_tolerance': None
+        }
+        if chunk_params:
+            params.update(chunk_params)
+        self.validate_params(params)
+        if params['snap_tolerance'] is None:
+            # The configured default shrinks to fit small windows
+            stride = params['chunk_size'] - params['chunk_overlap']
+            params['snap_tolerance'] = min(Config.FIXED_CHUNK_SNAP_TOLERANCE, (stride - 1) // 2)
+
+        base = {**metadata, 'strategy': self.strategy_name}
+        if not content:
+            return [Chunk(content, base)]
+
+        if params['unit'] == 'bytes':
+            data = content.encode('utf-8', 'surrogatepass')
+            spans = self._bounds(data, 'bytes', params)
+            texts = [data[start:end].decode('utf-8', 'surrogatepass') for start, end in spans]
+        else:
+            spans = self._bounds(content, 'chars', params)
+            texts = [content[start:end] for start, end in spans]
+
+        return [Chunk(text, base, {'chunk_index': index, 'span': list(span)})
+                for index, (text, span) in enumerate(zip(texts, spans))]
+
+    @staticmethod
+    def _bounds(text, unit: str, params: Dict[str, Any]) -> List[Tuple[int, int]]:
+        """Return the snapped (start, end) windows of text, a str ('chars') or UTF-8 bytes ('bytes')."""
+        import numpy as np
+        if unit == 'bytes':
+            codes = np.frombuffer(text, dtype=np.uint8)
+        elif text.isascii():
+            codes = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        else:
+            codes = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+
+        starts, ends = window_bounds(len(codes), params['chunk_size'], params['chunk_overlap'])
+        tolerance = params['snap_tolerance']
+        if tolerance:
+            table = _whitespace_table(unit)
+            ends[:-1] = snap_to_whitespace(ends[:-1], codes, table, tolerance)
+            if params['chunk_overlap']:
+                starts[1:] = snap_to_whitespace(starts[1:], codes, table, tolerance)
+            else:
+                # Without overlap every start is the previous end
+                starts[1:] = ends[:-1]
+        if unit == 'bytes':
+            # Move cuts inside a multi-byte character back to where it starts
+            char_starts = np.append(np.flatnonzero((codes & 0xC0) != 0x80), len(codes))
+            starts = char_starts[np.searchsorted(char_starts, starts, side='right') - 1]
+            ends = char_starts[np.searchsorted(char_starts, ends, side='right') - 1]
+            # Windows smaller than one character collapse; drop them
+            keep = ends > starts
+            starts, ends = starts[keep], ends[keep]
+        return list(zip(starts.tolist(), ends.tolist()))
@@ -0,0 +1,110 @@
+from array import array
+from typing import List, Dict, Any, Optional, Tuple
+from src.records import Chunk
+from .base import make_chunk_id
+from .sentence_chunker import SentenceChunker
+
+Span = Tuple[int, int]
+
+class HierarchicalChunker(SentenceChunker):
+    """Produces parent chunks for context and child chunks for embedding from one sentence split.
+
+    Sentences are grouped into non-overlapping parents of up to
+    parent_max_sentences; each parent is then windowed into children of
+    max_sentences_per_chunk (overlapping by overlap_sentences) that never
+    cross a parent boundary. Both levels are sliced from the same sentence
+    offsets, so the document is tokenized once.
+
+    Every parent is emitted once, followed by its children. Chunks carry
+    'chunk_level' ('parent' or 'child') and their character 'span' in the
+    document; parents carry their 'chunk_id' and children the 'parent_id'
+    it equals (see make_chunk_id). A parent holding a single child that
+    covers all of it is emitted only as that child, whose parent_id is then
+    its own id.
+    """
+
+    @property
+    def strategy_name(self) -> str:
+        return "hierarchical_chunker"
+
+    def validate_params(self, chunk_params: Dict[str, Any]) -> None:
+        """
+        Validate chunking parameters.
+
+        Args:
+            chunk_params: Dictionary containing:
+                - parent_max_sentences: Sentences per parent chunk
+                - max_sentences_per_chunk, overlap_sentences: Child windows
+                - min_sentence_length, language, segmenter: As for sentence_chunker
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        super().validate_params(chunk_params)
+        if chunk_params:
+            parent_max = chunk_params.get('parent_max_sentences', 0)
+            if parent_max < chunk_params.get('max_sentences_per_chunk', 0):
+                raise ValueError("parent_max_sentences must be at least max_sentences_per_chunk")
+
+    def _resolve_params(self, chunk_params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge chunk_params over the defaults and validate the result."""
+        params = {
+            'min_sentence_length': 0,
+            'max_sentences_per_chunk': 3,
+            'overlap_sentences': 0,
+            'parent_max_sentences': 15,
+            'language': 'english',
+            'segmenter': 'punkt'
+        }
+        if chunk_params:
+            params.update(chunk_params)
+
+        self.validate_params(params)
+        return params
+
+    @staticmethod
+    def _slice_sentences(content: str, offsets: array, min_length: int) -> List[Span]:
+        """Return the spans of sentences at least min_length long (text is sliced per chunk)."""
+        return [(offsets[index], offsets[index + 1]) for index in range(0, len(offsets), 2)
+                if offsets[index + 1] - offsets[index] >= min_length]
+
+    def _pack_sentences(self, content: str, sentences: List[Span], base: Dict[str, Any],
+                        params: Dict[str, Any]) -> List[Chunk]:
+        """Group sentence spans into parents and the overlapping child windows inside each."""
+        if not sentences:
+            return [Chunk(content, base)]
+
+        chunks = []
+        parent_size = params['parent_max_sentences']
+        max_sentences = params['max_sentences_per_chunk']
+        stride = max_sentences - params['overlap_sentences']
+
+        for parent_start in range(0, len(sentences), parent_size):
+            parent_sentences = sentences[parent_start:parent_start + parent_size]
+            span = (parent_sentences[0][0], parent_sentences[-1][1])
+            parent_id = make_chunk_id(base, content[span[0]:span[1]])
+            if len(parent_sentences) > max_sentences:
+                chunks.append(self._chunk(content, span, base, {
+                    'chunk_level': 'parent',
+                    'chunk_index': len(chunks),
+                    'chunk_id': parent_id,
+                    'sentences_count': len(parent_sentences),
+                    'start_sentence_index': parent_start
+                }))
+
+            for offset in range(0, len(parent_sentences), stride):
+                child_sentences = parent_sentences[offset:offset + max_sentences]
+                chunks.append(self._chunk(content, (child_sentences[0][0], child_sentences[-1][1]), base, {
+                    'chunk_level': 'child',
+                    'chunk_index': len(chunks),
+                    'parent_id': parent_id,
+                    'sentences_count': len(child_sentences),
+                    'start_sentence_index': parent_start + offset
+                }))
+                if offset + max_sentences >= len(parent_sentences):
+                    break
+        return chunks
+
+    @staticmethod
+    def _chunk(content: str, span: Span, base: Dict[str, Any], fields: Dict[str, Any]) -> Chunk:
+        return Chunk(content[span[0]:span[1]], base, {'span': list(span), **fields})
@@ -0,0 +1,40 @@
+import re
+from typing import Dict, FrozenSet, Iterable, Optional
+
+# Frequent function words per punkt model name; enough to separate the
+# supported languages from a short prefix of running text
+STOPWORDS: Dict[str, FrozenSet[str]] = {
+    'english': frozenset('the and of to in is that it for was with as on are be this by not'.split()),
+    'german': frozenset('der die das und ist nicht ein eine zu den mit von sich auf für dem des im'.split()),
+    'french': frozenset('le la les et des est une un du que dans pour pas sur au qui avec ce'.split()),
+    'spanish': frozenset('el la los las y de que en es por con para una del se no al lo'.split()),
+    'italian': frozenset('il lo la gli le di che è e per non un una del della sono con nel'.split()),
+    'portuguese': frozenset('o os a as e de que em é um uma do da não para com se no na'.split()),
+}
+
+_WORD_PATTERN = re.compile(r'[^\W\d_]+')
+
+def detect_language(text: str, languages: Optional[Iterable[str]] = None,
+                    sample_chars: int = 2000, default: str = 'english') -> str:
+    """
+    Guess the language of text from stopword counts in a prefix sample.
+
+    Args:
+        text: Text to classify; only the first sample_chars characters are read
+        languages: Candidate languages (default: every language in STOPWORDS)
+        sample_chars: Length of the prefix sample
+        default: Language returned when no candidate's stopwords occur
+
+    Returns:
+        The candidate language whose stopwords occur most often in the sample
+    """
+    candidates = [lang for lang in (languages or STOPWORDS) if lang in STOPWORDS]
+    scores = dict.fromkeys(candidates, 0)
+    for word in _WORD_PATTERN.findall(text[:sample_chars].lower()):
+        for language in candidates:
+            if word in STOPWORDS[language]:
+                scores[language] += 1
+    best = max(candidates, key=scores.__getitem__, default=None)
+    if best is None or scores[best] == 0:
+        return default
+    return best
@@ -1,6 +1,10 @@
 from typing import Dict, Type, List, Any, Optional
 from .base import BaseChunker
 from .sentence_chunker import SentenceChunker
+from .cdc_chunker import CDCChunker
+from .structure_chunker import StructureChunker
+from .hierarchical_chunker import HierarchicalChunker
+from .fixed_size_chunker import FixedSizeChunker
 
 class ChunkerManager:
     """Manages document chunking strategies and their execution."""
@@ -8,12 +12,17 @@ class ChunkerManager:
     def __init__(self):
         """Initialize the chunker manager with default strategies."""
         self._strategies: Dict[str, Type[BaseChunker]] = {}
+        self._instances: Dict[str, BaseChunker] = {}
         # Register default chunking strategies
         self._register_default_strategies()
 
     def _register_default_strategies(self) -> None:
         """Register all default chunking strategies."""
         self.register_strategy(SentenceChunker)
+        self.register_strategy(CDCChunker)
+        self.register_strategy(StructureChunker)
+        self.register_strategy(HierarchicalChunker)
+        self.register_strategy(FixedSizeChunker)
 
     def register_strategy(self, strategy_class: Type[BaseChunker]) -> None:
         """
@@ -22,10 +31,11 @@ class ChunkerManager:
         Args:
             strategy_class: The chunking strategy class to register
         """
-        # Create an instance to get the strategy name
+        # Create an instance to get the strategy name and keep it for reuse;
+        # chunkers hold no per-call state, so one instance serves all requests
         strategy = strategy_class()
-        # Store the class, not the instance
         self._strategies[strategy.strategy_name] = strategy_class
+        self._instances[strategy.strategy_name] = strategy
 
     def get_strategy(self, strategy_name: str) -> BaseChunker:
         """
@@ -35,7 +45,7 @@ class ChunkerManager:
             strategy_name: Name of the strategy to retrieve
 
         Returns:
-            An instance of the requested chunking strategy
+            The shared instance of the requested chunking strategy
 
         Raises:
             ValueError: If strategy_name is not registered
@@ -43,7 +53,7 @@ class ChunkerManager:
         if strategy_name not in self._strategies:
             available = list(self._strategies.keys())
             raise ValueError(f"Unknown strategy: {strategy_name}. Available strategies: {available}")
-        return self._strategies[strategy_name]()
+        return self._instances[strategy_name]
 
     def get_available_strategies(self) -> List[str]:
         """Return list of available chunking strategies."""
@@ -0,0 +1,92 @@
+import re
+from array import array
+from typing import Dict, List, Optional
+from src.utils.process_pool import get_process_pool
+from .segmenters import BaseSegmenter, PunktSegmenter, RegexSegmenter
+from .sentence_cache import shared_model_pool, spans_to_offsets
+
+# Segmenters a worker process can rebuild by name
+PARALLEL_SEGMENTERS = ('punkt', 'regex')
+
+_PARAGRAPH_BREAK = re.compile(r'\n[ \t]*\n')
+
+# Per-process segmenters used by _segment_offsets, built on first use in each worker
+_worker_segmenters: Dict[str, BaseSegmenter] = {}
+
+def _segment_offsets(segmenter_name: str, language: str, text: str, base: int) -> array:
+    """Worker: segment one piece of a document, returning offsets shifted by base."""
+    if not _worker_segmenters:
+        for segmenter in (PunktSegmenter(shared_model_pool().get), RegexSegmenter()):
+            _worker_segmenters[segmenter.segmenter_name] = segmenter
+    spans = _worker_segmenters[segmenter_name].span_tokenize(text, language)
+    return spans_to_offsets((base + start, base + end) for start, end in spans)
+
+def split_points(text: str, segment_chars: int) -> List[int]:
+    """
+    Return cut offsets splitting text into pieces of about segment_chars.
+
+    Each cut falls just after the first blank line at or beyond the target
+    size, so no piece boundary lands inside a paragraph.
+
+    Returns:
+        Sorted offsets starting with 0 and ending with len(text)
+    """
+    cuts = [0]
+    position = segment_chars
+    while position < len(text):
+        match = _PARAGRAPH_BREAK.search(text, position)
+        if match is None:
+            break
+        cuts.append(match.end())
+        position = match.end() + segment_chars
+    if cuts[-1] != len(text):
+        cuts.append(len(text))
+    return cuts
+
+def parallel_sentence_offsets(text: str, segmenter: BaseSegmenter, language: str,
+                              segment_chars: int, max_workers: int) -> Optional[array]:
+    """
+    Segment a long document in the shared 'sentences' process pool.
+
+    The text is cut at blank lines into pieces of about segment_chars, each
+    piece is segmented in a worker, and the results are stitched in order.
+    At each seam the last sentence of one piece and the first of the next
+    are re-segmented together in this process, so boundaries match what a
+    serial run over the whole text would produce.
+
+    Args:
+        text: Document text
+        segmenter: Segmenter used for the seams; workers rebuild it by name,
+            so it must be one of PARALLEL_SEGMENTERS
+        language: Language of the text
+        segment_chars: Target piece size
+        max_workers: Size of the process pool
+
+    Returns:
+        Flat [start, end, ...] offsets, or None if text has too few blank
+        lines to split and should be segmented serially
+    """
+    cuts = split_points(text, segment_chars)
+    if len(cuts) <= 2:
+        return None
+
+    pool = get_process_pool('sentences', max_workers)
+    futures = [pool.submit(_segment_offsets, segmenter.segmenter_name, language, text[start:end], start)
+               for start, end in zip(cuts, cuts[1:])]
+
+    stitched = array('q')
+    for future in futures:
+        offsets = future.result()
+        if not offsets:
+            continue
+        if stitched:
+            # Re-segment from the start of the previous piece's last sentence
+            # to the end of this piece's first sentence
+            seam_start, seam_end = stitched[-2], offsets[1]
+            del stitched[-2:]
+            for start, end in segmenter.span_tokenize(text[seam_start:seam_end], language):
+                stitched.append(seam_start + start)
+                stitched.append(seam_start + end)
+            offsets = offsets[2:]
+        stitched.extend(offsets)
+    return stitched
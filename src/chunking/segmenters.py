@@ -0,0 +1,128 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Callable, FrozenSet, Iterable, Iterator, Optional, Tuple
+
+Span = Tuple[int, int]
+
+class BaseSegmenter(ABC):
+    """Base interface for sentence segmentation backends.
+
+    Segmenters return (start, end) offsets into the text instead of sentence
+    copies; callers slice only the sentences they keep.
+    """
+
+    @property
+    @abstractmethod
+    def segmenter_name(self) -> str:
+        """Return the name the segmenter is selected by."""
+        pass
+
+    @abstractmethod
+    def span_tokenize(self, text: str, language: str = 'english') -> Iterator[Span]:
+        """
+        Yield the (start, end) offsets of each sentence in text.
+
+        Args:
+            text: Text to segment
+            language: Language of the text
+
+        Returns:
+            Iterator of sentence spans in text order
+        """
+        pass
+
+def load_punkt_model(language: str) -> Any:
+    """Load NLTK's punkt sentence tokenizer for language."""
+    from nltk.tokenize import PunktTokenizer
+    return PunktTokenizer(language)
+
+class PunktSegmenter(BaseSegmenter):
+    """Segments with NLTK's punkt models (accurate, trained per language)."""
+
+    def __init__(self, get_tokenizer: Callable[[str], Any]):
+        """
+        Args:
+            get_tokenizer: Returns the loaded punkt tokenizer for a language
+        """
+        self.get_tokenizer = get_tokenizer
+
+    @property
+    def segmenter_name(self) -> str:
+        return "punkt"
+
+    def span_tokenize(self, text: str, language: str = 'english') -> Iterator[Span]:
+        return self.get_tokenizer(language).span_tokenize(text)
+
+# Lowercased abbreviations, without their final period, that do not end a sentence
+DEFAULT_ABBREVIATIONS: FrozenSet[str] = frozenset("""
+    mr mrs ms dr prof sr sra jr st mt vs etc e.g i.e cf al approx dept est inc ltd co corp
+    no nos fig figs vol p pp ch sec eq ref jan feb mar apr jun jul aug sep sept oct nov dec
+    mon tue wed thu fri sat sun u.s u.k a.m p.m ph.d
+    z.b bzw usw ca nr s u.a d.h vgl
+    mme mlle p.ex cie
+    ud uds pág núm
+    sig dott ecc
+""".split())
+
+class RegexSegmenter(BaseSegmenter):
+    """Rule-based segmenter: one precompiled regex scanned once over the text.
+
+    A sentence ends at terminal punctuation (plus closing quotes or brackets)
+    followed by whitespace, unless the period ends a known abbreviation or an
+    initial, or the next word starts in lowercase. Blank lines always end a
+    sentence. Much faster than punkt, at the cost of missing boundaries that
+    need trained statistics (e.g. abbreviations not in the list).
+    """
+
+    _BOUNDARY = re.compile(r'[.!?…]+["\'”’)\]]*(?=\s)|\n[ \t]*\n')
+    _SPACE = re.compile(r'\s+')
+
+    def __init__(self, abbreviations: Optional[Iterable[str]] = None):
+        """
+        Args:
+            abbreviations: Lowercased abbreviations without their final period
+                (default: DEFAULT_ABBREVIATIONS)
+        """
+        self.abbreviations = frozenset(abbreviations) if abbreviations is not None else DEFAULT_ABBREVIATIONS
+
+    @property
+    def segmenter_name(self) -> str:
+        return "regex"
+
+    def span_tokenize(self, text: str, language: str = 'english') -> Iterator[Span]:
+        start = self._skip_space(text, 0)
+        for match in self._BOUNDARY.finditer(text):
+            end = match.end()
+            if match.group()[0] != '\n':
+                if not self._is_sentence_end(text, match.start(), end):
+                    continue
+            else:
+                end = match.start()
+            if end > start:
+                span_end = end
+                while span_end > start and text[span_end - 1].isspace():
+                    span_end -= 1
+                if span_end > start:
+                    yield start, span_end
+            start = self._skip_space(text, match.end())
+        end = len(text)
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if end > start:
+            yield start, end
+
+    def _is_sentence_end(self, text: str, punct_start: int, punct_end: int) -> bool:
+        if text[punct_start] == '.' and text[punct_start:punct_end].rstrip('"\'”’)]') == '.':
+            word_start = punct_start
+            while word_start > 0 and not text[word_start - 1].isspace():
+                word_start -= 1
+            word = text[word_start:punct_start].lstrip('"\'“‘([').lower()
+            # Initials ("J. Smith") and listed abbreviations ("Dr. Smith")
+            if len(word) == 1 and word.isalpha() or word in self.abbreviations:
+                return False
+        next_start = self._skip_space(text, punct_end)
+        return next_start >= len(text) or not text[next_start].islower()
+
+    def _skip_space(self, text: str, position: int) -> int:
+        match = self._SPACE.match(text, position)
+        return match.end() if match else position
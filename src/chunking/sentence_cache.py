@@ -0,0 +1,137 @@
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Tuple
+from src.config import Config
+from .segmenters import load_punkt_model
+
+def content_digest(content: str) -> bytes:
+    """Return a fixed-size digest identifying a document's text."""
+    return hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+def spans_to_offsets(spans: Iterable[Tuple[int, int]]) -> array:
+    """Pack (start, end) sentence spans into one flat array of offsets."""
+    offsets = array('q')
+    for start, end in spans:
+        offsets.append(start)
+        offsets.append(end)
+    return offsets
+
+class SentenceBoundaryCache:
+    """Thread-safe LRU cache of sentence boundary offsets.
+
+    Boundaries are stored as flat offset arrays ([start0, end0, start1, ...])
+    rather than sentence strings, so an entry costs 16 bytes per sentence and
+    never pins a copy of the document text. The cache is bounded by the total
+    number of offsets it holds.
+    """
+
+    def __init__(self, max_offsets: int):
+        if max_offsets <= 0:
+            raise ValueError("max_offsets must be positive")
+        self.max_offsets = max_offsets
+        self._entries: 'OrderedDict[Hashable, array]' = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[array]:
+        """Return the cached offsets for key, marking them most recently used."""
+        with self._lock:
+            offsets = self._entries.get(key)
+            if offsets is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return offsets
+
+    def put(self, key: Hashable, offsets: array) -> None:
+        """Store offsets for key, evicting least recently used entries beyond max_offsets."""
+        if len(offsets) > self.max_offsets:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = offsets
+            self._size += len(offsets)
+            while self._size > self.max_offsets:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+class SentenceModelPool:
+    """Thread-safe LRU pool of loaded sentence models, keyed by language.
+
+    Models are loaded once with loader(language) and kept until more than
+    max_models languages are in use, so multilingual batches switch between
+    resident models instead of reloading them.
+    """
+
+    def __init__(self, loader: Callable[[str], Any], max_models: int):
+        if max_models <= 0:
+            raise ValueError("max_models must be positive")
+        self.loader = loader
+        self.max_models = max_models
+        self._models: 'OrderedDict[str, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self.loads = 0
+
+    def get(self, language: str) -> Any:
+        """Return the model for language, loading it on first use."""
+        with self._lock:
+            model = self._models.get(language)
+            if model is not None:
+                self._models.move_to_end(language)
+                return model
+        # Load outside the pool lock so other languages stay available meanwhile
+        with self._load_lock:
+            with self._lock:
+                model = self._models.get(language)
+            if model is None:
+                model = self.loader(language)
+                self.loads += 1
+            with self._lock:
+                self._models[language] = model
+                self._models.move_to_end(language)
+                while len(self._models) > self.max_models:
+                    self._models.popitem(last=False)
+            return model
+
+    def loaded_languages(self) -> List[str]:
+        """Return the resident languages, least recently used first."""
+        with self._lock:
+            return list(self._models)
+
+# Process-wide instances shared by every sentence-based chunker, created on first use
+_shared_lock = threading.Lock()
+_shared_models: Optional[SentenceModelPool] = None
+_shared_boundary_cache: Optional[SentenceBoundaryCache] = None
+
+def shared_model_pool() -> SentenceModelPool:
+    """Return the punkt model pool of this process (Config.SENTENCE_MODEL_POOL_SIZE models)."""
+    global _shared_models
+    with _shared_lock:
+        if _shared_models is None:
+            _shared_models = SentenceModelPool(load_punkt_model, Config.SENTENCE_MODEL_POOL_SIZE)
+        return _shared_models
+
+def shared_boundary_cache() -> SentenceBoundaryCache:
+    """Return the sentence boundary cache of this process (Config.SENTENCE_CACHE_MAX_OFFSETS offsets)."""
+    global _shared_boundary_cache
+    with _shared_lock:
+        if _shared_boundary_cache is None:
+            _shared_boundary_cache = SentenceBoundaryCache(Config.SENTENCE_CACHE_MAX_OFFSETS)
+        return _shared_boundary_cache
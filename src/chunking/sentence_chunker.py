@@ -1,19 +1,127 @@
-from typing import List, Dict, Any, Optional
-import nltk
-from nltk.tokenize import sent_tokenize
-from .base import BaseChunker
+import logging
+import re
+import threading
+from array import array
+from typing import List, Dict, Any, Optional, Tuple
+from src.config import Config
+from src.records import Chunk
+from .base import BaseChunker, iter_chunk_configs
+from .language import detect_language
+from .parallel_segmentation import PARALLEL_SEGMENTERS, parallel_sentence_offsets
+from .segmenters import BaseSegmenter, PunktSegmenter, RegexSegmenter
+from .sentence_cache import (SentenceBoundaryCache, content_digest, shared_boundary_cache,
+                             shared_model_pool, spans_to_offsets)
 
-class SentenceChunker(BaseChunker):
-    """Implements sentence-based document chunking with configurable parameters."""
+logger = logging.getLogger(__name__)
+
+# Punkt model names are plain words; anything else could escape the model directory
+_LANGUAGE_PATTERN = re.compile(r'^[a-z_]+$')
 
-    def __init__(self):
-        """Initialize the sentence chunker and download required NLTK data."""
+class UnsupportedLanguageError(ValueError):
+    """Raised when no punkt model is installed for the requested language."""
+
+# The NLTK punkt download runs once per process, whichever chunker needs it first
+_nltk_ready = False
+_nltk_lock = threading.Lock()
+
+def _download_punkt() -> None:
+    global _nltk_ready
+    if _nltk_ready:
+        return
+    with _nltk_lock:
+        if _nltk_ready:
+            return
         try:
+            import nltk
             # Download both required NLTK resources
             nltk.download('punkt', quiet=True)
             nltk.download('punkt_tab', quiet=True)
         except Exception as e:
             raise RuntimeError(f"Failed to download NLTK resources: {str(e)}")
+        _nltk_ready = True
+
+class SentenceChunker(BaseChunker):
+    """Implements sentence-based document chunking with configurable parameters."""
+
+    AUTO_LANGUAGE = 'auto'
+
+    def __init__(self, boundary_cache: Optional[SentenceBoundaryCache] = None,
+                 languages: Optional[List[str]] = None):
+        """
+        Initialize the sentence chunker; NLTK is loaded on first use.
+
+        Args:
+            boundary_cache: Cache of sentence offsets shared across calls
+                (default: the process-wide cache shared by all sentence-based
+                chunkers, see shared_boundary_cache)
+            languages: Languages preloaded by load_resources and detected by
+                language='auto' (default: Config.SENTENCE_LANGUAGES)
+        """
+        self._resources_ready = False
+        self._resources_lock = threading.Lock()
+        self.languages = list(languages or Config.SENTENCE_LANGUAGES)
+        # Punkt models are shared with every other sentence-based chunker
+        self.models = shared_model_pool()
+        self.segmenters: Dict[str, BaseSegmenter] = {}
+        self.register_segmenter(PunktSegmenter(self._get_tokenizer))
+        self.register_segmenter(RegexSegmenter())
+        self.boundary_cache = shared_boundary_cache() if boundary_cache is None else boundary_cache
+        self.parallel_min_chars = Config.SENTENCE_PARALLEL_MIN_CHARS
+        self.parallel_segment_chars = Config.SENTENCE_PARALLEL_SEGMENT_CHARS
+        self.parallel_workers = Config.SENTENCE_PARALLEL_WORKERS
+
+    def load_resources(self) -> None:
+        """Download the punkt models (once per process) and load this chunker's languages, once per instance."""
+        if self._resources_ready:
+            return
+        with self._resources_lock:
+            if self._resources_ready:
+                return
+            _download_punkt()
+            self._resources_ready = True
+        for language in self.languages[:self.models.max_models]:
+            try:
+                self.models.get(language)
+            except LookupError:
+                logger.warning("Punkt model for %s is not installed", language)
+
+    def register_segmenter(self, segmenter: BaseSegmenter) -> None:
+        """Register a sentence segmentation backend selectable by the 'segmenter' parameter."""
+        self.segmenters[segmenter.segmenter_name] = segmenter
+
+    def sentence_offsets(self, content: str, language: str = 'english',
+                         segmenter: str = 'punkt') -> array:
+        """
+        Return sentence boundaries of content as a flat [start, end, ...] offset array.
+
+        Boundaries are cached by content hash, language and segmenter, so
+        re-chunking the same text with different packing parameters skips
+        tokenization. Documents of at least parallel_min_chars characters are
+        segmented in parallel (see parallel_sentence_offsets).
+        """
+        key = (segmenter, language, content_digest(content))
+        offsets = self.boundary_cache.get(key)
+        if offsets is None:
+            backend = self.segmenters[segmenter]
+            if len(content) >= self.parallel_min_chars and segmenter in PARALLEL_SEGMENTERS:
+                offsets = parallel_sentence_offsets(content, backend, language,
+                                                    self.parallel_segment_chars, self.parallel_workers)
+            if offsets is None:
+                offsets = spans_to_offsets(backend.span_tokenize(content, language))
+            self.boundary_cache.put(key, offsets)
+        return offsets
+
+    def resolve_language(self, content: str, language: str) -> str:
+        """Return language, or the language detected from content when it is 'auto'."""
+        if language != self.AUTO_LANGUAGE:
+            return language
+        return detect_language(content, self.languages, Config.SENTENCE_DETECT_SAMPLE_CHARS,
+                               default=self.languages[0])
+
+    def _get_tokenizer(self, language: str):
+        """Return the punkt sentence tokenizer for language from the model pool."""
+        self.load_resources()
+        return self.models.get(language)
 
     @property
     def strategy_name(self) -> str:
@@ -28,12 +136,17 @@ class SentenceChunker(BaseChunker):
                 - min_sentence_length: Minimum length of a sentence to be considered
                 - max_sentences_per_chunk: Maximum number of sentences per chunk
                 - overlap_sentences: Number of sentences to overlap between chunks
-                - language: Language code for sentence detection (default: 'english')
+                - language: Punkt model name for sentence detection, or 'auto'
+                  to detect it from the start of each document (default: 'english')
+                - segmenter: Sentence segmentation backend, 'punkt' (accurate)
+                  or 'regex' (fast, rule-based) (default: 'punkt')
 
         Raises:
             ValueError: If parameters are invalid
         """
         if chunk_params:
+            self._validate_segmentation_params(chunk_params)
+
             min_length = chunk_params.get('min_sentence_length', 0)
             max_sentences = chunk_params.get('max_sentences_per_chunk', 0)
             overlap = chunk_params.get('overlap_sentences', 0)
@@ -47,6 +160,20 @@ class SentenceChunker(BaseChunker):
             if overlap >= max_sentences:
                 raise ValueError("overlap_sentences must be less than max_sentences_per_chunk")
 
+    def _validate_segmentation_params(self, chunk_params: Dict[str, Any]) -> None:
+        """Validate the 'language' and 'segmenter' parameters."""
+        language = chunk_params.get('language', 'english')
+        if not isinstance(language, str) or not _LANGUAGE_PATTERN.match(language):
+            raise ValueError(f"Invalid language: {language!r}")
+        segmenter = chunk_params.get('segmenter', 'punkt')
+        if segmenter not in self.segmenters:
+            raise ValueError(f"Unknown segmenter: {segmenter}. Available: {list(self.segmenters)}")
+        if segmenter == 'punkt' and language != self.AUTO_LANGUAGE:
+            try:
+                self._get_tokenizer(language)
+            except LookupError:
+                raise UnsupportedLanguageError(f"unsupported language {language!r}") from None
+
     def chunk_document(self, content: str, metadata: Dict[str, Any],
                       chunk_params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
@@ -60,33 +187,124 @@ class SentenceChunker(BaseChunker):
         Returns:
             List of chunks with their metadata
         """
+        return [chunk.to_dict() for chunk in self.chunk_records(content, metadata, chunk_params)]
+
+    def chunk_records(self, content: str, metadata: Dict[str, Any],
+                      chunk_params: Optional[Dict[str, Any]] = None) -> List[Chunk]:
+        """Chunk the document like chunk_document, returning Chunk records sharing one metadata dict."""
+        params = self._resolve_params(chunk_params)
+        metadata = self._resolve_language_param(content, metadata, params)
+        sentences = self._split_sentences(content, params)
+        return self._pack_sentences(content, sentences, self._chunk_base(metadata), params)
+
+    def chunk_record_batch(self, documents: List[Tuple[str, Dict[str, Any]]],
+                           chunk_params: Optional[Dict[str, Any]] = None) -> List[Chunk]:
+        """
+        Chunk many documents with the same parameters, returning Chunk records.
+
+        Parameters are resolved and validated once for the whole batch rather
+        than once per document; each document is then segmented (through the
+        boundary cache) and windowed on its own.
+
+        Args:
+            documents: (content, metadata) pairs
+            chunk_params: Optional parameters controlling chunking behavior
+
+        Returns:
+            The chunk records of every document, in document order
+        """
+        params = self._resolve_params(chunk_params)
+        segmenter = params['segmenter']
+        min_length = params['min_sentence_length']
+        chunks = []
+        for content, metadata in documents:
+            language = params['language']
+            if language == self.AUTO_LANGUAGE:
+                language = self.resolve_language(content, language)
+                metadata = {**metadata, 'language': language}
+            try:
+                offsets = self.sentence_offsets(content, language, segmenter)
+            except Exception as e:
+                raise RuntimeError(f"Failed to perform sentence tokenization: {str(e)}")
+            sentences = self._slice_sentences(content, offsets, min_length)
+            chunks.extend(self._pack_sentences(content, sentences, self._chunk_base(metadata), params))
+        return chunks
+
+    def chunk_variant_records(self, content: str, metadata: Dict[str, Any],
+                              param_sets: List[Dict[str, Any]]) -> List[Chunk]:
+        """
+        Chunk the document once per parameter set, splitting sentences only once.
+
+        Variants sharing a segmenter, language and minimum sentence length are
+        packed from the same sentence list; see BaseChunker.chunk_variants.
+        """
+        configs = [(config_id, self._resolve_params(chunk_params))
+                   for config_id, chunk_params in iter_chunk_configs(param_sets)]
+        sentence_lists = {}
+        chunks = []
+        for config_id, params in configs:
+            variant_metadata = self._resolve_language_param(content, metadata, params)
+            key = (params['segmenter'], params['language'], params['min_sentence_length'])
+            if key not in sentence_lists:
+                sentence_lists[key] = self._split_sentences(content, params)
+            base = {**self._chunk_base(variant_metadata), 'chunk_config_id': config_id}
+            chunks.extend(self._pack_sentences(content, sentence_lists[key], base, params))
+        return chunks
+
+    def _resolve_params(self, chunk_params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge chunk_params over the defaults and validate the result."""
         # Set default parameters if not provided
         params = {
             'min_sentence_length': 10,
             'max_sentences_per_chunk': 5,
             'overlap_sentences': 1,
-            'language': 'english'
+            'language': 'english',
+            'segmenter': 'punkt'
         }
         if chunk_params:
             params.update(chunk_params)
 
         # Validate parameters
         self.validate_params(params)
+        return params
+
+    def _resolve_language_param(self, content: str, metadata: Dict[str, Any],
+                                params: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace language='auto' in params with the detected language, recording it in metadata."""
+        if params['language'] != self.AUTO_LANGUAGE:
+            return metadata
+        params['language'] = self.resolve_language(content, params['language'])
+        return {**metadata, 'language': params['language']}
 
-        # Tokenize content into sentences using punkt tokenizer
+    def _split_sentences(self, content: str, params: Dict[str, Any]) -> List[str]:
+        """Return the sentences of content at least min_sentence_length long."""
+        # Tokenize content into sentence offsets with the selected segmenter (cached)
         try:
-            sentences = nltk.sent_tokenize(content)
+            offsets = self.sentence_offsets(content, params['language'], params['segmenter'])
         except Exception as e:
             raise RuntimeError(f"Failed to perform sentence tokenization: {str(e)}")
 
-        # Filter out short sentences
-        sentences = [s for s in sentences if len(s) >= params['min_sentence_length']]
+        return self._slice_sentences(content, offsets, params['min_sentence_length'])
+
+    @staticmethod
+    def _slice_sentences(content: str, offsets: array, min_length: int) -> List[str]:
+        """Slice out the sentences given by offsets, filtering out short ones."""
+        sentences = []
+        for index in range(0, len(offsets), 2):
+            start, end = offsets[index], offsets[index + 1]
+            if end - start >= min_length:
+                sentences.append(content[start:end])
+        return sentences
+
+    def _chunk_base(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the metadata shared by every chunk of a document."""
+        return {**metadata, 'strategy': self.strategy_name}
 
+    def _pack_sentences(self, content: str, sentences: List[str], base: Dict[str, Any],
+                        params: Dict[str, Any]) -> List[Chunk]:
+        """Group sentences into overlapping chunks of max_sentences_per_chunk."""
         if not sentences:
-            return [{
-                'content': content,
-                'metadata': {**metadata, 'strategy': self.strategy_name}
-            }]
+            return [Chunk(content, base)]
 
         chunks = []
         max_sentences = params['max_sentences_per_chunk']
@@ -96,17 +314,10 @@ class SentenceChunker(BaseChunker):
         for i in range(0, len(sentences), max_sentences - overlap):
             chunk_sentences = sentences[i:i + max_sentences]
             if chunk_sentences:
-                chunk_content = ' '.join(chunk_sentences)
-                chunk_metadata = {
-                    **metadata,
-                    'strategy': self.strategy_name,
+                chunks.append(Chunk(' '.join(chunk_sentences), base, {
                     'chunk_index': len(chunks),
                     'sentences_count': len(chunk_sentences),
                     'start_sentence_index': i
-                }
-                chunks.append({
-                    'content': chunk_content,
-                    'metadata': chunk_metadata
-                })
+                }))
 
         return chunks
@@ -0,0 +1,217 @@
+import re
+from typing import List, Dict, Any, Optional, Tuple
+from src.config import Config
+from src.records import Chunk
+from .base import BaseChunker
+
+# (kind, text, heading level); kind is 'heading', 'paragraph', 'list' or 'code'
+Block = Tuple[str, str, int]
+
+_ATX_HEADING = re.compile(r' {0,3}(#{1,6})[ \t]+(.+?)(?:[ \t]+#+)?[ \t]*$')
+_SETEXT_UNDERLINE = re.compile(r' {0,3}(=+|-+)[ \t]*$')
+_FENCE = re.compile(r' {0,3}(`{3,}|~{3,})')
+_LIST_ITEM = re.compile(r'[ \t]*(?:[-*+•]|\d{1,3}[.)])[ \t]+\S')
+# "2.1 Scope" or "4.1.2 Results": numbered section titles in extracted text. At
+# least one dot is required, since lines like "3 Apples" are as often quantities
+_NUMBERED_HEADING = re.compile(r'(\d{1,2}(?:\.\d{1,2}){1,4})[ \t]+([A-Z][^.:;,!?]{0,78})$')
+
+def scan_blocks(content: str) -> List[Block]:
+    """
+    Split text or markdown into structural blocks in one pass over its lines.
+
+    Recognizes ATX (#) and setext (underlined) headings, standalone dotted
+    numbered section titles ("2.1 Scope"), fenced code blocks, list items (grouped into one block
+    per list, with their indented continuation lines) and paragraphs
+    separated by blank lines. Every line is looked at a constant number of
+    times, so scanning is linear in the length of content.
+
+    Returns:
+        Blocks in document order; heading blocks carry their level, others 0
+    """
+    blocks: List[Block] = []
+    lines = content.split('\n')
+    current: List[str] = []
+    current_kind = None
+    fence = None
+
+    def flush() -> None:
+        nonlocal current, current_kind
+        if current:
+            blocks.append((current_kind, '\n'.join(current).strip('\n'), 0))
+        current, current_kind = [], None
+
+    for index, line in enumerate(lines):
+        if fence is not None:
+            current.append(line)
+            if line.strip().startswith(fence):
+                fence = None
+                flush()
+            continue
+
+        stripped = line.strip()
+        if not stripped:
+            if current_kind == 'list':
+                # A blank line inside a list ends it only if the list does not continue
+                following = lines[index + 1] if index + 1 < len(lines) else ''
+                if _LIST_ITEM.match(following) or following[:1] in (' ', '\t') and following.strip():
+                    current.append(line)
+                    continue
+            flush()
+            continue
+
+        match = _FENCE.match(line)
+        if match:
+            flush()
+            fence = match.group(1)[:3]
+            current, current_kind = [line], 'code'
+            continue
+
+        match = _ATX_HEADING.match(line)
+        if match:
+            flush()
+            blocks.append(('heading', match.group(2), len(match.group(1))))
+            continue
+
+        match = _SETEXT_UNDERLINE.match(line)
+        if match and current_kind == 'paragraph' and len(current) == 1:
+            blocks.append(('heading', current[0].strip(), 1 if match.group(1)[0] == '=' else 2))
+            current, current_kind = [], None
+            continue
+        if match and len(match.group(1)) >= 3:
+            # Thematic break
+            flush()
+            continue
+
+        if not current:
+            match = _NUMBERED_HEADING.match(stripped)
+            following = lines[index + 1] if index + 1 < len(lines) else ''
+            if match and not following.strip():
+                blocks.append(('heading', stripped, match.group(1).count('.') + 1))
+                continue
+
+        if _LIST_ITEM.match(line):
+            if current_kind != 'list':
+                flush()
+                current_kind = 'list'
+            current.append(line)
+            continue
+        if current_kind == 'list' and line[:1] not in (' ', '\t'):
+            # An unindented line after a list starts a new paragraph
+            flush()
+        if current_kind is None:
+            current_kind = 'paragraph'
+        current.append(line)
+
+    flush()
+    return blocks
+
+def split_block(text: str, max_chars: int) -> List[str]:
+    """Split text into pieces of at most max_chars, preferring line then word boundaries."""
+    if len(text) <= max_chars:
+        return [text]
+    pieces = []
+    start = 0
+    while len(text) - start > max_chars:
+        end = text.rfind('\n', start + 1, start + max_chars + 1)
+        if end <= start:
+            end = text.rfind(' ', start + 1, start + max_chars + 1)
+        if end <= start:
+            end = start + max_chars
+        piece = text[start:end].strip()
+        if piece:
+            pieces.append(piece)
+        start = end
+    piece = text[start:].strip()
+    if piece:
+        pieces.append(piece)
+    return pieces
+
+class StructureChunker(BaseChunker):
+    """Chunks along document structure: headings, paragraphs, lists and code blocks.
+
+    Blocks found by scan_blocks are packed, in order, into chunks of up to
+    max_chunk_chars. A heading always starts a new chunk, so no chunk spans
+    two sections, and lists and code blocks are only split when a single
+    one exceeds the budget. Each chunk's metadata carries 'section_path',
+    the titles of the headings it falls under, outermost first.
+    """
+
+    @property
+    def strategy_name(self) -> str:
+        return "structure_chunker"
+
+    def validate_params(self, chunk_params: Dict[str, Any]) -> None:
+        """
+        Validate chunking parameters.
+
+        Args:
+            chunk_params: Dictionary containing:
+                - max_chunk_chars: Size budget of a chunk in characters
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        if chunk_params:
+            max_chars = chunk_params.get('max_chunk_chars', 0)
+            if not isinstance(max_chars, int) or max_chars <= 0:
+                raise ValueError("max_chunk_chars must be a positive integer")
+
+    def chunk_document(self, content: str, metadata: Dict[str, Any],
+                      chunk_params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Chunk the document along its structure.
+
+        Args:
+            content: Document content (plain text or markdown)
+            metadata: Document metadata
+            chunk_params: Optional parameters controlling chunking behavior
+
+        Returns:
+            List of chunks with their metadata
+        """
+        return [chunk.to_dict() for chunk in self.chunk_records(content, metadata, chunk_params)]
+
+    def chunk_records(self, content: str, metadata: Dict[str, Any],
+                      chunk_params: Optional[Dict[str, Any]] = None) -> List[Chunk]:
+        """Chunk the document like chunk_document, returning Chunk records sharing one metadata dict."""
+        params = {'max_chunk_chars': Config.STRUCTURE_MAX_CHUNK_CHARS}
+        if chunk_params:
+            params.update(chunk_params)
+        self.validate_params(params)
+        max_chars = params['max_chunk_chars']
+
+        base = {**metadata, 'strategy': self.strategy_name}
+        blocks = scan_blocks(content)
+        if not blocks:
+            return [Chunk(content, base)]
+
+        chunks = []
+        headings: List[Tuple[int, str]] = []
+        parts: List[str] = []
+        kinds: List[str] = []
+        size = 0
+
+        def flush() -> None:
+            nonlocal parts, kinds, size
+            if parts:
+                chunks.append(Chunk('\n\n'.join(parts), base, {
+                    'chunk_index': len(chunks),
+                    'section_path': [title for _, title in headings],
+                    'block_types': list(dict.fromkeys(kinds))
+                }))
+            parts, kinds, size = [], [], 0
+
+        for kind, text, level in blocks:
+            if kind == 'heading':
+                flush()
+                while headings and headings[-1][0] >= level:
+                    headings.pop()
+                headings.append((level, text))
+            for piece in split_block(text, max_chars):
+                if parts and size + 2 + len(piece) > max_chars:
+                    flush()
+                parts.append(piece)
+                kinds.append(kind)
+                size += len(piece) + (2 if size else 0)
+        flush()
+        return chunks
@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 class Config:
     """Base configuration."""
     
@@ -6,11 +9,96 @@ class Config:
     
     # Service settings
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
+    MAX_NDJSON_CONTENT_LENGTH = 1024 * 1024 * 1024  # 1GB streamed bulk body, 16MB per line
+    # gzip/zstd request bodies may inflate up to the limits above; responses
+    # are compressed per Accept-Encoding
+    COMPRESS_RESPONSES = True
+
+    # Idempotent result cache shared by all workers on the host (SQLite file)
+    RESULT_CACHE_ENABLED = True
+    RESULT_CACHE_PATH = os.path.join(tempfile.gettempdir(), 'indexing-service', 'result_cache.sqlite3')
+    RESULT_CACHE_TTL_SECONDS = 15 * 60
+    RESULT_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 512MB
+    RESULT_CACHE_MAX_ENTRY_BYTES = 32 * 1024 * 1024  # 32MB
+    # Per-client record of emitted chunk hashes, used by the dedup stage
+    DEDUP_SEEN_STORE_ENABLED = True
+    DEDUP_SEEN_STORE_PATH = os.path.join(tempfile.gettempdir(), 'indexing-service', 'seen_hashes.sqlite3')
+    # Each worker process keeps up to MAX_CLIENTS Bloom filters of BLOOM_BITS
+    # bits in memory: 32 x 1MB = 32MB per worker with these defaults
+    DEDUP_BLOOM_BITS = 8 * 1024 * 1024  # 1MB per client; ~1% false positives at 870k chunks
+    DEDUP_BLOOM_HASHES = 7
+    DEDUP_BLOOM_MAX_CLIENTS = 32
+    DEDUP_BATCH_SIZE = 64  # Chunks checked against the seen store per transaction
+    # Near-duplicate detection (MinHash signatures bucketed with LSH)
+    NEAR_DEDUP_THRESHOLD = 0.8  # Estimated Jaccard similarity of word shingles
+    NEAR_DEDUP_NUM_PERM = 64
+    NEAR_DEDUP_SHINGLE_SIZE = 3
+    NEAR_DEDUP_BATCH_SIZE = 512  # Chunks signed per NumPy batch
     ALLOWED_EXTENSIONS = {'txt', 'pdf', 'json'}
     
     # Preprocessing settings
     DEFAULT_CHUNK_SIZE = 1000
-    ENABLE_OCR = False
+    # fixed_size_chunker windows are DEFAULT_CHUNK_SIZE long
+    FIXED_CHUNK_OVERLAP = 0
+    FIXED_CHUNK_SNAP_TOLERANCE = 50  # How far a cut may move to reach whitespace
+    # Sentence boundaries cached per content hash (16 bytes per sentence)
+    SENTENCE_CACHE_MAX_OFFSETS = 8 * 1024 * 1024
+    # Punkt models loaded at warmup and candidates for language='auto'
+    SENTENCE_LANGUAGES = ['english', 'german', 'french', 'spanish', 'italian', 'portuguese']
+    SENTENCE_MODEL_POOL_SIZE = 8  # Resident punkt models (LRU by language)
+    SENTENCE_DETECT_SAMPLE_CHARS = 2000  # Prefix sampled by language='auto'
+    # Documents this long are split at blank lines and segmented in a process pool
+    SENTENCE_PARALLEL_MIN_CHARS = 4 * 1024 * 1024
+    SENTENCE_PARALLEL_SEGMENT_CHARS = 1024 * 1024
+    SENTENCE_PARALLEL_WORKERS = os.cpu_count() or 1
+    # Documents shorter than this are chunked in micro-batches of CHUNK_BATCH_SIZE
+    CHUNK_BATCH_MAX_CHARS = 4096
+    CHUNK_BATCH_SIZE = 256
+    # Content-defined chunking (cdc_chunker) size bounds, in characters
+    CDC_MIN_CHUNK_CHARS = 256
+    CDC_AVG_CHUNK_CHARS = 1024
+    CDC_MAX_CHUNK_CHARS = 4096
+    STRUCTURE_MAX_CHUNK_CHARS = 2000  # Size budget of a structure_chunker chunk
+    ENABLE_OCR = False  # OCR only pages whose extracted text is missing
+    OCR_MIN_TEXT_CHARS = 20
+    OCR_MAX_WORKERS = 2
+    OCR_DPI = 200
+    OCR_LANGUAGE = 'eng'
+    # Strip running headers/footers: lines among the first/last EDGE_LINES of a
+    # page that recur on at least MIN_PAGE_FRACTION of its pages
+    STRIP_PDF_BOILERPLATE = True
+    PDF_BOILERPLATE_EDGE_LINES = 3
+    PDF_BOILERPLATE_MIN_PAGE_FRACTION = 0.6
+    PDF_BOILERPLATE_MIN_PAGES = 3
+    PDF_BOILERPLATE_SAMPLE_PAGES = 50  # Pages sampled before stripping streamed pages
+
+    # PDF extraction backends ('auto' picks per document by size)
+    PDF_BACKEND = 'auto'
+    PDF_DEFAULT_BACKEND = 'pypdf2'
+    PDF_FAST_BACKENDS = ['pdfium', 'pypdf']
+    PDF_FAST_BACKEND_MIN_BYTES = 1024 * 1024  # 1MB
+
+    # Ingest pipeline: implementation per configurable stage, and how many
+    # items each stage may run ahead of the next (0 = no background threads)
+    PIPELINE_STAGES = {
+        'clean': 'control_chars',
+        'format': 'embedding',
+        'serialize': 'json_array'
+    }
+    PIPELINE_BUFFER_SIZE = 4
+
+    # Settings above that change ingest output; cached results are keyed by
+    # their values, so changing one never serves results built without it
+    RESULT_CACHE_KEY_SETTINGS = (
+        'PDF_BACKEND', 'PDF_DEFAULT_BACKEND', 'PDF_FAST_BACKENDS', 'PDF_FAST_BACKEND_MIN_BYTES',
+        'ENABLE_OCR', 'OCR_MIN_TEXT_CHARS', 'OCR_DPI', 'OCR_LANGUAGE',
+        'STRIP_PDF_BOILERPLATE', 'PDF_BOILERPLATE_EDGE_LINES', 'PDF_BOILERPLATE_MIN_PAGE_FRACTION',
+        'PDF_BOILERPLATE_MIN_PAGES', 'PDF_BOILERPLATE_SAMPLE_PAGES',
+        'DEFAULT_CHUNK_SIZE', 'FIXED_CHUNK_OVERLAP', 'FIXED_CHUNK_SNAP_TOLERANCE',
+        'SENTENCE_LANGUAGES', 'SENTENCE_DETECT_SAMPLE_CHARS',
+        'CDC_MIN_CHUNK_CHARS', 'CDC_AVG_CHUNK_CHARS', 'CDC_MAX_CHUNK_CHARS', 'STRUCTURE_MAX_CHUNK_CHARS',
+        'NEAR_DEDUP_THRESHOLD', 'NEAR_DEDUP_NUM_PERM', 'NEAR_DEDUP_SHINGLE_SIZE'
+    )
 
 class ProductionConfig(Config):
     """Production configuration."""
@@ -1,5 +1,19 @@
-"""Indexing strategies package initialization."""
-from .simple_directory_reader import SimpleDirectoryReader
-from .json_indexer import JSONIndexer
+"""Indexing strategies package initialization.
+
+Strategies are imported on first attribute access so that importing the
+package does not pull in heavyweight dependencies of unused strategies.
+"""
+import importlib
+
+_STRATEGY_MODULES = {
+    'SimpleDirectoryReader': '.simple_directory_reader',
+    'JSONIndexer': '.json_indexer'
+}
 
 __all__ = ['SimpleDirectoryReader', 'JSONIndexer']
+
+def __getattr__(name):
+    if name in _STRATEGY_MODULES:
+        module = importlib.import_module(_STRATEGY_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,5 @@
 from typing import List, Dict, Any, Optional
 from src.indexing.base import BaseIndexer
-from llama_index.core.readers import SimpleDirectoryReader as LlamaDirectoryReader
 import os
 from datetime import datetime
 
@@ -25,6 +24,9 @@ class SimpleDirectoryReader(BaseIndexer):
         Returns:
             List of indexed document chunks with metadata
         """
+        # LlamaIndex takes seconds to import, so only load it once this strategy is used
+        from llama_index.core.readers import SimpleDirectoryReader as LlamaDirectoryReader
+
         indexed_documents = []
 
         for doc in documents:
@@ -1,3 +1,4 @@
+import threading
 from typing import Dict, Type, List, Any
 from src.indexing.base import BaseIndexer
 from src.indexing.strategies.simple_directory_reader import SimpleDirectoryReader
@@ -11,14 +12,26 @@ class StrategyManager:
             'simple_directory': SimpleDirectoryReader,
             'json_index': JSONIndexer
         }
+        self._instances: Dict[str, BaseIndexer] = {}
+        self._lock = threading.Lock()
+
+    def get_strategy(self, strategy_name: str) -> BaseIndexer:
+        """Return the shared instance of an indexing strategy, creating it on first use."""
+        if strategy_name not in self._strategies:
+            raise ValueError(f"Unknown strategy: {strategy_name}")
+
+        strategy = self._instances.get(strategy_name)
+        if strategy is None:
+            with self._lock:
+                strategy = self._instances.get(strategy_name)
+                if strategy is None:
+                    strategy = self._strategies[strategy_name]()
+                    self._instances[strategy_name] = strategy
+        return strategy
     
     def apply_strategy(self, strategy_name: str, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Apply the specified indexing strategy to the documents."""
-        if strategy_name not in self._strategies:
-            raise ValueError(f"Unknown strategy: {strategy_name}")
-        
-        strategy = self._strategies[strategy_name]()
-        return strategy.index(documents)
+        return self.get_strategy(strategy_name).index(documents)
     
     def get_available_strategies(self) -> List[str]:
         """Return list of available indexing strategies."""
@@ -1,15 +1,16 @@
 import sys
-from flask import Flask, request, jsonify
+from flask import Flask, jsonify
 from flask_cors import CORS
-from .chunking.manager import ChunkerManager
-from .chunking.sentence_chunker import SentenceChunker
-from .indexing.strategies import SimpleDirectoryReader
+from .api import api_bp
+from .registry import ComponentRegistry
 
-def create_app():
+def create_app(test_config=None):
     app = Flask(__name__)
     
     # Load configuration
     app.config.from_object('src.config.ProductionConfig')
+    if test_config:
+        app.config.update(test_config)
     
     # Initialize CORS
     CORS(app)
@@ -37,10 +38,12 @@ def create_app():
         app.logger.setLevel(logging.INFO)
         app.logger.info('Flask application startup')
 
-    # Initialize and register chunking strategies
-    chunker_manager = ChunkerManager()
-    # Changed this line - we pass the class, not an instance
-    chunker_manager.register_strategy(SentenceChunker)  # Remove the parentheses
+    # Build pipeline components once; requests reuse them
+    components = ComponentRegistry(app.config)
+    components.init_app(app)
+
+    # Every ingest request runs through the same pipeline engine
+    app.register_blueprint(api_bp, url_prefix='/api')
 
     @app.route('/')
     def index():
@@ -48,6 +51,8 @@ def create_app():
             'status': 'online',
             'endpoints': {
                 '/api/ingest': 'POST - Ingest and process documents',
+                '/api/diff': 'POST - Return only the chunks changed since a previous ingest',
+                '/api/list-strategies': 'GET - List available strategies',
                 '/health': 'GET - Health check endpoint'
             }
         })
@@ -59,43 +64,4 @@ def create_app():
             'service': 'indexing-microservice'
         })
 
-    @app.route('/api/ingest', methods=['POST'])
-    def ingest():
-        try:
-            if not request.is_json:
-                return jsonify({'error': 'Content-Type must be application/json'}), 400
-                
-            try:
-                data = request.get_json(force=True)
-            except Exception as e:
-                return jsonify({'error': 'Invalid JSON format'}), 400
-            documents = data.get('documents', [])
-            strategy_name = data.get('indexing_strategy')
-            chunk_params = data.get('chunk_params')
-
-            print("\nIncoming documents:", documents)  # Debug print
-
-            if not documents:
-                return jsonify({'error': 'No documents provided'}), 400
-
-            # Process documents using the specified strategy
-            if strategy_name == 'sentence_chunker':
-                chunker = chunker_manager.get_strategy(strategy_name)
-                processed_docs = chunker.chunk_document(
-                    documents[0].get('content', ''),
-                    documents[0].get('metadata', {}),
-                    chunk_params
-                )
-                return jsonify(processed_docs)
-            elif strategy_name == 'simple_directory':
-                reader = SimpleDirectoryReader()
-                result = reader.index(documents)
-                return jsonify(result)
-
-            return jsonify({'error': f'Unknown strategy: {strategy_name}'}), 400
-
-        except Exception as e:
-            print(f"\nError during processing: {str(e)}")  # Debug print
-            return jsonify({'error': str(e)}), 500
-
     return app
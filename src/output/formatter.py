@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator
 from datetime import datetime
 from src.utils.schema_validator import SchemaValidator
 
@@ -27,8 +27,11 @@ class OutputFormatter:
         Returns:
             List of formatted documents with validated metadata
         """
-        formatted_output = []
+        return list(self.iter_format(indexed_data, version_increment))
 
+    def iter_format(self, indexed_data: Iterable[Dict[str, Any]],
+                    version_increment: bool = False) -> Iterator[Dict[str, Any]]:
+        """Lazily format indexed data one chunk at a time (see format)."""
         for item in indexed_data:
             content = item.get('content', '')
             metadata = item.get('metadata', {})
@@ -69,10 +72,7 @@ class OutputFormatter:
                 'has_validation_errors': validated_metadata.get('has_validation_errors', False)
             })
 
-            formatted_chunk = {
+            yield {
                 'text': content,
                 'metadata': validated_metadata
             }
-            formatted_output.append(formatted_chunk)
-
-        return formatted_output
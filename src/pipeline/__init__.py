@@ -0,0 +1,7 @@
+"""Pipeline engine package initialization."""
+from .base import BaseStage
+from .buffer import BoundedBuffer
+from .engine import Pipeline
+from .builder import PipelineBuilder
+
+__all__ = ['BaseStage', 'BoundedBuffer', 'Pipeline', 'PipelineBuilder']
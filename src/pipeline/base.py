@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, Any
+
+class BaseStage(ABC):
+    """Base interface for pipeline stages.
+
+    A stage consumes an iterator of items from the previous stage and lazily
+    yields items for the next one, so no stage ever materializes a request.
+    """
+
+    @property
+    @abstractmethod
+    def stage_name(self) -> str:
+        """Return the name of the stage."""
+        pass
+
+    @abstractmethod
+    def process(self, items: Iterable[Any]) -> Iterator[Any]:
+        """
+        Transform a stream of items.
+
+        Args:
+            items: Items produced by the previous stage
+
+        Returns:
+            Iterator over the items this stage produces
+        """
+        pass
+
+    def commit(self) -> None:
+        """
+        Make lasting side effects of a run once its output was fully delivered.
+
+        Called by the consumer after the last item reached the client; never
+        called for a run that failed or was cut short. Does nothing by default.
+        """
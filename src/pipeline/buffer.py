@@ -0,0 +1,71 @@
+import queue
+import threading
+from typing import Iterator, Any, Optional
+
+class _End:
+    """Marks the end of the source iterator, carrying its exception if any."""
+
+    def __init__(self, error: Optional[BaseException] = None):
+        self.error = error
+
+class BoundedBuffer:
+    """Runs an iterator in a background thread, keeping at most `size` items ahead of the consumer.
+
+    The producer blocks when the buffer is full, so memory between two stages
+    stays bounded while the upstream stage works ahead of the downstream one.
+    Exceptions raised by the source are re-raised in the consumer.
+    """
+
+    _POLL_SECONDS = 0.1
+
+    def __init__(self, source: Iterator[Any], size: int):
+        if size <= 0:
+            raise ValueError("size must be positive")
+        self._queue: queue.Queue = queue.Queue(maxsize=size)
+        self._stop = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(target=self._fill, args=(source,), daemon=True)
+        self._thread.start()
+
+    def _fill(self, source: Iterator[Any]) -> None:
+        try:
+            for item in source:
+                if not self._put(item):
+                    return
+        except BaseException as e:
+            self._put(_End(e))
+        else:
+            self._put(_End())
+        finally:
+            close = getattr(source, 'close', None)
+            if close:
+                close()
+
+    def _put(self, item: Any) -> bool:
+        """Put an item, giving up once the consumer has closed the buffer."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=self._POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def __iter__(self) -> 'BoundedBuffer':
+        return self
+
+    def __next__(self) -> Any:
+        if self._finished:
+            raise StopIteration
+        item = self._queue.get()
+        if isinstance(item, _End):
+            self._finished = True
+            if item.error is not None:
+                raise item.error
+            raise StopIteration
+        return item
+
+    def close(self) -> None:
+        """Stop the producer thread; pending items are discarded."""
+        self._finished = True
+        self._stop.set()
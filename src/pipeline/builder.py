@@ -0,0 +1,145 @@
+from typing import Dict, Any, List, Optional, Type, Union
+from src.cache.seen_hashes import SeenHashStore
+from src.chunking.base import iter_chunk_configs
+from src.chunking.manager import ChunkerManager
+from src.config import Config
+from src.indexing.strategy_manager import StrategyManager
+from src.output.formatter import OutputFormatter
+from src.preprocessing.processor import PreprocessingModule
+from .base import BaseStage
+from .engine import Pipeline
+from .stages import (
+    ExtractStage, PassthroughCleanStage, ControlCharCleanStage, ChunkStage, IndexStage, ChunkIdStage,
+    DedupStage, NearDedupStage,
+    EmbeddingFormatStage, RawFormatStage, JSONArraySerializeStage
+)
+
+class PipelineBuilder:
+    """Assembles a Pipeline for a request from configured stage implementations."""
+
+    CLEAN_STAGES: Dict[str, Type[BaseStage]] = {
+        'none': PassthroughCleanStage,
+        'control_chars': ControlCharCleanStage
+    }
+    FORMAT_STAGES = ('embedding', 'raw')
+    SERIALIZE_STAGES: Dict[str, Type[BaseStage]] = {
+        'json_array': JSONArraySerializeStage
+    }
+
+    def __init__(self,
+                 preprocessor: PreprocessingModule,
+                 strategy_manager: StrategyManager,
+                 chunker_manager: ChunkerManager,
+                 output_formatter: OutputFormatter,
+                 stage_config: Optional[Dict[str, str]] = None,
+                 buffer_size: Optional[int] = None,
+                 seen_store: Optional[SeenHashStore] = None):
+        """
+        Args:
+            stage_config: Implementation name per configurable stage
+                ('clean', 'format', 'serialize'); default Config.PIPELINE_STAGES
+            buffer_size: Items buffered between stages; default Config.PIPELINE_BUFFER_SIZE
+            seen_store: Per-client record of emitted chunk hashes for cross-request dedup
+        """
+        self.preprocessor = preprocessor
+        self.strategy_manager = strategy_manager
+        self.chunker_manager = chunker_manager
+        self.output_formatter = output_formatter
+        self.seen_store = seen_store
+        self.stage_config = {**Config.PIPELINE_STAGES, **(stage_config or {})}
+        self.buffer_size = Config.PIPELINE_BUFFER_SIZE if buffer_size is None else buffer_size
+
+        self._validate_choice('clean', self.CLEAN_STAGES)
+        self._validate_choice('format', self.FORMAT_STAGES)
+        self._validate_choice('serialize', self.SERIALIZE_STAGES)
+
+    def get_available_strategies(self) -> list:
+        """Return every strategy a pipeline can be built for."""
+        return (self.strategy_manager.get_available_strategies() +
+                self.chunker_manager.get_available_strategies())
+
+    def has_strategy(self, strategy_name: str) -> bool:
+        """Return True if strategy_name is a registered indexing or chunking strategy."""
+        return strategy_name in self.get_available_strategies()
+
+    def build(self, strategy_name: str,
+              chunk_params: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+              dedup: Optional[str] = None, client_id: Optional[str] = None,
+              near_dedup: Optional[str] = None, near_dedup_threshold: Any = None,
+              serialize: bool = True) -> Pipeline:
+        """
+        Build the pipeline for one request.
+
+        Args:
+            strategy_name: Indexing or chunking strategy to apply
+            chunk_params: Parameters for chunking strategies, or a list of
+                parameter sets to produce one chunking variant per set
+            dedup: Duplicate chunk handling, 'drop' or 'mark' (default: none)
+            client_id: Client whose earlier output dedup also checks against
+            near_dedup: Near-duplicate chunk handling, 'drop' or 'mark' (default: none)
+            near_dedup_threshold: Jaccard similarity at which chunks are
+                near-duplicates (default: Config.NEAR_DEDUP_THRESHOLD)
+            serialize: If False, the pipeline yields formatted chunks instead of bytes
+
+        Returns:
+            A pipeline turning raw documents into serialized output, or into
+            formatted chunks when serialize is False
+
+        Raises:
+            ValueError: If strategy_name is not registered, a parameter list
+                is malformed or given to an indexing strategy, or a dedup
+                option is invalid
+        """
+        stages = [
+            ExtractStage(self.preprocessor),
+            self.CLEAN_STAGES[self.stage_config['clean']](),
+            self._segment_stage(strategy_name, chunk_params),
+            ChunkIdStage()
+        ]
+        dedup_stage = DedupStage(dedup, self.seen_store, client_id) if dedup else None
+        if dedup_stage:
+            stages.append(dedup_stage)
+        if near_dedup:
+            # Chunks dropped as near-duplicates never reach the client's seen history
+            stages.append(NearDedupStage(near_dedup, self._threshold(near_dedup_threshold),
+                                         on_drop=dedup_stage.forget if dedup_stage else None))
+        stages.append(self._format_stage())
+        if serialize:
+            stages.append(self.SERIALIZE_STAGES[self.stage_config['serialize']]())
+        return Pipeline(stages, buffer_size=self.buffer_size)
+
+    @staticmethod
+    def _threshold(value: Any) -> Optional[float]:
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"near_dedup_threshold must be a number, got {value!r}")
+
+    def uses_client_history(self, dedup: Optional[str], client_id: Optional[str]) -> bool:
+        """Return True if a pipeline built with these options depends on the client's earlier requests."""
+        return bool(dedup and client_id and self.seen_store is not None)
+
+    def _segment_stage(self, strategy_name: str, chunk_params) -> BaseStage:
+        if strategy_name in self.chunker_manager.get_available_strategies():
+            if isinstance(chunk_params, list):
+                # Check the sweep's shape now so it is rejected before streaming
+                for _ in iter_chunk_configs(chunk_params):
+                    pass
+            return ChunkStage(self.chunker_manager.get_strategy(strategy_name), chunk_params)
+        if strategy_name in self.strategy_manager.get_available_strategies():
+            if isinstance(chunk_params, list):
+                raise ValueError(f"Strategy {strategy_name} does not accept a chunk_params list")
+            return IndexStage(self.strategy_manager.get_strategy(strategy_name))
+        raise ValueError(f"Unknown strategy: {strategy_name}")
+
+    def _format_stage(self) -> BaseStage:
+        if self.stage_config['format'] == 'raw':
+            return RawFormatStage()
+        return EmbeddingFormatStage(self.output_formatter)
+
+    def _validate_choice(self, stage: str, choices) -> None:
+        if self.stage_config.get(stage) not in choices:
+            raise ValueError(f"Unknown {stage} stage: {self.stage_config.get(stage)}. "
+                             f"Available: {list(choices)}")
@@ -0,0 +1,51 @@
+from typing import Any, Dict, Iterable, List
+from src.chunking.base import document_identity
+
+def diff_chunks(chunks: Iterable[Dict[str, Any]], manifest: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+    """
+    Compare freshly produced chunks with the chunk ids a client already holds.
+
+    Chunks are grouped by document identity (see make_chunk_id). Only chunks
+    whose 'chunk_id' is not in the document's manifest entry are kept, so a
+    lightly edited document yields just the chunks around the edits.
+
+    Args:
+        chunks: Chunks carrying metadata 'chunk_id', in document order
+        manifest: Previous chunk ids per document identity; documents
+            missing from it have every chunk added
+
+    Returns:
+        One entry per document, in order of appearance, with 'document_id',
+        'chunk_ids' (the new manifest, in chunk order), 'added' (the new
+        chunks), 'removed' (ids no longer produced) and 'unchanged' (count)
+    """
+    documents: Dict[str, Dict[str, Any]] = {}
+    for chunk in chunks:
+        metadata = chunk.get('metadata', {})
+        document_id = document_identity(metadata)
+        entry = documents.get(document_id)
+        if entry is None:
+            entry = documents[document_id] = {
+                'document_id': document_id,
+                'chunk_ids': [],
+                'added': [],
+                'previous': set(manifest.get(document_id, ())),
+                'current': set()
+            }
+        chunk_id = metadata['chunk_id']
+        if chunk_id in entry['current']:
+            continue
+        entry['current'].add(chunk_id)
+        entry['chunk_ids'].append(chunk_id)
+        if chunk_id not in entry['previous']:
+            entry['added'].append(chunk)
+
+    results = []
+    for document_id, entry in documents.items():
+        current = entry.pop('current')
+        entry.pop('previous')
+        entry['removed'] = [chunk_id for chunk_id in dict.fromkeys(manifest.get(document_id, ()))
+                            if chunk_id not in current]
+        entry['unchanged'] = len(entry['chunk_ids']) - len(entry['added'])
+        results.append(entry)
+    return results
@@ -0,0 +1,56 @@
+from typing import Iterable, Iterator, List, Any
+from .base import BaseStage
+from .buffer import BoundedBuffer
+
+class Pipeline:
+    """Chains stages into one lazy stream with bounded buffers between them."""
+
+    def __init__(self, stages: List[BaseStage], buffer_size: int = 0):
+        """
+        Args:
+            stages: Stages in execution order
+            buffer_size: Items each stage may run ahead of the next one;
+                0 runs every stage in the consumer's thread
+        """
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        if buffer_size < 0:
+            raise ValueError("buffer_size must be non-negative")
+        self.stages = stages
+        self.buffer_size = buffer_size
+
+    @property
+    def stage_names(self) -> List[str]:
+        """Return the names of the stages in execution order."""
+        return [stage.stage_name for stage in self.stages]
+
+    def run(self, documents: Iterable[Any]) -> Iterator[Any]:
+        """
+        Stream documents through every stage.
+
+        Nothing runs until the first item is requested; closing the returned
+        iterator stops all buffer threads.
+
+        Args:
+            documents: Raw documents (any iterable, consumed lazily)
+
+        Returns:
+            Iterator over the output of the last stage
+        """
+        buffers: List[BoundedBuffer] = []
+        stream: Iterator[Any] = iter(documents)
+        try:
+            for index, stage in enumerate(self.stages):
+                stream = stage.process(stream)
+                if self.buffer_size and index < len(self.stages) - 1:
+                    stream = BoundedBuffer(stream, self.buffer_size)
+                    buffers.append(stream)
+            yield from stream
+        finally:
+            for buffer in buffers:
+                buffer.close()
+
+    def commit(self) -> None:
+        """Commit every stage once a run's output was fully delivered (see BaseStage.commit)."""
+        for stage in self.stages:
+            stage.commit()
@@ -0,0 +1,343 @@
+import hashlib
+import json
+from typing import Callable, Iterable, Iterator, Dict, Any, List, Optional, Union
+from src.cache.seen_hashes import SeenHashStore
+from src.chunking.base import BaseChunker, make_chunk_id, normalize_chunk_text
+from src.config import Config
+from src.indexing.base import BaseIndexer
+from src.output.formatter import OutputFormatter
+from src.preprocessing.processor import PreprocessingModule
+from src.records import Chunk, Document
+from .base import BaseStage
+
+class ExtractStage(BaseStage):
+    """Extracts text from raw request documents into Document records."""
+
+    def __init__(self, preprocessor: PreprocessingModule):
+        self.preprocessor = preprocessor
+
+    @property
+    def stage_name(self) -> str:
+        return "extract"
+
+    def process(self, items: Iterable[Dict[str, Any]]) -> Iterator[Document]:
+        for doc in self.preprocessor.iter_process(items):
+            yield Document.from_dict(doc)
+
+class PassthroughCleanStage(BaseStage):
+    """Leaves extracted text untouched."""
+
+    @property
+    def stage_name(self) -> str:
+        return "clean"
+
+    def process(self, items: Iterable[Document]) -> Iterator[Document]:
+        return iter(items)
+
+class ControlCharCleanStage(BaseStage):
+    """Normalizes line endings and drops control characters, keeping the text layout."""
+
+    # Map every C0 control character except tab and newline (and DEL) to None
+    _CONTROL_CHARS = {code: None for code in list(range(32)) + [127] if chr(code) not in '\t\n'}
+
+    @property
+    def stage_name(self) -> str:
+        return "clean"
+
+    def process(self, items: Iterable[Document]) -> Iterator[Document]:
+        for doc in items:
+            content = doc.content
+            if isinstance(content, str) and content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+                doc.content = content.translate(self._CONTROL_CHARS)
+            yield doc
+
+class ChunkStage(BaseStage):
+    """Splits each document into chunks with a chunking strategy.
+
+    chunk_params may be a list of parameter sets, in which case every document
+    is chunked once per set and each chunk is tagged with 'chunk_config_id'.
+    Otherwise consecutive documents shorter than batch_max_chars are collected
+    into micro-batches and chunked with one chunk_record_batch call; longer
+    documents are chunked on their own. Batches start at one document and
+    double up to batch_size, so the first chunks stream out without waiting
+    for later documents.
+    """
+
+    def __init__(self, chunker: BaseChunker,
+                 chunk_params: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+                 batch_size: Optional[int] = None, batch_max_chars: Optional[int] = None):
+        self.chunker = chunker
+        self.chunk_params = chunk_params
+        self.batch_size = batch_size if batch_size is not None else Config.CHUNK_BATCH_SIZE
+        self.batch_max_chars = batch_max_chars if batch_max_chars is not None else Config.CHUNK_BATCH_MAX_CHARS
+
+    @property
+    def stage_name(self) -> str:
+        return "chunk"
+
+    def process(self, items: Iterable[Document]) -> Iterator[Chunk]:
+        if isinstance(self.chunk_params, list):
+            for doc in items:
+                yield from self.chunker.chunk_variant_records(doc.content, doc.metadata, self.chunk_params)
+            return
+
+        batch = []
+        batch_limit = 1
+        for doc in items:
+            if len(doc.content) < self.batch_max_chars:
+                batch.append((doc.content, doc.metadata))
+                if len(batch) >= batch_limit:
+                    yield from self.chunker.chunk_record_batch(batch, self.chunk_params)
+                    batch = []
+                    batch_limit = min(batch_limit * 2, self.batch_size)
+                continue
+            # Flush small documents first to keep output in document order
+            if batch:
+                yield from self.chunker.chunk_record_batch(batch, self.chunk_params)
+                batch = []
+            yield from self.chunker.chunk_records(doc.content, doc.metadata, self.chunk_params)
+        if batch:
+            yield from self.chunker.chunk_record_batch(batch, self.chunk_params)
+
+class IndexStage(BaseStage):
+    """Applies an indexing strategy to each document as it arrives."""
+
+    def __init__(self, indexer: BaseIndexer):
+        self.indexer = indexer
+
+    @property
+    def stage_name(self) -> str:
+        return "index"
+
+    def process(self, items: Iterable[Document]) -> Iterator[Chunk]:
+        for doc in items:
+            for chunk in self.indexer.index([doc.to_dict()]):
+                yield Chunk.from_dict(chunk)
+
+class ChunkIdStage(BaseStage):
+    """Gives every chunk a deterministic id in metadata 'chunk_id'.
+
+    The id hashes the document's identity (metadata 'document_id', else
+    'source') together with the chunk's normalized text (see make_chunk_id).
+    It does not depend on the chunk's position, so an unchanged chunk keeps
+    its id when the document around it is edited, and identical chunks of
+    one document share an id.
+    """
+
+    @property
+    def stage_name(self) -> str:
+        return "chunk_id"
+
+    def process(self, items: Iterable[Chunk]) -> Iterator[Chunk]:
+        for chunk in items:
+            chunk.set('chunk_id', make_chunk_id(chunk, chunk.content))
+            yield chunk
+
+class DedupStage(BaseStage):
+    """Removes or marks chunks whose normalized text was already emitted.
+
+    Chunk text is normalized (Unicode NFKC, case-folded, whitespace collapsed)
+    and hashed; the hex digest is stored in metadata 'content_hash'. A chunk
+    repeating an earlier chunk of the same request is a 'request' duplicate.
+    With a seen store and a client_id, a chunk the client received in an
+    earlier request is a 'client' duplicate. Mode 'drop' removes duplicates;
+    mode 'mark' keeps them with metadata 'duplicate' set to the kind.
+
+    Lookups do not write to the seen store: the hashes of the chunks passed
+    on are staged and recorded by commit(), once the response holding them
+    was fully sent, so a stream cut short leaves the client's history as it
+    was. A later stage that drops one of those chunks calls forget() so it
+    is not recorded either. A stage instance serves one run.
+    """
+
+    MODES = ('drop', 'mark')
+
+    def __init__(self, mode: str = 'drop', seen_store: Optional[SeenHashStore] = None,
+                 client_id: Optional[str] = None, batch_size: Optional[int] = None):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown dedup mode: {mode}. Available: {list(self.MODES)}")
+        self.mode = mode
+        self.seen_store = seen_store if client_id else None
+        self.client_id = str(client_id) if client_id else None
+        self.batch_size = batch_size if batch_size is not None else Config.DEDUP_BATCH_SIZE
+        # Hashes to record, as dict keys so forget() is constant time
+        self.pending: Dict[bytes, None] = {}
+
+    @property
+    def stage_name(self) -> str:
+        return "dedup"
+
+    def commit(self) -> None:
+        """Record the hashes of the chunks passed on as emitted to the client."""
+        if self.seen_store is not None and self.pending:
+            self.seen_store.record(self.client_id, list(self.pending))
+        self.pending = {}
+
+    def forget(self, chunk: Chunk) -> None:
+        """Do not record chunk's hash: a later stage dropped it, so the client never receives it."""
+        # A request duplicate shares its hash with the copy that was passed on
+        if chunk.get('duplicate') is None:
+            self.pending.pop(bytes.fromhex(chunk.get('content_hash')), None)
+
+    @classmethod
+    def content_hash(cls, text: str) -> bytes:
+        """Return the 16-byte hash of text after normalization."""
+        normalized = normalize_chunk_text(text)
+        return hashlib.blake2b(normalized.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+    def process(self, items: Iterable[Chunk]) -> Iterator[Chunk]:
+        request_hashes = set()
+        batch = []
+        batch_limit = 1
+        for chunk in items:
+            digest = self.content_hash(chunk.content)
+            chunk.set('content_hash', digest.hex())
+            if digest in request_hashes:
+                if self.mode == 'mark':
+                    chunk.set('duplicate', 'request')
+                    batch.append((chunk, None))
+            else:
+                request_hashes.add(digest)
+                batch.append((chunk, digest))
+            # Client lookups are batched (1, 2, 4, ... batch_size) to share transactions
+            if len(batch) >= batch_limit:
+                yield from self._flush(batch)
+                batch = []
+                batch_limit = min(batch_limit * 2, self.batch_size)
+        yield from self._flush(batch)
+
+    def _flush(self, batch: List) -> Iterator[Chunk]:
+        if not batch:
+            return
+        seen = [False] * len(batch)
+        if self.seen_store is not None:
+            positions = [index for index, (_, digest) in enumerate(batch) if digest is not None]
+            flags = self.seen_store.check(self.client_id, [batch[index][1] for index in positions])
+            for index, flag in zip(positions, flags):
+                seen[index] = flag
+                if not flag:
+                    self.pending[batch[index][1]] = None
+        for (chunk, _), was_seen in zip(batch, seen):
+            if was_seen:
+                if self.mode == 'drop':
+                    continue
+                chunk.set('duplicate', 'client')
+            yield chunk
+
+class NearDedupStage(BaseStage):
+    """Removes or marks chunks that are near-duplicates of earlier chunks in the request.
+
+    Each chunk gets a MinHash signature of its word shingles (computed with
+    NumPy for micro-batches of chunks) and is looked up in a banded LSH
+    index of the request's earlier, distinct chunks. A chunk whose estimated
+    Jaccard similarity to one of them reaches threshold is a near-duplicate:
+    mode 'drop' removes it; mode 'mark' keeps it with metadata
+    'near_duplicate_of' (source and chunk_index of the earlier chunk) and
+    'near_duplicate_similarity'. on_drop, if given, is called with every
+    dropped chunk.
+    """
+
+    MODES = ('drop', 'mark')
+
+    def __init__(self, mode: str = 'drop', threshold: Optional[float] = None,
+                 num_perm: Optional[int] = None, shingle_size: Optional[int] = None,
+                 batch_size: Optional[int] = None, on_drop: Optional[Callable[[Chunk], None]] = None):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown near_dedup mode: {mode}. Available: {list(self.MODES)}")
+        threshold = Config.NEAR_DEDUP_THRESHOLD if threshold is None else threshold
+        if not 0 < threshold <= 1:
+            raise ValueError("near_dedup_threshold must be in (0, 1]")
+        # NumPy is only needed once a request asks for near-dedup
+        from src.utils.minhash import MinHasher
+        self.mode = mode
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm or Config.NEAR_DEDUP_NUM_PERM,
+                                shingle_size or Config.NEAR_DEDUP_SHINGLE_SIZE)
+        self.batch_size = batch_size if batch_size is not None else Config.NEAR_DEDUP_BATCH_SIZE
+        self.on_drop = on_drop
+
+    @property
+    def stage_name(self) -> str:
+        return "near_dedup"
+
+    def process(self, items: Iterable[Chunk]) -> Iterator[Chunk]:
+        from src.utils.minhash import LSHIndex
+        index = LSHIndex(self.hasher.num_perm, self.threshold)
+        originals = []
+        batch = []
+        batch_limit = 1
+        for chunk in items:
+            batch.append(chunk)
+            if len(batch) >= batch_limit:
+                yield from self._flush(batch, index, originals)
+                batch = []
+                batch_limit = min(batch_limit * 2, self.batch_size)
+        yield from self._flush(batch, index, originals)
+
+    def _flush(self, batch: List[Chunk], index, originals: List[Dict[str, Any]]) -> Iterator[Chunk]:
+        if not batch:
+            return
+        signatures = self.hasher.signatures([chunk.content for chunk in batch])
+        empty = (signatures == 0xFFFFFFFF).all(axis=1)
+        for chunk, signature, is_empty in zip(batch, signatures, empty):
+            match = None if is_empty else index.query(signature)
+            if match is None:
+                if not is_empty:
+                    index.add(signature)
+                    originals.append({'source': chunk.get('source'), 'chunk_index': chunk.get('chunk_index')})
+                yield chunk
+            elif self.mode == 'mark':
+                position, similarity = match
+                chunk.set('near_duplicate_of', originals[position])
+                chunk.set('near_duplicate_similarity', round(similarity, 4))
+                yield chunk
+            elif self.on_drop is not None:
+                self.on_drop(chunk)
+
+class EmbeddingFormatStage(BaseStage):
+    """Formats chunk records for the Embedding Service with validated metadata."""
+
+    def __init__(self, formatter: OutputFormatter):
+        self.formatter = formatter
+
+    @property
+    def stage_name(self) -> str:
+        return "format"
+
+    def process(self, items: Iterable[Chunk]) -> Iterator[Dict[str, Any]]:
+        return self.formatter.iter_format(chunk.to_dict() for chunk in items)
+
+class RawFormatStage(BaseStage):
+    """Emits chunks exactly as the chunking or indexing strategy produced them."""
+
+    @property
+    def stage_name(self) -> str:
+        return "format"
+
+    def process(self, items: Iterable[Chunk]) -> Iterator[Dict[str, Any]]:
+        return (chunk.to_dict() for chunk in items)
+
+class JSONArraySerializeStage(BaseStage):
+    """Serializes chunks into the bytes of one JSON array, element by element."""
+
+    @property
+    def stage_name(self) -> str:
+        return "serialize"
+
+    def process(self, items: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+        iterator = iter(items)
+        # Hold the opening bracket until the first element exists, so the first
+        # pull runs a document through every stage and surfaces early errors
+        first = next(iterator, None)
+        if first is None:
+            yield b'[]'
+            return
+        yield b'[' + self._dumps(first)
+        for item in iterator:
+            yield b',' + self._dumps(item)
+        yield b']'
+
+    @staticmethod
+    def _dumps(item: Dict[str, Any]) -> bytes:
+        return json.dumps(item, separators=(',', ':')).encode('utf-8')
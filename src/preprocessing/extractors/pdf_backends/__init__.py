@@ -0,0 +1,11 @@
+"""PDF extraction backends initialization."""
+from .base import PDFBackend, PDFContent
+from .pypdf_backend import PyPDF2Backend, PyPDFBackend
+from .pdfium_backend import PdfiumBackend
+from .pdfminer_backend import PdfminerBackend
+from .selector import BackendSelector
+
+__all__ = [
+    'PDFBackend', 'PDFContent', 'PyPDF2Backend', 'PyPDFBackend',
+    'PdfiumBackend', 'PdfminerBackend', 'BackendSelector'
+]
@@ -0,0 +1,121 @@
+import mmap
+import re
+from abc import ABC, abstractmethod
+from io import BytesIO
+from typing import List, Dict, Any, Optional, BinaryIO, Tuple
+
+# Info dictionary entries carried into document metadata, by metadata key
+INFO_FIELDS = {'title': 'Title', 'author': 'Author', 'subject': 'Subject',
+               'creator': 'Creator', 'producer': 'Producer'}
+
+_HEADER_VERSION = re.compile(rb'%PDF-(\d\.\d)')
+# PDF/A identification in XMP, as attributes (pdfaid:part="1") or elements (<pdfaid:part>1<)
+_PDFA_PART = re.compile(rb'pdfaid:part\s*(?:=\s*["\']|>)\s*(\d+)')
+_PDFA_CONFORMANCE = re.compile(rb'pdfaid:conformance\s*(?:=\s*["\']|>)\s*([A-Za-z])')
+
+def header_version(header: bytes) -> Optional[str]:
+    """Return the version in a PDF header such as b'%PDF-1.7', or None."""
+    match = _HEADER_VERSION.search(header[:1024])
+    return match.group(1).decode('ascii') if match else None
+
+def pdfa_version(xmp: Any) -> Optional[str]:
+    """Return the PDF/A part and conformance claimed in XMP (e.g. '2B'), or None if it claims none.
+
+    xmp may be any bytes-like object; PDF/A requires the metadata stream to
+    be unfiltered, so the raw file can be searched as well.
+    """
+    if xmp is None:
+        return None
+    part = _PDFA_PART.search(xmp)
+    if part is None:
+        return None
+    conformance = _PDFA_CONFORMANCE.search(xmp)
+    return part.group(1).decode('ascii') + (conformance.group(1).decode('ascii').upper() if conformance else '')
+
+def document_metadata(page_count: int, page_size: Optional[Tuple[float, float]], version: Optional[str],
+                      info: Dict[str, Any], pdfa: Optional[str]) -> Dict[str, Any]:
+    """
+    Build the document-level metadata every backend reports.
+
+    Args:
+        page_count: Number of pages
+        page_size: (width, height) of the first page in points, as displayed
+        version: PDF version, e.g. '1.7'
+        info: Info dictionary entries by PDF name (e.g. 'Title'); only
+            non-empty strings of INFO_FIELDS are kept
+        pdfa: PDF/A version claimed by the document (see pdfa_version)
+
+    Returns:
+        Metadata with 'page_count', 'page_width', 'page_height', 'pdf_version',
+        'pdfa_compliant' ('pdfa_version' when compliant) and the info fields
+    """
+    width, height = page_size or (0.0, 0.0)
+    metadata = {
+        'page_count': page_count,
+        'page_width': float(width),
+        'page_height': float(height),
+        'pdf_version': version or '',
+        'pdfa_compliant': pdfa is not None
+    }
+    if pdfa is not None:
+        metadata['pdfa_version'] = pdfa
+    for key, name in INFO_FIELDS.items():
+        value = info.get(name)
+        if isinstance(value, str) and value.strip():
+            metadata[key] = value.strip()
+    return metadata
+
+class PDFContent:
+    """Text and document-level metadata extracted from a single PDF."""
+
+    def __init__(self, pages: List[str], metadata: Optional[Dict[str, Any]] = None):
+        self.pages = pages
+        self.metadata = metadata or {}
+
+    @property
+    def text(self) -> str:
+        """Return the page texts joined the way PDFExtractor has always joined them."""
+        return "\n".join(self.pages)
+
+class PDFBackend(ABC):
+    """Base interface for PDF text extraction engines."""
+
+    @property
+    @abstractmethod
+    def backend_name(self) -> str:
+        """Return the name of the backend."""
+        pass
+
+    @classmethod
+    @abstractmethod
+    def is_available(cls) -> bool:
+        """Return True if the backend's underlying library can be imported."""
+        pass
+
+    @abstractmethod
+    def extract_stream(self, pdf_stream: BinaryIO) -> PDFContent:
+        """
+        Extract page texts from a seekable PDF stream.
+
+        Args:
+            pdf_stream: File-like object (BytesIO or mmap)
+
+        Returns:
+            Extracted page texts and metadata
+        """
+        pass
+
+    def extract_file(self, file_path: str) -> PDFContent:
+        """
+        Extract page texts from a PDF file.
+
+        The file is memory-mapped rather than read into memory, so the OS page
+        cache serves the reads and only the pages the parser touches are loaded.
+        """
+        with open(file_path, 'rb') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as pdf_map:
+                return self.extract_stream(pdf_map)
+
+    def extract_bytes(self, pdf_content: bytes) -> PDFContent:
+        """Extract page texts from in-memory PDF bytes."""
+        return self.extract_stream(BytesIO(pdf_content))
@@ -0,0 +1,71 @@
+import mmap
+from io import BytesIO
+from typing import BinaryIO, List, Optional, Union
+from .base import PDFBackend, PDFContent, document_metadata, pdfa_version
+
+class PdfiumBackend(PDFBackend):
+    """Native extraction with pypdfium2 (Chromium's PDFium engine)."""
+
+    @property
+    def backend_name(self) -> str:
+        return "pdfium"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            import pypdfium2  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def extract_file(self, file_path: str) -> PDFContent:
+        # PDFium does its own buffered reads from the path, no mapping needed
+        return self._extract(file_path)
+
+    def extract_bytes(self, pdf_content: bytes) -> PDFContent:
+        return self._extract(pdf_content)
+
+    def extract_stream(self, pdf_stream: BinaryIO) -> PDFContent:
+        if not hasattr(pdf_stream, 'readinto'):
+            pdf_stream.seek(0)
+            return self._extract(pdf_stream.read())
+        return self._extract(pdf_stream)
+
+    def _extract(self, source: Union[str, bytes, BinaryIO]) -> PDFContent:
+        import pypdfium2
+
+        document = pypdfium2.PdfDocument(source)
+        try:
+            pages: List[str] = []
+            page_size = None
+            for index in range(len(document)):
+                page = document[index]
+                if index == 0:
+                    page_size = page.get_size()
+                text_page = page.get_textpage()
+                # PDFium reports line breaks as CRLF, the other backends use LF
+                pages.append(text_page.get_text_range().replace('\r\n', '\n'))
+                text_page.close()
+                page.close()
+            version = document.get_version()
+            return PDFContent(pages, document_metadata(
+                len(pages),
+                page_size,
+                f"{version // 10}.{version % 10}" if version else None,
+                document.get_metadata_dict(),
+                self._pdfa_version(source)
+            ))
+        finally:
+            document.close()
+
+    @staticmethod
+    def _pdfa_version(source: Union[str, bytes, BinaryIO]) -> Optional[str]:
+        """Search the raw file for a PDF/A claim; PDFium does not expose the XMP stream."""
+        if isinstance(source, str):
+            with open(source, 'rb') as file:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as pdf_map:
+                    return pdfa_version(pdf_map)
+        if isinstance(source, BytesIO):
+            with source.getbuffer() as view:
+                return pdfa_version(view)
+        return pdfa_version(source)
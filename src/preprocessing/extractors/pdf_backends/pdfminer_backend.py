@@ -0,0 +1,85 @@
+from io import StringIO
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from .base import INFO_FIELDS, PDFBackend, PDFContent, document_metadata, header_version, pdfa_version
+
+class PdfminerBackend(PDFBackend):
+    """Layout-aware extraction with pdfminer.six."""
+
+    @property
+    def backend_name(self) -> str:
+        return "pdfminer"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            import pdfminer  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def extract_stream(self, pdf_stream: BinaryIO) -> PDFContent:
+        from pdfminer.converter import TextConverter
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+        from pdfminer.pdfparser import PDFParser
+
+        pdf_stream.seek(0)
+        version = header_version(pdf_stream.read(1024))
+        document = PDFDocument(PDFParser(pdf_stream))
+        resource_manager = PDFResourceManager(caching=True)
+        output = StringIO()
+        converter = TextConverter(resource_manager, output, laparams=LAParams())
+        interpreter = PDFPageInterpreter(resource_manager, converter)
+
+        pages: List[str] = []
+        page_size = None
+        try:
+            for page in PDFPage.create_pages(document):
+                if page_size is None:
+                    page_size = self._page_size(page)
+                interpreter.process_page(page)
+                # TextConverter terminates every page with a form feed
+                pages.append(output.getvalue().rstrip('\x0c'))
+                output.seek(0)
+                output.truncate(0)
+        finally:
+            converter.close()
+
+        return PDFContent(pages, document_metadata(len(pages), page_size, version,
+                                                   self._info(document), pdfa_version(self._xmp(document))))
+
+    @staticmethod
+    def _page_size(page: Any) -> Optional[Tuple[float, float]]:
+        """Return the displayed (width, height) of a pdfminer page."""
+        if not page.mediabox:
+            return None
+        x0, y0, x1, y1 = page.mediabox
+        width, height = abs(x1 - x0), abs(y1 - y0)
+        return (height, width) if page.rotate % 180 else (width, height)
+
+    @staticmethod
+    def _info(document: Any) -> Dict[str, Any]:
+        """Return the info dictionary entries of INFO_FIELDS as text."""
+        from pdfminer.pdftypes import resolve1
+        from pdfminer.utils import decode_text
+
+        info = {}
+        for entries in document.info:
+            for name in INFO_FIELDS.values():
+                value = resolve1(entries.get(name))
+                if isinstance(value, bytes):
+                    info[name] = decode_text(value)
+        return info
+
+    @staticmethod
+    def _xmp(document: Any) -> Optional[bytes]:
+        """Return the document's XMP metadata stream, if it has a readable one."""
+        from pdfminer.pdftypes import resolve1
+
+        try:
+            return resolve1(document.catalog.get('Metadata')).get_data()
+        except Exception:
+            # Missing or damaged XMP doesn't make the document unreadable
+            return None
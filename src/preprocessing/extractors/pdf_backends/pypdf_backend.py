@@ -0,0 +1,72 @@
+from typing import Any, BinaryIO, Dict
+from .base import INFO_FIELDS, PDFBackend, PDFContent, document_metadata, header_version, pdfa_version
+
+def reader_metadata(pdf_reader: Any) -> Dict[str, Any]:
+    """Return document metadata from an open pypdf or PyPDF2 PdfReader (their APIs agree here)."""
+    page_size = None
+    if pdf_reader.pages:
+        page = pdf_reader.pages[0]
+        width, height = float(page.mediabox.width), float(page.mediabox.height)
+        page_size = (height, width) if page.rotation % 180 else (width, height)
+
+    info = {}
+    if pdf_reader.metadata is not None:
+        # Indexing resolves indirect objects, iterating the dictionary does not
+        info = {name: pdf_reader.metadata[f'/{name}'] for name in INFO_FIELDS.values()
+                if f'/{name}' in pdf_reader.metadata}
+
+    xmp = None
+    root = pdf_reader.trailer['/Root']
+    if '/Metadata' in root:
+        try:
+            xmp = root['/Metadata'].get_data()
+        except Exception:
+            # A damaged XMP stream doesn't make the document unreadable
+            xmp = None
+
+    version = header_version(pdf_reader.pdf_header.encode('latin-1', 'replace'))
+    return document_metadata(len(pdf_reader.pages), page_size, version, info, pdfa_version(xmp))
+
+class PyPDF2Backend(PDFBackend):
+    """Pure-Python extraction with PyPDF2 (the service's original engine)."""
+
+    @property
+    def backend_name(self) -> str:
+        return "pypdf2"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            import PyPDF2  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def extract_stream(self, pdf_stream: BinaryIO) -> PDFContent:
+        import PyPDF2
+
+        pdf_reader = PyPDF2.PdfReader(pdf_stream)
+        pages = [page.extract_text() for page in pdf_reader.pages]
+        return PDFContent(pages, reader_metadata(pdf_reader))
+
+class PyPDFBackend(PDFBackend):
+    """Pure-Python extraction with pypdf, the maintained successor of PyPDF2."""
+
+    @property
+    def backend_name(self) -> str:
+        return "pypdf"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        try:
+            import pypdf  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def extract_stream(self, pdf_stream: BinaryIO) -> PDFContent:
+        import pypdf
+
+        pdf_reader = pypdf.PdfReader(pdf_stream)
+        pages = [page.extract_text() for page in pdf_reader.pages]
+        return PDFContent(pages, reader_metadata(pdf_reader))
@@ -0,0 +1,98 @@
+import threading
+from typing import Dict, List, Optional, Type
+from .base import PDFBackend
+from .pypdf_backend import PyPDF2Backend, PyPDFBackend
+from .pdfium_backend import PdfiumBackend
+from .pdfminer_backend import PdfminerBackend
+
+class BackendSelector:
+    """Chooses a PDF extraction backend per document from configuration and size."""
+
+    AUTO = 'auto'
+
+    def __init__(self,
+                 backend: str = AUTO,
+                 default_backend: str = 'pypdf2',
+                 fast_backends: Optional[List[str]] = None,
+                 fast_min_bytes: int = 0):
+        """
+        Args:
+            backend: Backend name to always use, or 'auto' for size-driven selection
+            default_backend: Backend used by 'auto' for documents below fast_min_bytes
+            fast_backends: Backends tried in order by 'auto' for large documents
+            fast_min_bytes: Size at which 'auto' switches to a fast backend
+        """
+        self._backends: Dict[str, Type[PDFBackend]] = {}
+        self._instances: Dict[str, PDFBackend] = {}
+        self._lock = threading.Lock()
+        self._register_default_backends()
+
+        self.backend = backend
+        self.default_backend = default_backend
+        self.fast_backends = fast_backends or []
+        self.fast_min_bytes = fast_min_bytes
+
+        if backend != self.AUTO:
+            self._validate_name(backend)
+        self._validate_name(default_backend)
+
+    def _register_default_backends(self) -> None:
+        """Register all bundled backends."""
+        for backend_class in (PyPDF2Backend, PyPDFBackend, PdfiumBackend, PdfminerBackend):
+            self.register_backend(backend_class)
+
+    def register_backend(self, backend_class: Type[PDFBackend]) -> None:
+        """
+        Register a PDF extraction backend.
+
+        Args:
+            backend_class: The backend class to register
+        """
+        backend = backend_class()
+        self._backends[backend.backend_name] = backend_class
+
+    def get_available_backends(self) -> List[str]:
+        """Return the registered backends whose libraries are installed."""
+        return [name for name, cls in self._backends.items() if cls.is_available()]
+
+    def get_backend(self, backend_name: str) -> PDFBackend:
+        """
+        Get a backend instance by name.
+
+        Raises:
+            ValueError: If the backend is unknown or its library is not installed
+        """
+        self._validate_name(backend_name)
+        backend = self._instances.get(backend_name)
+        if backend is None:
+            backend_class = self._backends[backend_name]
+            if not backend_class.is_available():
+                raise ValueError(f"PDF backend '{backend_name}' is not installed")
+            with self._lock:
+                backend = self._instances.setdefault(backend_name, backend_class())
+        return backend
+
+    def select(self, size_bytes: Optional[int] = None) -> PDFBackend:
+        """
+        Select the backend for a document.
+
+        Args:
+            size_bytes: Size of the PDF in bytes, if known
+
+        Returns:
+            The backend instance to extract the document with
+        """
+        if self.backend != self.AUTO:
+            return self.get_backend(self.backend)
+
+        if size_bytes is not None and size_bytes >= self.fast_min_bytes:
+            for name in self.fast_backends:
+                if name in self._backends and self._backends[name].is_available():
+                    return self.get_backend(name)
+
+        return self.get_backend(self.default_backend)
+
+    def _validate_name(self, backend_name: str) -> None:
+        if backend_name not in self._backends:
+            available = list(self._backends.keys())
+            raise ValueError(f"Unknown PDF backend: {backend_name}. Available backends: {available}")
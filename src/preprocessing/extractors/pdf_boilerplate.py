@@ -0,0 +1,159 @@
+import re
+from collections import Counter
+from itertools import chain, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from src.preprocessing.extractors.pdf_backends import PDFContent
+
+_DIGITS = re.compile(r'\d+')
+
+def line_fingerprint(line: str) -> str:
+    """
+    Return the fingerprint under which a line is counted across pages.
+
+    Whitespace is collapsed, case is folded and digit runs become '#', so a
+    running footer such as 'Page 3 of 20' fingerprints alike on every page.
+    """
+    return _DIGITS.sub('#', ' '.join(line.split()).casefold())
+
+class BoilerplateStripper:
+    """Removes headers, footers and page numbers repeated across the pages of a PDF.
+
+    Only the first and last edge_lines non-blank lines of each page are
+    fingerprinted and counted, once per page, in separate head and tail
+    counters. Fingerprints found on at least min_page_fraction of the pages
+    are boilerplate; on every page, the line nearest that edge with each of
+    them is removed. Both passes take time linear in the page count.
+    """
+
+    def __init__(self, edge_lines: int = 3, min_page_fraction: float = 0.6,
+                 min_pages: int = 3, sample_pages: int = 50):
+        """
+        Args:
+            edge_lines: Non-blank lines examined at the top and at the bottom of each page
+            min_page_fraction: Share of pages a line must recur on to be boilerplate
+            min_pages: Documents with fewer pages are left untouched
+            sample_pages: Pages buffered to find the boilerplate when streaming (see iter_strip)
+        """
+        if edge_lines <= 0:
+            raise ValueError("edge_lines must be positive")
+        if not 0 < min_page_fraction <= 1:
+            raise ValueError("min_page_fraction must be in (0, 1]")
+        if min_pages < 2:
+            raise ValueError("min_pages must be at least 2")
+        if sample_pages < min_pages:
+            raise ValueError("sample_pages must be at least min_pages")
+
+        self.edge_lines = edge_lines
+        self.min_page_fraction = min_page_fraction
+        self.min_pages = min_pages
+        self.sample_pages = sample_pages
+
+    def find_boilerplate(self, pages: List[str]) -> Tuple[Set[str], Set[str]]:
+        """Return the fingerprints of boilerplate lines at the top and at the bottom of pages."""
+        if len(pages) < self.min_pages:
+            return set(), set()
+
+        head: Counter = Counter()
+        tail: Counter = Counter()
+        for page in pages:
+            lines = (page or '').split('\n')
+            top, bottom = self._edge_indices(lines)
+            head.update({line_fingerprint(lines[index]) for index in top})
+            tail.update({line_fingerprint(lines[index]) for index in bottom})
+
+        return self._frequent(head, len(pages)), self._frequent(tail, len(pages))
+
+    def iter_strip(self, pages: Iterable[str], report: Optional[Dict[str, int]] = None) -> Iterator[str]:
+        """
+        Strip boilerplate from pages as they stream in.
+
+        The first sample_pages pages are buffered to find the boilerplate;
+        they and every later page are then stripped one at a time.
+
+        Args:
+            pages: Page texts in document order
+            report: Optional dict whose 'bytes_removed' and 'lines_removed'
+                counts are increased as pages are stripped
+
+        Returns:
+            Iterator over the stripped page texts
+        """
+        iterator = iter(pages)
+        sample = list(islice(iterator, self.sample_pages))
+        head, tail = self.find_boilerplate(sample)
+        return self._strip(chain(sample, iterator), head, tail, report)
+
+    def apply(self, content: PDFContent) -> PDFContent:
+        """
+        Strip boilerplate from every page of an extracted PDF.
+
+        All pages are counted, not just a sample. The UTF-8 bytes and lines
+        removed are recorded in metadata 'boilerplate_bytes_removed' and
+        'boilerplate_lines_removed'.
+
+        Args:
+            content: Backend extraction result
+
+        Returns:
+            The same content object with boilerplate removed from its pages
+        """
+        report = {'bytes_removed': 0, 'lines_removed': 0}
+        head, tail = self.find_boilerplate(content.pages)
+        content.pages = list(self._strip(content.pages, head, tail, report))
+        content.metadata['boilerplate_bytes_removed'] = report['bytes_removed']
+        content.metadata['boilerplate_lines_removed'] = report['lines_removed']
+        return content
+
+    def _strip(self, pages: Iterable[str], head: Set[str], tail: Set[str],
+               report: Optional[Dict[str, int]]) -> Iterator[str]:
+        for page in pages:
+            if not (head or tail) or not page:
+                yield page
+                continue
+            lines = page.split('\n')
+            top, bottom = self._edge_indices(lines)
+            drop = self._matches(lines, top, head) | self._matches(lines, bottom, tail)
+            if not drop:
+                yield page
+                continue
+            stripped = '\n'.join(line for index, line in enumerate(lines) if index not in drop)
+            if report is not None:
+                report['bytes_removed'] += (len(page.encode('utf-8', 'surrogatepass')) -
+                                            len(stripped.encode('utf-8', 'surrogatepass')))
+                report['lines_removed'] += len(drop)
+            yield stripped
+
+    @staticmethod
+    def _matches(lines: List[str], indices: List[int], fingerprints: Set[str]) -> Set[int]:
+        """Return the edge lines with boilerplate fingerprints, each fingerprint only nearest the edge.
+
+        A running header or footer occurs once per page, so e.g. a table of
+        contents ending in page numbers loses only the page's own number.
+        """
+        matched, seen = set(), set()
+        for index in indices:
+            fingerprint = line_fingerprint(lines[index])
+            if fingerprint in fingerprints and fingerprint not in seen:
+                seen.add(fingerprint)
+                matched.add(index)
+        return matched
+
+    def _frequent(self, counts: Counter, page_count: int) -> Set[str]:
+        """Return fingerprints on at least min_page_fraction of page_count pages (and at least two)."""
+        return {fingerprint for fingerprint, count in counts.items()
+                if count >= 2 and count / page_count >= self.min_page_fraction}
+
+    def _edge_indices(self, lines: List[str]) -> Tuple[List[int], List[int]]:
+        """Return the indices of the first and of the last edge_lines non-blank lines."""
+        top, bottom = [], []
+        for index, line in enumerate(lines):
+            if line.strip():
+                top.append(index)
+                if len(top) == self.edge_lines:
+                    break
+        for index in range(len(lines) - 1, -1, -1):
+            if lines[index].strip():
+                bottom.append(index)
+                if len(bottom) == self.edge_lines:
+                    break
+        return top, bottom
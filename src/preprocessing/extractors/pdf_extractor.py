@@ -1,11 +1,57 @@
 import base64
-from typing import Optional
-import PyPDF2
-from io import BytesIO
+import os
+from typing import Any, Dict, List, Optional, Tuple
+from src.config import Config
+from src.preprocessing.extractors.pdf_backends import BackendSelector, PDFContent
+from src.preprocessing.extractors.pdf_boilerplate import BoilerplateStripper
+from src.preprocessing.extractors.pdf_ocr import PageOCR
 
 class PDFExtractor:
     """Handles extraction of text from PDF documents."""
 
+    def __init__(self,
+                 backend: Optional[str] = None,
+                 default_backend: Optional[str] = None,
+                 fast_backends: Optional[List[str]] = None,
+                 fast_backend_min_bytes: Optional[int] = None,
+                 enable_ocr: Optional[bool] = None,
+                 strip_boilerplate: Optional[bool] = None):
+        """
+        Initialize the extractor and its backend selection policy.
+
+        Args:
+            backend: Backend name, or 'auto' to choose per document (default: Config.PDF_BACKEND)
+            default_backend: Backend 'auto' uses for small documents
+            fast_backends: Backends 'auto' tries, in order, for large documents
+            fast_backend_min_bytes: Size at which 'auto' switches to a fast backend
+            enable_ocr: OCR pages without extractable text (default: Config.ENABLE_OCR)
+            strip_boilerplate: Remove headers and footers repeated across pages
+                (default: Config.STRIP_PDF_BOILERPLATE)
+        """
+        self.selector = BackendSelector(
+            backend=backend or Config.PDF_BACKEND,
+            default_backend=default_backend or Config.PDF_DEFAULT_BACKEND,
+            fast_backends=fast_backends if fast_backends is not None else Config.PDF_FAST_BACKENDS,
+            fast_min_bytes=(fast_backend_min_bytes if fast_backend_min_bytes is not None
+                            else Config.PDF_FAST_BACKEND_MIN_BYTES)
+        )
+
+        enable_ocr = Config.ENABLE_OCR if enable_ocr is None else enable_ocr
+        self.ocr = PageOCR(
+            min_text_chars=Config.OCR_MIN_TEXT_CHARS,
+            max_workers=Config.OCR_MAX_WORKERS,
+            dpi=Config.OCR_DPI,
+            language=Config.OCR_LANGUAGE
+        ) if enable_ocr else None
+
+        strip_boilerplate = Config.STRIP_PDF_BOILERPLATE if strip_boilerplate is None else strip_boilerplate
+        self.boilerplate = BoilerplateStripper(
+            edge_lines=Config.PDF_BOILERPLATE_EDGE_LINES,
+            min_page_fraction=Config.PDF_BOILERPLATE_MIN_PAGE_FRACTION,
+            min_pages=Config.PDF_BOILERPLATE_MIN_PAGES,
+            sample_pages=Config.PDF_BOILERPLATE_SAMPLE_PAGES
+        ) if strip_boilerplate else None
+
     def extract(self, content: Optional[str] = None, file_path: Optional[str] = None) -> str:
         """
         Extract text from PDF content or file.
@@ -17,17 +63,39 @@ class PDFExtractor:
         Returns:
             Extracted text content
         """
+        return self.extract_document(content, file_path)[0]
+
+    def extract_document(self, content: Optional[str] = None,
+                         file_path: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+        """
+        Extract text and document metadata from PDF content or file in one read.
+
+        Args:
+            content: Base64 encoded PDF content or raw PDF text
+            file_path: Path to PDF file (used if content is None)
+
+        Returns:
+            Extracted text and the document's metadata: 'page_count',
+            'page_width'/'page_height' (first page, points), 'pdf_version',
+            'pdfa_compliant' and, where present, 'pdfa_version' and info
+            fields such as 'title' and 'author'; with boilerplate stripping
+            also 'boilerplate_bytes_removed' and 'boilerplate_lines_removed'
+
+        Raises:
+            ValueError: If the PDF cannot be read
+        """
         try:
             if file_path:
-                return self._extract_from_file(file_path)
+                extracted = self._extract_from_file(file_path)
             elif content:
                 pdf_content = self._decode_pdf_content(content)
-                return self._extract_text_from_pdf(pdf_content)
+                extracted = self._extract_text_from_pdf(pdf_content)
             else:
                 raise ValueError("Either content or file_path must be provided")
 
         except Exception as e:
             raise ValueError(f"Failed to extract text from PDF: {str(e)}")
+        return extracted.text, extracted.metadata
 
     def _decode_pdf_content(self, content: str) -> bytes:
         """
@@ -44,7 +112,7 @@ class PDFExtractor:
         except Exception:
             raise ValueError("Invalid PDF content encoding")
 
-    def _extract_from_file(self, file_path: str) -> str:
+    def _extract_from_file(self, file_path: str) -> PDFContent:
         """
         Extract text directly from a PDF file.
 
@@ -52,15 +120,14 @@ class PDFExtractor:
             file_path: Path to PDF file
 
         Returns:
-            Extracted text
+            Extracted text and metadata
         """
         try:
-            with open(file_path, 'rb') as file:
-                return self._extract_text_from_pdf(file.read())
+            return self._read_file(file_path)
         except Exception as e:
             raise ValueError(f"Failed to read PDF file: {str(e)}")
 
-    def _extract_text_from_pdf(self, pdf_content: bytes) -> str:
+    def _extract_text_from_pdf(self, pdf_content: bytes) -> PDFContent:
         """
         Extract text from PDF bytes.
 
@@ -68,17 +135,29 @@ class PDFExtractor:
             pdf_content: PDF content as bytes
 
         Returns:
-            Extracted text
+            Extracted text and metadata
         """
         try:
-            pdf_file = BytesIO(pdf_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-
-            text = []
-            for page in pdf_reader.pages:
-                text.append(page.extract_text())
-
-            return "\n".join(text)
-
+            return self._read_bytes(pdf_content)
         except Exception as e:
-            raise ValueError(f"Failed to extract text from PDF content: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Failed to extract text from PDF content: {str(e)}")
+
+    def _read_file(self, file_path: str) -> PDFContent:
+        """Extract a PDF file with the backend selected for its size."""
+        backend = self.selector.select(os.path.getsize(file_path))
+        content = backend.extract_file(file_path)
+        if self.ocr:
+            content = self.ocr.apply(content, file_path)
+        if self.boilerplate:
+            content = self.boilerplate.apply(content)
+        return content
+
+    def _read_bytes(self, pdf_content: bytes) -> PDFContent:
+        """Extract in-memory PDF bytes with the backend selected for their size."""
+        backend = self.selector.select(len(pdf_content))
+        content = backend.extract_bytes(pdf_content)
+        if self.ocr:
+            content = self.ocr.apply(content, pdf_content)
+        if self.boilerplate:
+            content = self.boilerplate.apply(content)
+        return content
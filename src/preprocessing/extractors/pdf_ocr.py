@@ -0,0 +1,99 @@
+from typing import Dict, List, Union
+from src.preprocessing.extractors.pdf_backends import PDFContent
+from src.utils.process_pool import get_process_pool
+
+def _ocr_pages(source: Union[str, bytes], page_indices: List[int], dpi: int, language: str) -> Dict[int, str]:
+    """
+    Rasterize and OCR a group of pages of one PDF.
+
+    Runs in a worker process, so it opens the document itself and handles a
+    whole group of pages to amortize the cost of shipping the source.
+    """
+    import pypdfium2
+    import pytesseract
+
+    document = pypdfium2.PdfDocument(source)
+    try:
+        results = {}
+        for index in page_indices:
+            page = document[index]
+            image = page.render(scale=dpi / 72).to_pil()
+            results[index] = pytesseract.image_to_string(image, lang=language)
+            page.close()
+        return results
+    finally:
+        document.close()
+
+class PageOCR:
+    """OCRs only the pages of a PDF whose extracted text is missing or too short."""
+
+    def __init__(self, min_text_chars: int = 20, max_workers: int = 2, dpi: int = 200, language: str = 'eng'):
+        """
+        Args:
+            min_text_chars: Pages with fewer non-whitespace characters are OCR'd
+            max_workers: Size of the OCR process pool
+            dpi: Rasterization resolution
+            language: Tesseract language code
+        """
+        if min_text_chars < 0:
+            raise ValueError("min_text_chars must be non-negative")
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        if not self.is_available():
+            raise RuntimeError("OCR requires the pypdfium2 and pytesseract packages")
+
+        self.min_text_chars = min_text_chars
+        self.max_workers = max_workers
+        self.dpi = dpi
+        self.language = language
+
+    @staticmethod
+    def is_available() -> bool:
+        """Return True if the rasterizer and OCR engine can be imported."""
+        try:
+            import pypdfium2  # noqa: F401
+            import pytesseract  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def find_textless_pages(self, pages: List[str]) -> List[int]:
+        """Return indices of pages whose text is empty or shorter than the threshold."""
+        return [
+            index for index, text in enumerate(pages)
+            if len(''.join((text or '').split())) < max(self.min_text_chars, 1)
+        ]
+
+    def apply(self, content: PDFContent, source: Union[str, bytes]) -> PDFContent:
+        """
+        OCR the text-less pages of an extracted PDF and splice the results in.
+
+        Args:
+            content: Backend extraction result
+            source: File path or bytes of the same PDF, used for rasterizing
+
+        Returns:
+            The same content object with OCR text in place of the empty pages
+        """
+        page_indices = self.find_textless_pages(content.pages)
+        if not page_indices:
+            return content
+
+        for index, text in self._run_ocr(source, page_indices).items():
+            content.pages[index] = text
+        content.metadata['ocr_page_count'] = len(page_indices)
+        return content
+
+    def _run_ocr(self, source: Union[str, bytes], page_indices: List[int]) -> Dict[int, str]:
+        """OCR the given pages in the shared pool, one contiguous group per worker."""
+        group_count = min(self.max_workers, len(page_indices))
+        group_size = -(-len(page_indices) // group_count)
+        groups = [page_indices[i:i + group_size] for i in range(0, len(page_indices), group_size)]
+
+        pool = get_process_pool('ocr', self.max_workers)
+        futures = [pool.submit(_ocr_pages, source, group, self.dpi, self.language) for group in groups]
+
+        results: Dict[int, str] = {}
+        for future in futures:
+            results.update(future.result())
+        return results
@@ -1,27 +1,46 @@
+import re
+from typing import Any, Dict, Optional, Tuple
+
+_BLANK_LINE_RUNS = re.compile(r'\n{3,}')
+
 class TextExtractor:
     """Handles extraction and cleaning of plain text documents."""
     
-    def extract(self, content: str) -> str:
+    def extract(self, content: Optional[str] = None, file_path: Optional[str] = None) -> str:
         """
         Extract and clean text content.
+
+        Whitespace is collapsed within each line, but line breaks are kept
+        and runs of blank lines become one blank line, so structure-aware
+        chunkers still see headings, list items and paragraph breaks.
         
         Args:
             content: Raw text content
+            file_path: Path to a UTF-8 text file (used if content is empty)
             
         Returns:
             Cleaned text content
         """
-        # Remove extra whitespace
-        cleaned_text = ' '.join(content.split())
-        
-        # Basic text cleaning
-        cleaned_text = self._clean_text(cleaned_text)
-        
-        return cleaned_text
+        if not content and file_path:
+            with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
+                content = file.read()
+        content = content or ''
+
+        # Remove extra whitespace and clean each line, keeping the line layout
+        lines = content.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        cleaned_text = '\n'.join(self._clean_text(' '.join(line.split())) for line in lines)
+
+        # Keep paragraph breaks as single blank lines
+        return _BLANK_LINE_RUNS.sub('\n\n', cleaned_text).strip('\n')
     
+    def extract_document(self, content: Optional[str] = None,
+                         file_path: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+        """Extract and clean text content (see extract); plain text carries no document metadata."""
+        return self.extract(content, file_path), {}
+
     def _clean_text(self, text: str) -> str:
         """
-        Apply basic text cleaning operations.
+        Apply basic text cleaning operations to one line.
         
         Args:
             text: Input text
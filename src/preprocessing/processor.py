@@ -1,5 +1,6 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator
 from typing import Optional
+from src.chunking.fixed_size_chunker import FixedSizeChunker
 from src.preprocessing.extractors.text_extractor import TextExtractor
 from src.preprocessing.extractors.pdf_extractor import PDFExtractor
 
@@ -15,7 +16,11 @@ class PreprocessingModule:
 
     def process(self, documents: List[Dict[str, Any]], options: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Process documents according to their type and specified options."""
-        processed_docs = []
+        return list(self.iter_process(documents, options))
+
+    def iter_process(self, documents: Iterable[Dict[str, Any]],
+                     options: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Lazily process documents one at a time as they are consumed."""
         options = options or {}
 
         for doc in documents:
@@ -27,10 +32,10 @@ class PreprocessingModule:
 
             # Handle directory type differently
             if doc_type == 'directory':
-                processed_docs.append({
+                yield {
                     'content': '',  # Content will be processed by SimpleDirectoryReader
                     'metadata': metadata
-                })
+                }
                 continue
 
             # Get appropriate extractor for non-directory types
@@ -38,16 +43,20 @@ class PreprocessingModule:
             if not extractor:
                 raise ValueError(f"Unsupported document type: {doc_type}")
 
-            # Extract and clean text
-            processed_content = extractor.extract(content=content, file_path=file_path)
+            # Extract and clean text, with metadata read from the document itself
+            processed_content, extracted_metadata = extractor.extract_document(content=content, file_path=file_path)
+            if extracted_metadata:
+                # Metadata sent by the client takes precedence
+                metadata = {**extracted_metadata, **metadata}
 
-            processed_docs.append({
+            yield {
                 'content': processed_content,
                 'metadata': metadata
-            })
+            }
 
-        return processed_docs
-    
     def _chunk_text(self, text: str, chunk_size: int) -> List[str]:
-        """Split text into chunks of specified size."""
-        return [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+        """Split text into chunks of specified size (see FixedSizeChunker)."""
+        if not text:
+            return []
+        chunks = FixedSizeChunker().chunk_records(text, {}, {'chunk_size': chunk_size, 'snap_tolerance': 0})
+        return [chunk.content for chunk in chunks]
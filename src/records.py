@@ -0,0 +1,71 @@
+from typing import Any, Dict, Optional
+
+class Document:
+    """A document passed between pipeline stages."""
+
+    __slots__ = ('content', 'metadata')
+
+    def __init__(self, content: Any, metadata: Dict[str, Any]):
+        self.content = content
+        self.metadata = metadata
+
+    @classmethod
+    def from_dict(cls, document: Dict[str, Any]) -> 'Document':
+        """Wrap a {'content', 'metadata'} dict without copying its metadata."""
+        return cls(document.get('content', ''), document.get('metadata', {}))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'content': self.content, 'metadata': self.metadata}
+
+class Chunk:
+    """A chunk passed between pipeline stages, sharing its document's metadata.
+
+    base holds the metadata common to every chunk of a document (document
+    metadata plus e.g. the strategy name) and is shared by them, never
+    modified through a chunk. fields holds the chunk's own entries, which
+    override base; set() adds to it. The merged metadata dict is built only
+    when a chunk leaves the pipeline (to_dict), so per-chunk memory is the
+    record and its few own fields rather than a full copy of the document's
+    metadata.
+    """
+
+    __slots__ = ('content', 'base', 'fields')
+
+    def __init__(self, content: str, base: Dict[str, Any], fields: Optional[Dict[str, Any]] = None):
+        self.content = content
+        self.base = base
+        self.fields = fields
+
+    @classmethod
+    def from_dict(cls, chunk: Dict[str, Any]) -> 'Chunk':
+        """Wrap a {'content', 'metadata'} dict without copying its metadata."""
+        return cls(chunk.get('content', ''), chunk.get('metadata', {}))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return metadata entry key of this chunk."""
+        if self.fields is not None and key in self.fields:
+            return self.fields[key]
+        return self.base.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Set metadata entry key for this chunk only."""
+        if self.fields is None:
+            self.fields = {key: value}
+        else:
+            self.fields[key] = value
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Return a new dict of the chunk's merged metadata."""
+        return {**self.base, **self.fields} if self.fields else dict(self.base)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'content': self.content, 'metadata': self.metadata}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Chunk):
+            return NotImplemented
+        return self.content == other.content and self.metadata == other.metadata
+
+    def __repr__(self) -> str:
+        return f"Chunk(content={self.content!r}, metadata={self.metadata!r})"
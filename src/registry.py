@@ -0,0 +1,95 @@
+import gc
+import importlib
+from typing import Any, Mapping, Optional
+from flask import Flask, current_app
+from src.cache import ResultCache, SeenHashStore
+from src.config import Config
+from src.chunking.manager import ChunkerManager
+from src.indexing.strategy_manager import StrategyManager
+from src.output.formatter import OutputFormatter
+from src.pipeline.builder import PipelineBuilder
+from src.preprocessing.processor import PreprocessingModule
+
+class ComponentRegistry:
+    """Builds the pipeline components once per application and shares them across requests.
+
+    Every component held here is safe to use from concurrent requests: extractors,
+    chunkers and indexers keep no per-call state, and strategy instances that are
+    created lazily are guarded by their manager's lock.
+    """
+
+    EXTENSION_KEY = 'components'
+
+    # Heavy dependencies imported lazily by individual strategies and backends
+    WARMUP_MODULES = ['llama_index.core.readers', 'nltk', 'PyPDF2']
+    WARMUP_TEXT = "Warm up the sentence models. This text is discarded."
+
+    def __init__(self, settings: Optional[Mapping[str, Any]] = None):
+        """
+        Args:
+            settings: Configuration values overriding Config for the result
+                cache and the dedup seen store, e.g. a Flask app.config
+        """
+        self.settings = settings or {}
+        self.preprocessor = PreprocessingModule()
+        self.strategy_manager = StrategyManager()
+        self.chunker_manager = ChunkerManager()
+        self.output_formatter = OutputFormatter()
+        self.seen_store = SeenHashStore(
+            self._setting('DEDUP_SEEN_STORE_PATH'),
+            bloom_bits=self._setting('DEDUP_BLOOM_BITS'),
+            bloom_hashes=self._setting('DEDUP_BLOOM_HASHES'),
+            max_clients=self._setting('DEDUP_BLOOM_MAX_CLIENTS')
+        ) if self._setting('DEDUP_SEEN_STORE_ENABLED') else None
+        self.pipeline_builder = PipelineBuilder(
+            self.preprocessor,
+            self.strategy_manager,
+            self.chunker_manager,
+            self.output_formatter,
+            seen_store=self.seen_store
+        )
+        self.result_cache = ResultCache(
+            self._setting('RESULT_CACHE_PATH'),
+            ttl_seconds=self._setting('RESULT_CACHE_TTL_SECONDS'),
+            max_bytes=self._setting('RESULT_CACHE_MAX_BYTES'),
+            max_entry_bytes=self._setting('RESULT_CACHE_MAX_ENTRY_BYTES')
+        ) if self._setting('RESULT_CACHE_ENABLED') else None
+        # Settings the components were built with that change ingest output;
+        # part of every result cache key
+        self.cache_namespace = {name: getattr(Config, name) for name in Config.RESULT_CACHE_KEY_SETTINGS}
+
+    def _setting(self, name: str) -> Any:
+        return self.settings.get(name, getattr(Config, name))
+
+    def init_app(self, app: Flask) -> None:
+        """Attach the registry to a Flask application."""
+        app.extensions[self.EXTENSION_KEY] = self
+
+    def warmup(self) -> None:
+        """Import lazily loaded dependencies and load shared models up front."""
+        for module_name in self.WARMUP_MODULES:
+            try:
+                importlib.import_module(module_name)
+            except ImportError:
+                continue
+
+        # Chunking a sample sentence loads each chunker's models (e.g. the punkt
+        # models of every configured language)
+        for strategy_name in self.chunker_manager.get_available_strategies():
+            chunker = self.chunker_manager.get_strategy(strategy_name)
+            chunker.chunk_document(self.WARMUP_TEXT, {})
+
+def prefork_warmup(app: Flask) -> None:
+    """
+    Warm an application in the gunicorn master before workers are forked.
+
+    Loads shared modules and models once, then moves every object that exists
+    at this point into the permanent GC generation. Forked workers never
+    touch those objects' GC headers, so their pages stay shared copy-on-write.
+    """
+    app.extensions[ComponentRegistry.EXTENSION_KEY].warmup()
+    gc.freeze()
+
+def get_components() -> ComponentRegistry:
+    """Return the component registry of the current application."""
+    return current_app.extensions[ComponentRegistry.EXTENSION_KEY]
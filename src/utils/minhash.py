@@ -0,0 +1,161 @@
+import re
+import unicodedata
+import zlib
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_WORD = re.compile(r'\w+')
+_EMPTY = np.empty(0, dtype=np.uint64)
+
+def shingle_hashes(text: str, shingle_size: int) -> np.ndarray:
+    """
+    Return 64-bit hashes of the word shingles of text.
+
+    Words are taken after NFKC normalization and case folding; each is hashed
+    once with CRC-32 and the hashes of shingle_size consecutive words are
+    combined with a vectorized polynomial. Texts shorter than one shingle give
+    a single hash of all their words; texts without words give none.
+    """
+    words = _WORD.findall(unicodedata.normalize('NFKC', text).casefold())
+    if not words:
+        return _EMPTY
+    word_hashes = np.fromiter((zlib.crc32(word.encode('utf-8', 'surrogatepass')) for word in words),
+                              dtype=np.uint64, count=len(words))
+    width = min(shingle_size, len(words))
+    count = len(words) - width + 1
+    combined = word_hashes[:count].copy()
+    for offset in range(1, width):
+        combined = combined * np.uint64(0x100000001B3) + word_hashes[offset:offset + count]
+    return combined
+
+def choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    Return (bands, rows) with bands * rows == num_perm for an LSH threshold.
+
+    Picks the split whose S-curve midpoint (1/bands) ** (1/rows) is closest
+    to threshold, so pairs near the threshold are found with about even odds
+    and pairs well above it almost surely.
+    """
+    best = None
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        distance = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or distance < best[0]:
+            best = (distance, bands, rows)
+    return best[1], best[2]
+
+class MinHasher:
+    """Computes MinHash signatures for many texts at once with NumPy.
+
+    Permutations are multiply-shift hashes h(x) = (a * x + b) >> 32 over
+    64-bit shingle hashes (wrapping arithmetic), giving 32-bit signature
+    values. Shingles of a whole batch are hashed in one matrix operation and
+    reduced per text with np.minimum.reduceat.
+    """
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 3, seed: int = 1):
+        if num_perm <= 0 or shingle_size <= 0:
+            raise ValueError("num_perm and shingle_size must be positive")
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2 ** 63, size=(num_perm, 1), dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, size=(num_perm, 1), dtype=np.uint64)
+
+    def signatures(self, texts: Sequence[str], max_block: int = 1 << 15) -> np.ndarray:
+        """
+        Return a (len(texts), num_perm) uint32 array of MinHash signatures.
+
+        Texts without words get an all-ones signature (they match nothing
+        but each other). max_block bounds the shingles hashed per matrix
+        operation, capping temporary memory at num_perm * max_block * 8 bytes.
+        """
+        signatures = np.full((len(texts), self.num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+        hashes = [shingle_hashes(text, self.shingle_size) for text in texts]
+        start = 0
+        while start < len(texts):
+            # Group consecutive texts into one block of at most max_block shingles
+            end, size = start, 0
+            while end < len(texts) and (end == start or size + len(hashes[end]) <= max_block):
+                size += len(hashes[end])
+                end += 1
+            self._fill(signatures, hashes, start, end)
+            start = end
+        return signatures
+
+    def _fill(self, signatures: np.ndarray, hashes: List[np.ndarray], start: int, end: int) -> None:
+        rows = [index for index in range(start, end) if len(hashes[index])]
+        if not rows:
+            return
+        block = np.concatenate([hashes[index] for index in rows])
+        offsets = np.cumsum([0] + [len(hashes[index]) for index in rows[:-1]])
+        with np.errstate(over='ignore'):
+            permuted = (self._a * block + self._b) >> np.uint64(32)
+        signatures[rows] = np.minimum.reduceat(permuted, offsets, axis=1).T.astype(np.uint32)
+
+class LSHIndex:
+    """Banded LSH index finding earlier signatures similar to a new one.
+
+    Candidates sharing any band bucket are verified by the fraction of equal
+    signature values, an unbiased estimate of their Jaccard similarity.
+    Buckets are keyed by the hash of each band and signatures are kept in one
+    growing array, so an indexed signature costs about num_perm * 4 bytes
+    plus one dict entry per band.
+    """
+
+    def __init__(self, num_perm: int, threshold: float):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.num_perm = num_perm
+        self.threshold = threshold
+        self.bands, self.rows = choose_bands(num_perm, threshold)
+        self._buckets: List[Dict[int, object]] = [{} for _ in range(self.bands)]
+        self._signatures = np.empty((64, num_perm), dtype=np.uint32)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _band_keys(self, signature: np.ndarray) -> Iterator[int]:
+        for band in range(self.bands):
+            yield hash(signature[band * self.rows:(band + 1) * self.rows].tobytes())
+
+    def query(self, signature: np.ndarray) -> Optional[Tuple[int, float]]:
+        """Return (position, similarity) of the most similar indexed signature at or above threshold."""
+        candidates = set()
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            found = bucket.get(key)
+            if found is None:
+                continue
+            if isinstance(found, list):
+                candidates.update(found)
+            else:
+                candidates.add(found)
+        if not candidates:
+            return None
+        positions = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+        similarities = np.count_nonzero(self._signatures[positions] == signature, axis=1) / self.num_perm
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+        return int(positions[best]), float(similarities[best])
+
+    def add(self, signature: np.ndarray) -> int:
+        """Index signature, returning its position."""
+        position = self._count
+        if position == len(self._signatures):
+            self._signatures = np.concatenate([self._signatures, np.empty_like(self._signatures)])
+        self._signatures[position] = signature
+        self._count += 1
+        for bucket, key in zip(self._buckets, self._band_keys(signature)):
+            found = bucket.get(key)
+            if found is None:
+                bucket[key] = position
+            elif isinstance(found, list):
+                found.append(position)
+            else:
+                bucket[key] = [found, position]
+        return position
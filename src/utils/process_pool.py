@@ -0,0 +1,53 @@
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict
+
+_pools: Dict[str, ProcessPoolExecutor] = {}
+_pool_sizes: Dict[str, int] = {}
+_pools_lock = threading.Lock()
+
+# Workers are started from a clean server process rather than forked from
+# the (threaded) service process, where a fork can copy held locks
+_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+def get_process_pool(name: str, max_workers: int) -> ProcessPoolExecutor:
+    """
+    Return a shared, lazily created process pool.
+
+    Pools are keyed by name so unrelated CPU-bound stages (OCR, tokenization)
+    stay bounded independently and are reused across requests instead of
+    paying process start-up on every call.
+
+    Args:
+        name: Pool identifier
+        max_workers: Upper bound on worker processes; every caller of a pool must agree on it
+
+    Returns:
+        The process pool registered under name
+
+    Raises:
+        ValueError: If the pool under name was created with a different max_workers
+    """
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=max_workers,
+                                       mp_context=multiprocessing.get_context(_START_METHOD))
+            _pools[name] = pool
+            _pool_sizes[name] = max_workers
+        elif _pool_sizes[name] != max_workers:
+            raise ValueError(f"Process pool '{name}' already exists with "
+                             f"max_workers={_pool_sizes[name]}, not {max_workers}")
+        return pool
+
+def shutdown_process_pools() -> None:
+    """Shut down every shared process pool."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        _pools.clear()
+        _pool_sizes.clear()
+
+atexit.register(shutdown_process_pools)
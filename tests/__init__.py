@@ -1 +1,13 @@
 """Test package initialization."""
+import os
+import shutil
+import tempfile
+import unittest
+from typing import Any, Dict
+
+def isolated_settings(test_case: unittest.TestCase) -> Dict[str, Any]:
+    """Return config overrides keeping the result cache and seen store in a directory removed after the test."""
+    directory = tempfile.mkdtemp(prefix='indexing-service-test-')
+    test_case.addCleanup(shutil.rmtree, directory, True)
+    return {'RESULT_CACHE_PATH': os.path.join(directory, 'result_cache.sqlite3'),
+            'DEDUP_SEEN_STORE_PATH': os.path.join(directory, 'seen_hashes.sqlite3')}
@@ -2,10 +2,11 @@ import unittest
 import os
 import json
 from src.main import create_app
+from tests import isolated_settings
 
 class TestPDFChunkingFlow(unittest.TestCase):
     def setUp(self):
-        self.app = create_app()
+        self.app = create_app(isolated_settings(self))
         self.client = self.app.test_client()
         self.test_docs_dir = "test_docs"
 
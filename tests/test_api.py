@@ -1,12 +1,17 @@
 import unittest
 import tempfile
 import os
+import gzip
+import uuid
+from unittest import mock
+from src.config import Config
 from src.main import create_app
+from tests import isolated_settings
 import json
 
 class TestAPI(unittest.TestCase):
     def setUp(self):
-        self.app = create_app()
+        self.app = create_app(isolated_settings(self))
         self.client = self.app.test_client()
         # Create a temporary directory for testing
         self.test_dir = tempfile.mkdtemp()
@@ -111,6 +116,397 @@ class TestAPI(unittest.TestCase):
                 print(f"\nWARNING: Document {idx} missing strategy field in metadata")
                 print("Expected 'simple_directory', got metadata:", json.dumps(metadata, indent=2))
 
+    def test_ingest_sentence_chunker_processes_every_document(self):
+        """Test chunking strategies run over all documents through the pipeline."""
+        data = {
+            "client_id": "test_client",
+            "documents": [
+                {
+                    "content": "First document opens here. It has a second sentence.",
+                    "type": "txt",
+                    "metadata": {"source": "first.txt"}
+                },
+                {
+                    "content": "Second document opens here. It also has a second sentence.",
+                    "type": "txt",
+                    "metadata": {"source": "second.txt"}
+                }
+            ],
+            "indexing_strategy": "sentence_chunker"
+        }
+
+        response = self.client.post('/api/ingest', json=data)
+        self.assertEqual(response.status_code, 200)
+
+        result = response.get_json()
+        sources = {chunk['metadata']['source'] for chunk in result}
+        self.assertEqual(sources, {'first.txt', 'second.txt'})
+        self.assertTrue(all(chunk['metadata']['strategy'] == 'sentence_chunker' for chunk in result))
+
+    def test_ingest_chunk_param_sweep(self):
+        """Test a chunk_params list yields one tagged chunking variant per set."""
+        content = ("The first sentence is here. The second sentence follows. "
+                   "A third sentence appears. The fourth sentence ends it.")
+        data = {
+            "client_id": "test_client",
+            "documents": [{"content": content, "type": "txt", "metadata": {"source": "sweep.txt"}}],
+            "indexing_strategy": "sentence_chunker",
+            "chunk_params": [
+                {"config_id": "pairs", "max_sentences_per_chunk": 2, "overlap_sentences": 0},
+                {"max_sentences_per_chunk": 4, "overlap_sentences": 0}
+            ]
+        }
+
+        response = self.client.post('/api/ingest', json=data)
+        self.assertEqual(response.status_code, 200)
+        config_ids = [chunk['metadata']['chunk_config_id'] for chunk in response.get_json()]
+        self.assertEqual(config_ids, ['pairs', 'pairs', 1])
+
+        response = self.client.post('/api/ingest', json={**data, "chunk_params": []})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/api/ingest', json={**data, "indexing_strategy": "json_index"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_ingest_error_responses(self):
+        """Test request errors surface as status codes before streaming starts."""
+        base = {"documents": [{"content": "Some text here.", "type": "txt"}]}
+
+        response = self.client.post('/api/ingest', json={**base, "indexing_strategy": "no_such_strategy"})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post('/api/ingest', json={
+            **base,
+            "indexing_strategy": "sentence_chunker",
+            "chunk_params": {"max_sentences_per_chunk": 2, "overlap_sentences": 2}
+        })
+        self.assertEqual(response.status_code, 500)
+        self.assertIn('overlap_sentences', response.get_json()['error'])
+
+        response = self.client.post('/api/ingest', json={
+            **base,
+            "indexing_strategy": "sentence_chunker",
+            "chunk_params": {"language": "klingon"}
+        })
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], "unsupported language 'klingon'")
+
+    def test_ingest_ndjson_body(self):
+        """Test NDJSON bodies are ingested one document per line."""
+        lines = [
+            {"content": f"Document {i} starts here. It has another sentence.",
+             "type": "txt", "metadata": {"source": f"doc{i}.txt"}}
+            for i in range(3)
+        ]
+        body = "\n".join(json.dumps(line) for line in lines) + "\n\n"
+
+        response = self.client.post(
+            '/api/ingest?indexing_strategy=sentence_chunker'
+            '&chunk_params=' + json.dumps({"max_sentences_per_chunk": 2, "overlap_sentences": 0}),
+            data=body,
+            content_type='application/x-ndjson'
+        )
+        self.assertEqual(response.status_code, 200)
+        sources = {chunk['metadata']['source'] for chunk in response.get_json()}
+        self.assertEqual(sources, {'doc0.txt', 'doc1.txt', 'doc2.txt'})
+
+        response = self.client.post('/api/ingest?indexing_strategy=sentence_chunker',
+                                    data='{"content": "ok"}\nnot json\n',
+                                    content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 200)
+        # The first document already streamed; the bad line truncates the response
+        self.assertFalse(response.get_data().endswith(b']'))
+
+        response = self.client.post('/api/ingest?indexing_strategy=sentence_chunker',
+                                    data='not json\n', content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post('/api/ingest?indexing_strategy=sentence_chunker',
+                                    data='\n', content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 400)
+
+    def test_ingest_compressed_request_and_response(self):
+        """Test gzip request bodies are inflated and responses follow Accept-Encoding."""
+        data = {
+            "documents": [{
+                "content": "Compressed document here. It has two sentences.",
+                "type": "txt",
+                "metadata": {"source": "compressed.txt"}
+            }],
+            "indexing_strategy": "sentence_chunker"
+        }
+        body = gzip.compress(json.dumps(data).encode('utf-8'))
+
+        response = self.client.post('/api/ingest', data=body, content_type='application/json',
+                                    headers={'Content-Encoding': 'gzip', 'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        result = json.loads(gzip.decompress(response.get_data()))
+        self.assertEqual(result[0]['metadata']['source'], 'compressed.txt')
+
+        ndjson_body = gzip.compress((json.dumps(data['documents'][0]) + '\n').encode('utf-8'))
+        response = self.client.post('/api/ingest?indexing_strategy=sentence_chunker', data=ndjson_body,
+                                    content_type='application/x-ndjson',
+                                    headers={'Content-Encoding': 'gzip'})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual(response.get_json()[0]['metadata']['source'], 'compressed.txt')
+
+    def test_compressed_request_limits(self):
+        """Test decompression bombs and unknown encodings are rejected."""
+        padding = ' ' * (self.app.config['MAX_CONTENT_LENGTH'] + 1)
+        bomb = gzip.compress(('{"documents": []' + padding + '}').encode('utf-8'))
+        self.assertLess(len(bomb), self.app.config['MAX_CONTENT_LENGTH'])
+
+        response = self.client.post('/api/ingest', data=bomb, content_type='application/json',
+                                    headers={'Content-Encoding': 'gzip'})
+        self.assertEqual(response.status_code, 413)
+
+        response = self.client.post('/api/ingest', data=b'{}', content_type='application/json',
+                                    headers={'Content-Encoding': 'br'})
+        self.assertEqual(response.status_code, 415)
+
+    def test_ingest_structure_chunker_sections(self):
+        """Test txt documents keep the line structure structure_chunker splits sections at."""
+        data = {
+            "documents": [{
+                "content": ("# Handbook\r\n\r\nWelcome   to the team.\n\n"
+                            "## Leave\n\nRequest leave early.\n\n\n\n"
+                            "2.1.1 Sick Leave\n\nCall your manager.\n"
+                            "- Before 9am\n- Every day\n\n"
+                            "## Travel\n\nBook through the portal."),
+                "type": "txt",
+                "metadata": {"source": "handbook.txt"}
+            }],
+            "indexing_strategy": "structure_chunker"
+        }
+        response = self.client.post('/api/ingest', json=data)
+        self.assertEqual(response.status_code, 200)
+        chunks = response.get_json()
+        self.assertEqual([chunk['metadata']['section_path'] for chunk in chunks], [
+            ['Handbook'],
+            ['Handbook', 'Leave'],
+            ['Handbook', 'Leave', '2.1.1 Sick Leave'],
+            ['Handbook', 'Travel']
+        ])
+        self.assertEqual(chunks[0]['text'], "Handbook\n\nWelcome to the team.")
+        self.assertEqual(chunks[2]['metadata']['block_types'], ['heading', 'paragraph', 'list'])
+
+    def test_oversize_request_body(self):
+        """Test bodies over MAX_CONTENT_LENGTH are rejected with 413, compressed or not."""
+        self.app.config['MAX_CONTENT_LENGTH'] = 1024
+        body = json.dumps({
+            'documents': [{'content': 'word ' * 1000, 'type': 'txt', 'metadata': {}}]
+        }).encode('utf-8')
+        # Incompressible padding keeps the gzip body over the limit too
+        compressed = gzip.compress(body[:-1] + b', "padding": "' + os.urandom(1024).hex().encode('ascii') + b'"}')
+        self.assertGreater(len(compressed), 1024)
+
+        for path in ('/api/ingest', '/api/diff'):
+            response = self.client.post(path, data=body, content_type='application/json')
+            self.assertEqual(response.status_code, 413, path)
+            self.assertIn('error', response.get_json())
+
+            response = self.client.post(path, data=compressed, content_type='application/json',
+                                        headers={'Content-Encoding': 'gzip'})
+            self.assertEqual(response.status_code, 413, path)
+
+    def test_ingest_result_cache_and_etag(self):
+        """Test identical requests are served from the cache and honour If-None-Match."""
+        data = {
+            "documents": [{
+                "content": f"Cached document {uuid.uuid4()}. It is sent twice.",
+                "type": "txt",
+                "metadata": {"source": "cached.txt"}
+            }],
+            "indexing_strategy": "sentence_chunker"
+        }
+
+        first = self.client.post('/api/ingest', json=data)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers['X-Cache'], 'MISS')
+        etag = first.headers['ETag']
+        # The body is streamed; it is cached once fully sent
+        first_body = first.get_data()
+
+        second = self.client.post('/api/ingest', json=data)
+        self.assertEqual(second.headers['X-Cache'], 'HIT')
+        self.assertEqual(second.headers['ETag'], etag)
+        self.assertEqual(second.get_data(), first_body)
+
+        not_modified = self.client.post('/api/ingest', json=data, headers={'If-None-Match': etag})
+        self.assertEqual(not_modified.status_code, 304)
+
+        changed = dict(data, chunk_params={"max_sentences_per_chunk": 1, "overlap_sentences": 0})
+        third = self.client.post('/api/ingest', json=changed, headers={'If-None-Match': etag})
+        self.assertEqual(third.status_code, 200)
+        self.assertNotEqual(third.headers['ETag'], etag)
+
+        # Each content coding is a different entity with its own ETag
+        gzipped = self.client.post('/api/ingest', json=data, headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(gzipped.headers['Content-Encoding'], 'gzip')
+        self.assertNotEqual(gzipped.headers['ETag'], etag)
+        self.assertEqual(gzip.decompress(gzipped.get_data()), first_body)
+        response = self.client.post('/api/ingest', json=data, headers={'If-None-Match': etag,
+                                                                       'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.status_code, 200)
+        response = self.client.post('/api/ingest', json=data, headers={'If-None-Match': gzipped.headers['ETag'],
+                                                                       'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['ETag'], gzipped.headers['ETag'])
+
+    def test_result_cache_keyed_by_settings(self):
+        """Test results cached under other extraction or chunking settings are not served."""
+        data = {
+            "documents": [{"content": "Settings matter. Cache keys include them.", "type": "txt",
+                           "metadata": {"source": "settings.txt"}}],
+            "indexing_strategy": "fixed_size_chunker"
+        }
+        first = self.client.post('/api/ingest', json=data)
+        self.assertEqual(first.headers['X-Cache'], 'MISS')
+        first.get_data()
+        self.assertEqual(self.client.post('/api/ingest', json=data).headers['X-Cache'], 'HIT')
+
+        settings = {'RESULT_CACHE_PATH': self.app.config['RESULT_CACHE_PATH']}
+        for name, value in (('DEFAULT_CHUNK_SIZE', 10), ('STRIP_PDF_BOILERPLATE', False)):
+            with mock.patch.object(Config, name, value):
+                client = create_app(settings).test_client()
+            response = client.post('/api/ingest', json=data)
+            self.assertEqual(response.headers['X-Cache'], 'MISS', name)
+
+    def test_ingest_dedup_across_requests(self):
+        """Test dedup drops repeated chunks within a request and across a client's requests."""
+        client_id = f"dedup-{uuid.uuid4()}"
+        data = {
+            "client_id": client_id,
+            "documents": [
+                {"content": "Unique text for the first file.", "type": "txt", "metadata": {"source": "a.txt"}},
+                {"content": "Standard disclaimer applies.", "type": "txt", "metadata": {"source": "b.txt"}},
+                {"content": "Standard  disclaimer applies.", "type": "txt", "metadata": {"source": "c.txt"}}
+            ],
+            "indexing_strategy": "sentence_chunker",
+            "dedup": "drop"
+        }
+
+        first = self.client.post('/api/ingest', json=data)
+        self.assertEqual(first.status_code, 200)
+        self.assertNotIn('X-Cache', first.headers)
+        self.assertEqual([chunk['metadata']['source'] for chunk in first.get_json()], ['a.txt', 'b.txt'])
+
+        second = self.client.post('/api/ingest', json=data)
+        self.assertEqual(second.get_json(), [])
+
+        marked = self.client.post('/api/ingest', json={**data, "dedup": "mark"})
+        self.assertEqual([chunk['metadata']['duplicate'] for chunk in marked.get_json()],
+                         ['client', 'client', 'request'])
+
+        response = self.client.post('/api/ingest', json={**data, "dedup": "collapse"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_ingest_dedup_records_only_sent_chunks(self):
+        """Test chunks of a response cut short are not recorded as seen, so a retry returns them."""
+        data = {
+            "client_id": "truncated",
+            "documents": [{"content": " ".join(f"Sentence number {i} is here." for i in range(40)),
+                           "type": "txt", "metadata": {"source": "long.txt"}}],
+            "indexing_strategy": "sentence_chunker",
+            "chunk_params": {"max_sentences_per_chunk": 1, "overlap_sentences": 0},
+            "dedup": "drop"
+        }
+
+        # Read the first piece of the streamed body, then disconnect
+        truncated = self.client.post('/api/ingest', json=data, buffered=False)
+        self.assertEqual(truncated.status_code, 200)
+        next(iter(truncated.response))
+        truncated.close()
+
+        retry = self.client.post('/api/ingest', json=data)
+        self.assertEqual(len(retry.get_json()), 40)
+        self.assertEqual(self.client.post('/api/ingest', json=data).get_json(), [])
+
+    def test_ingest_near_dedup(self):
+        """Test near_dedup marks lightly edited chunks and rejects invalid thresholds."""
+        text = ("Every request is validated before processing begins, and documents that fail "
+                "validation are reported back to the caller with a descriptive error message.")
+        data = {
+            "documents": [
+                {"content": text, "type": "txt", "metadata": {"source": "a.txt"}},
+                {"content": text.replace("caller", "client"), "type": "txt", "metadata": {"source": "b.txt"}}
+            ],
+            "indexing_strategy": "sentence_chunker",
+            "near_dedup": "mark",
+            "near_dedup_threshold": 0.6
+        }
+
+        response = self.client.post('/api/ingest', json=data)
+        self.assertEqual(response.status_code, 200)
+        chunks = response.get_json()
+        self.assertNotIn('near_duplicate_of', chunks[0]['metadata'])
+        self.assertEqual(chunks[1]['metadata']['near_duplicate_of']['source'], 'a.txt')
+
+        response = self.client.post('/api/ingest', json={**data, "near_dedup_threshold": "high"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_ingest_near_dedup_drops_are_not_remembered(self):
+        """Test chunks dropped by near_dedup are not recorded in the client's dedup history."""
+        text = ("Every request is validated before processing begins, and documents that fail "
+                "validation are reported back to the caller with a descriptive error message.")
+        original = {"content": text, "type": "txt", "metadata": {"source": "a.txt"}}
+        edited = {"content": text.replace("caller", "client"), "type": "txt", "metadata": {"source": "b.txt"}}
+        copy = {"content": text, "type": "txt", "metadata": {"source": "c.txt"}}
+        base = {"indexing_strategy": "sentence_chunker", "near_dedup": "drop", "near_dedup_threshold": 0.5}
+
+        for dedup in ('drop', 'mark'):
+            client_id = f"near-{dedup}"
+            response = self.client.post('/api/ingest', json={
+                **base, "client_id": client_id, "dedup": dedup, "documents": [original, edited, copy]})
+            self.assertEqual([chunk['metadata']['source'] for chunk in response.get_json()], ['a.txt'])
+
+            for document, expected in ((edited, None), (original, 'client')):
+                response = self.client.post('/api/ingest', json={
+                    "indexing_strategy": "sentence_chunker", "client_id": client_id, "dedup": "mark",
+                    "documents": [document]})
+                self.assertEqual([chunk['metadata'].get('duplicate') for chunk in response.get_json()],
+                                 [expected], dedup)
+
+    def test_diff_returns_only_changed_chunks(self):
+        """Test re-chunking an edited document returns only chunks not in the previous manifest."""
+        sentences = [f"Sentence number {index} talks about topic {index * 7 % 13} in some detail."
+                     for index in range(600)]
+        data = {
+            "documents": [{"content": " ".join(sentences), "type": "txt",
+                           "metadata": {"source": "manual.txt"}}],
+            "indexing_strategy": "cdc_chunker",
+            "chunk_params": {"segmenter": "regex", "min_chunk_chars": 64, "avg_chunk_chars": 256,
+                             "max_chunk_chars": 1024}
+        }
+
+        first = self.client.post('/api/diff', json=data)
+        self.assertEqual(first.status_code, 200)
+        [entry] = first.get_json()['documents']
+        self.assertEqual(entry['document_id'], 'manual.txt')
+        self.assertEqual(len(entry['added']), len(entry['chunk_ids']))
+        self.assertGreater(len(entry['chunk_ids']), 50)
+        self.assertTrue(all(chunk['metadata']['chunk_id'] in entry['chunk_ids'] for chunk in entry['added']))
+
+        sentences[300] = "A brand new sentence replaced the old one here."
+        edited = {**data, "documents": [{**data["documents"][0], "content": " ".join(sentences)}],
+                  "manifest": {"manual.txt": entry['chunk_ids']}}
+        second = self.client.post('/api/diff', json=edited)
+        [changed] = second.get_json()['documents']
+        self.assertLessEqual(len(changed['added']), 3)
+        self.assertLessEqual(len(changed['removed']), 3)
+        self.assertEqual(changed['unchanged'] + len(changed['added']), len(changed['chunk_ids']))
+        self.assertIn('brand new sentence', ' '.join(chunk['text'] for chunk in changed['added']))
+
+        response = self.client.post('/api/diff', json={**data, "manifest": {"manual.txt": "abc"}})
+        self.assertEqual(response.status_code, 400)
+
+        # Ingest-only options are rejected rather than silently ignored
+        response = self.client.post('/api/diff', json={**data, "dedup": "drop", "client_id": "c1"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'Options not supported by /diff: client_id, dedup')
+
     def test_list_strategies_endpoint(self):
         """Test listing available strategies endpoint."""
         print("\nTesting list-strategies endpoint")
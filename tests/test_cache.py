@@ -0,0 +1,109 @@
+import os
+import tempfile
+import time
+import unittest
+from src.cache import BloomFilter, ResultCache, SeenHashStore, request_cache_key
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'cache.sqlite3')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_put_and_get(self):
+        """Test stored bodies are returned, and unknown keys miss."""
+        cache = ResultCache(self.path, ttl_seconds=60, max_bytes=1000, max_entry_bytes=100)
+        self.assertTrue(cache.put('a', b'[1,2,3]'))
+        self.assertEqual(cache.get('a'), b'[1,2,3]')
+        self.assertIsNone(cache.get('missing'))
+
+    def test_shared_between_instances(self):
+        """Test a second cache on the same file (another worker) sees entries."""
+        ResultCache(self.path, ttl_seconds=60, max_bytes=1000, max_entry_bytes=100).put('a', b'x')
+        other = ResultCache(self.path, ttl_seconds=60, max_bytes=1000, max_entry_bytes=100)
+        self.assertEqual(other.get('a'), b'x')
+
+    def test_ttl_expiry(self):
+        """Test entries older than the TTL are not served."""
+        cache = ResultCache(self.path, ttl_seconds=0.05, max_bytes=1000, max_entry_bytes=100)
+        cache.put('a', b'x')
+        time.sleep(0.1)
+        self.assertIsNone(cache.get('a'))
+
+    def test_lru_eviction_and_entry_limit(self):
+        """Test least recently used entries go first and oversized bodies are skipped."""
+        cache = ResultCache(self.path, ttl_seconds=60, max_bytes=30, max_entry_bytes=10)
+        for key in ('a', 'b', 'c'):
+            cache.put(key, b'0123456789')
+            time.sleep(0.01)
+        cache.get('a')
+        cache.put('d', b'0123456789')
+
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('d'))
+        self.assertFalse(cache.put('big', b'x' * 11))
+
+    def test_request_cache_key(self):
+        """Test keys ignore key order but not content, strategy or parameters."""
+        docs = [{'content': 'text', 'metadata': {'source': 'a.txt', 'x': 1}}]
+        reordered = [{'metadata': {'x': 1, 'source': 'a.txt'}, 'content': 'text'}]
+        key = request_cache_key(docs, 'sentence_chunker', {'max_sentences_per_chunk': 3})
+
+        self.assertEqual(key, request_cache_key(reordered, 'sentence_chunker', {'max_sentences_per_chunk': 3}))
+        self.assertNotEqual(key, request_cache_key(docs, 'sentence_chunker', {'max_sentences_per_chunk': 4}))
+        self.assertNotEqual(key, request_cache_key(docs, 'json_index', {'max_sentences_per_chunk': 3}))
+        self.assertIsNone(request_cache_key([{'type': 'directory', 'metadata': {}}], 'simple_directory', None))
+
+class TestSeenHashStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'seen.sqlite3')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _store(self, **kwargs):
+        options = {'bloom_bits': 1024, 'bloom_hashes': 3, 'max_clients': 4, **kwargs}
+        return SeenHashStore(self.path, **options)
+
+    def test_check_is_exact_per_client(self):
+        """Test hashes are reported as seen only once recorded, and only for the client that emitted them."""
+        store = self._store()
+        digests = [bytes([i]) * 16 for i in range(3)]
+        self.assertEqual(store.check('a', digests[:2]), [False, False])
+        self.assertEqual(store.check('a', digests[:2]), [False, False])
+        store.record('a', digests[:2])
+        self.assertEqual(store.check('a', digests), [True, True, False])
+        self.assertEqual(store.check('b', digests[:1]), [False])
+
+        store.clear('a')
+        self.assertEqual(store.check('a', digests), [False, False, False])
+
+    def test_shared_between_workers(self):
+        """Test a store on the same file (another worker) sees hashes recorded after its filter loaded."""
+        first, second = self._store(), self._store()
+        digest = b'\x01' * 16
+        self.assertEqual(second.check('a', [digest]), [False])
+        first.record('a', [digest])
+        self.assertEqual(second.check('a', [digest]), [True])
+        second.record('a', [b'\x02' * 16])
+        self.assertEqual(first.check('a', [digest, b'\x02' * 16, b'\x03' * 16]), [True, True, False])
+
+    def test_bloom_false_positives_are_confirmed(self):
+        """Test a saturated filter never turns new hashes into duplicates."""
+        store = self._store(bloom_bits=8, bloom_hashes=1)
+        digests = [bytes([i]) * 16 for i in range(20)]
+        self.assertEqual(store.check('a', digests), [False] * 20)
+        store.record('a', digests)
+        self.assertEqual(store.check('a', [b'\xff' * 15 + b'\x00']), [False])
+
+        bloom = BloomFilter(1 << 16, 7)
+        bloom.add(digests[0])
+        self.assertIn(digests[0], bloom)
+        self.assertNotIn(digests[1], bloom)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import random
+import unittest
+from src.chunking.cdc_chunker import CDCChunker
+from src.chunking.sentence_chunker import SentenceChunker
+
+class TestCDCChunker(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.chunker = CDCChunker()
+        self.params = {'segmenter': 'regex', 'min_chunk_chars': 128, 'avg_chunk_chars': 512,
+                       'max_chunk_chars': 2048}
+        self.rng = random.Random(7)
+        self.words = [''.join(self.rng.choice('abcdefghijklmnop') for _ in range(self.rng.randint(2, 9)))
+                      for _ in range(2000)]
+        self.sentences = [self._sentence() for _ in range(800)]
+
+    def _sentence(self):
+        return ' '.join(self.rng.choice(self.words) for _ in range(self.rng.randint(4, 20))).capitalize() + '.'
+
+    def test_chunks_cover_text_within_size_bounds(self):
+        """Test chunks reassemble the document and respect the size bounds."""
+        chunks = self.chunker.chunk_document(' '.join(self.sentences), {'source': 'a.txt'}, self.params)
+        self.assertEqual(' '.join(chunk['content'] for chunk in chunks), ' '.join(self.sentences))
+        self.assertEqual([chunk['metadata']['chunk_index'] for chunk in chunks], list(range(len(chunks))))
+        self.assertTrue(all(chunk['metadata']['strategy'] == 'cdc_chunker' for chunk in chunks))
+        sizes = [len(chunk['content']) for chunk in chunks]
+        self.assertTrue(all(size <= 2048 for size in sizes))
+        self.assertTrue(all(size >= 128 for size in sizes[:-1]))
+        self.assertTrue(256 < sum(sizes) / len(sizes) < 1024)
+
+    def test_chunks_survive_random_edits(self):
+        """Test most chunks are unchanged after random edits, unlike fixed sentence windows."""
+        sentence_chunker = SentenceChunker()
+        window_params = {'segmenter': 'regex', 'max_sentences_per_chunk': 5, 'overlap_sentences': 0}
+        original = ' '.join(self.sentences)
+        cdc_before = [chunk['content'] for chunk in self.chunker.chunk_document(original, {}, self.params)]
+        window_before = [chunk['content'] for chunk in
+                         sentence_chunker.chunk_document(original, {}, window_params)]
+
+        cdc_preserved, window_preserved = [], []
+        for _ in range(20):
+            edited = list(self.sentences)
+            position = self.rng.randrange(len(edited))
+            if self.rng.random() < 0.5:
+                edited.insert(position, self._sentence())
+            else:
+                del edited[position]
+            edited = ' '.join(edited)
+            cdc_after = {chunk['content'] for chunk in self.chunker.chunk_document(edited, {}, self.params)}
+            window_after = {chunk['content'] for chunk in
+                            sentence_chunker.chunk_document(edited, {}, window_params)}
+            cdc_preserved.append(sum(chunk in cdc_after for chunk in cdc_before) / len(cdc_before))
+            window_preserved.append(sum(chunk in window_after for chunk in window_before) / len(window_before))
+
+        # A single edit should touch at most a couple of chunks
+        self.assertGreater(min(cdc_preserved), 0.95)
+        self.assertGreater(sum(cdc_preserved) / 20, sum(window_preserved) / 20)
+
+    def test_invalid_size_bounds(self):
+        """Test chunk sizes must be ordered."""
+        with self.assertRaises(ValueError):
+            self.chunker.chunk_document('Some text.', {}, {'min_chunk_chars': 512, 'avg_chunk_chars': 256})
+        with self.assertRaises(ValueError):
+            self.chunker.chunk_document('Some text.', {}, {'max_chunk_chars': 100})
+
+if __name__ == '__main__':
+    unittest.main()
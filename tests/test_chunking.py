@@ -51,6 +51,12 @@ class TestChunking(unittest.TestCase):
         
         with self.assertRaises(ValueError):
             self.manager.get_strategy('non_existent_strategy')
+
+    def test_strategy_instance_reused(self):
+        """Test the manager hands out one shared instance per strategy."""
+        first = self.manager.get_strategy('simple_test_chunker')
+        second = self.manager.get_strategy('simple_test_chunker')
+        self.assertIs(first, second)
             
     def test_chunking_with_params(self):
         """Test document chunking with parameters."""
@@ -0,0 +1,50 @@
+import unittest
+from src.chunking.fixed_size_chunker import FixedSizeChunker
+from src.preprocessing.processor import PreprocessingModule
+
+class TestFixedSizeChunker(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.chunker = FixedSizeChunker()
+        self.test_content = "alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu\n" * 20
+
+    def test_windows_snap_to_whitespace_and_tile_text(self):
+        """Test cuts move to whitespace within tolerance and chunks reassemble the text."""
+        chunks = self.chunker.chunk_document(self.test_content, {'source': 'app.log'},
+                                             {'chunk_size': 40, 'snap_tolerance': 8})
+        self.assertEqual(''.join(chunk['content'] for chunk in chunks), self.test_content)
+        for chunk in chunks[:-1]:
+            self.assertTrue(chunk['content'][-1].isspace())
+            self.assertLessEqual(abs(len(chunk['content']) - 40), 16)
+        self.assertEqual(chunks[0]['metadata']['strategy'], 'fixed_size_chunker')
+        self.assertEqual(chunks[0]['metadata']['source'], 'app.log')
+        self.assertEqual([chunk['metadata']['span'][0] for chunk in chunks[1:]],
+                         [chunk['metadata']['span'][1] for chunk in chunks[:-1]])
+
+    def test_overlap_without_snapping(self):
+        """Test plain windows advance by chunk_size - chunk_overlap."""
+        chunks = self.chunker.chunk_document("abcdefghij", {}, {'chunk_size': 4, 'chunk_overlap': 1,
+                                                                'snap_tolerance': 0})
+        self.assertEqual([chunk['content'] for chunk in chunks], ['abcd', 'defg', 'ghij'])
+
+    def test_byte_windows_keep_characters_whole(self):
+        """Test byte windows never split a multi-byte character."""
+        content = "héllo wörld ñandú " * 10 + "ééééé"
+        chunks = self.chunker.chunk_document(content, {}, {'chunk_size': 16, 'unit': 'bytes',
+                                                           'snap_tolerance': 3})
+        self.assertEqual(''.join(chunk['content'] for chunk in chunks), content)
+        self.assertTrue(all(len(chunk['content'].encode('utf-8')) <= 16 + 6 for chunk in chunks))
+
+    def test_preprocessor_chunk_text(self):
+        """Test the preprocessor's fixed-size helper keeps its plain slicing behaviour."""
+        self.assertEqual(PreprocessingModule()._chunk_text("abcdefghij", 3), ['abc', 'def', 'ghi', 'j'])
+
+    def test_invalid_params(self):
+        """Test invalid sizes, overlaps, tolerances and units are rejected."""
+        for params in ({'chunk_size': 0}, {'chunk_size': 10, 'chunk_overlap': 10},
+                       {'chunk_size': 10, 'snap_tolerance': 5}, {'unit': 'words'}):
+            with self.assertRaises(ValueError):
+                self.chunker.chunk_document(self.test_content, {}, params)
+
+if __name__ == '__main__':
+    unittest.main()
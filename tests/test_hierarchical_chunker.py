@@ -0,0 +1,68 @@
+import unittest
+from src.chunking.base import make_chunk_id
+from src.chunking.hierarchical_chunker import HierarchicalChunker
+from src.chunking.sentence_cache import SentenceBoundaryCache
+from src.main import create_app
+from tests import isolated_settings
+
+class TestHierarchicalChunker(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.chunker = HierarchicalChunker(boundary_cache=SentenceBoundaryCache(10 ** 6))
+        self.test_content = ' '.join(f"This is sentence number {index}." for index in range(10))
+        self.metadata = {'source': 'test.txt'}
+        self.params = {'segmenter': 'regex', 'parent_max_sentences': 4, 'max_sentences_per_chunk': 2,
+                       'overlap_sentences': 1}
+
+    def test_parents_and_children_from_one_split(self):
+        """Test each parent is emitted once, followed by children that reference it."""
+        chunks = self.chunker.chunk_document(self.test_content, self.metadata, self.params)
+        levels = [chunk['metadata']['chunk_level'] for chunk in chunks]
+        self.assertEqual(levels, ['parent', 'child', 'child', 'child',
+                                  'parent', 'child', 'child', 'child',
+                                  'child'])
+        self.assertEqual([chunk['metadata']['chunk_index'] for chunk in chunks], list(range(len(chunks))))
+
+        parents = {chunk['metadata']['chunk_id']: chunk for chunk in chunks
+                   if chunk['metadata']['chunk_level'] == 'parent'}
+        self.assertEqual(len(parents), 2)
+        for chunk in chunks:
+            start, end = chunk['metadata']['span']
+            self.assertEqual(chunk['content'], self.test_content[start:end])
+            if chunk['metadata']['chunk_level'] == 'child':
+                parent = parents.get(chunk['metadata']['parent_id'])
+                if parent is None:
+                    # Last parent has only two sentences: its single child stands in for it
+                    self.assertEqual(chunk['metadata']['parent_id'], make_chunk_id(self.metadata, chunk['content']))
+                    continue
+                parent_start, parent_end = parent['metadata']['span']
+                self.assertTrue(parent_start <= start and end <= parent_end)
+
+    def test_segments_once_per_document(self):
+        """Test both levels come from one cached sentence split."""
+        self.chunker.chunk_document(self.test_content, self.metadata, self.params)
+        self.assertEqual(self.chunker.boundary_cache.misses, 1)
+
+    def test_invalid_parent_size(self):
+        """Test parents must hold at least one full child window."""
+        with self.assertRaises(ValueError):
+            self.chunker.chunk_document(self.test_content, self.metadata,
+                                        {'parent_max_sentences': 2, 'max_sentences_per_chunk': 3})
+
+    def test_parent_id_matches_pipeline_chunk_id(self):
+        """Test children's parent_id equals the chunk_id the pipeline assigns to their parent."""
+        client = create_app(isolated_settings(self)).test_client()
+        response = client.post('/api/ingest', json={
+            "documents": [{"content": self.test_content, "type": "txt", "metadata": self.metadata}],
+            "indexing_strategy": "hierarchical_chunker",
+            "chunk_params": self.params
+        })
+        self.assertEqual(response.status_code, 200)
+        chunks = response.get_json()
+        parent_ids = {chunk['metadata']['chunk_id'] for chunk in chunks
+                      if chunk['metadata']['chunk_level'] == 'parent'}
+        children = [chunk for chunk in chunks if chunk['metadata']['chunk_level'] == 'child']
+        self.assertTrue(all(chunk['metadata']['parent_id'] in parent_ids for chunk in children[:6]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from src.indexing.strategies import SimpleDirectoryReader, JSONIndexer
+from src.indexing.strategy_manager import StrategyManager
 
 class TestIndexing(unittest.TestCase):
     def setUp(self):
@@ -56,5 +57,15 @@ class TestIndexing(unittest.TestCase):
         self.assertTrue(len(result) > 0)
         self.assertTrue(result[0]['metadata']['source'].endswith('.pdf'))
 
+    def test_strategy_manager_reuses_instances(self):
+        """Test StrategyManager builds each strategy once and reuses it."""
+        manager = StrategyManager()
+        first = manager.get_strategy('json_index')
+        self.assertIs(first, manager.get_strategy('json_index'))
+        self.assertIsInstance(first, JSONIndexer)
+
+        with self.assertRaises(ValueError):
+            manager.get_strategy('non_existent_strategy')
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,253 @@
+import json
+import unittest
+from typing import Iterable, Iterator, Any
+from unittest import mock
+from src.pipeline import BaseStage, BoundedBuffer, Pipeline, PipelineBuilder
+from src.chunking import sentence_chunker
+from src.chunking.parallel_segmentation import parallel_sentence_offsets
+from src.chunking.sentence_cache import SentenceBoundaryCache
+from src.chunking.sentence_chunker import SentenceChunker
+from src.preprocessing.extractors import TextExtractor
+from src.pipeline.stages import JSONArraySerializeStage, ControlCharCleanStage, ChunkStage, ChunkIdStage, DedupStage, NearDedupStage
+from src.chunking.base import make_chunk_id
+from src.records import Chunk, Document
+from src.registry import ComponentRegistry
+from tests import isolated_settings
+
+class DoubleStage(BaseStage):
+    """Test stage yielding every item twice."""
+
+    @property
+    def stage_name(self) -> str:
+        return "double"
+
+    def process(self, items: Iterable[Any]) -> Iterator[Any]:
+        for item in items:
+            yield item
+            yield item
+
+class FailingStage(BaseStage):
+    """Test stage that fails on a given item."""
+
+    def __init__(self, fail_on: Any):
+        self.fail_on = fail_on
+
+    @property
+    def stage_name(self) -> str:
+        return "failing"
+
+    def process(self, items: Iterable[Any]) -> Iterator[Any]:
+        for item in items:
+            if item == self.fail_on:
+                raise ValueError(f"cannot process {item}")
+            yield item
+
+class RecordingChunker(SentenceChunker):
+    """Test chunker recording the size of every chunk_record_batch batch."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def chunk_record_batch(self, documents, chunk_params=None):
+        self.batches.append(len(documents))
+        return super().chunk_record_batch(documents, chunk_params)
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self):
+        self.builder = ComponentRegistry(isolated_settings(self)).pipeline_builder
+
+    def test_buffered_and_unbuffered_runs_match(self):
+        """Test bounded buffers do not change pipeline output."""
+        stages = [DoubleStage(), DoubleStage()]
+        unbuffered = list(Pipeline(stages).run(range(50)))
+        buffered = list(Pipeline(stages, buffer_size=2).run(range(50)))
+        self.assertEqual(unbuffered, buffered)
+        self.assertEqual(len(buffered), 200)
+
+    def test_pipeline_is_lazy(self):
+        """Test documents are pulled only as output is consumed."""
+        consumed = []
+
+        def documents():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        output = Pipeline([DoubleStage()]).run(documents())
+        self.assertEqual(consumed, [])
+        next(output)
+        self.assertEqual(consumed, [0])
+        output.close()
+
+    def test_buffered_errors_propagate(self):
+        """Test exceptions raised behind a buffer reach the consumer."""
+        pipeline = Pipeline([FailingStage(fail_on=3), DoubleStage()], buffer_size=2)
+        with self.assertRaises(ValueError):
+            list(pipeline.run(range(10)))
+
+    def test_buffer_close_stops_producer(self):
+        """Test closing a buffer releases its producer thread."""
+        buffer = BoundedBuffer(iter(range(1000)), size=1)
+        self.assertEqual(next(buffer), 0)
+        buffer.close()
+        buffer._thread.join(timeout=2)
+        self.assertFalse(buffer._thread.is_alive())
+
+    def test_json_array_serialization(self):
+        """Test the serializer produces one valid JSON array."""
+        stage = JSONArraySerializeStage()
+        items = [{'text': 'a', 'metadata': {}}, {'text': 'b', 'metadata': {'x': 1}}]
+        self.assertEqual(json.loads(b''.join(stage.process(items))), items)
+        self.assertEqual(json.loads(b''.join(stage.process([]))), [])
+
+    def test_control_char_cleaning_keeps_layout(self):
+        """Test cleaning drops control characters but keeps line structure."""
+        docs = [Document('Title\r\n\r\nBody\x00 text\tend\x0c', {})]
+        cleaned = list(ControlCharCleanStage().process(docs))
+        self.assertEqual(cleaned[0].content, 'Title\n\nBody text\tend')
+
+    def test_builder_selects_segment_stage(self):
+        """Test chunking and indexing strategies share one pipeline layout."""
+        chunk_pipeline = self.builder.build('sentence_chunker')
+        index_pipeline = self.builder.build('json_index')
+        self.assertEqual(chunk_pipeline.stage_names, ['extract', 'clean', 'chunk', 'chunk_id', 'format', 'serialize'])
+        self.assertEqual(index_pipeline.stage_names, ['extract', 'clean', 'index', 'chunk_id', 'format', 'serialize'])
+
+        with self.assertRaises(ValueError):
+            self.builder.build('non_existent_strategy')
+
+    def test_chunk_stage_micro_batches_small_documents(self):
+        """Test small documents are batched in growing batches without reordering output."""
+        chunker = RecordingChunker()
+        docs = [Document(f'Record {i} is short. It has two sentences.', {'source': f'{i}.txt'})
+                for i in range(10)]
+        docs.insert(5, Document('A longer document. ' * 20, {'source': 'long.txt'}))
+
+        chunks = list(ChunkStage(chunker, batch_size=4, batch_max_chars=100).process(docs))
+        self.assertEqual(chunker.batches, [1, 2, 2, 4, 1])
+        sources = []
+        for chunk in chunks:
+            if not sources or sources[-1] != chunk.get('source'):
+                sources.append(chunk.get('source'))
+        self.assertEqual(sources, [doc.metadata['source'] for doc in docs])
+
+        expected = [chunk for doc in docs
+                    for chunk in SentenceChunker().chunk_document(doc.content, doc.metadata)]
+        self.assertEqual([chunk.to_dict() for chunk in chunks], expected)
+
+    def test_chunk_records_share_document_metadata(self):
+        """Test chunks of one document reference one metadata dict and setting a field leaves it alone."""
+        metadata = {'source': 'a.txt', 'author': 'Ann'}
+        chunks = SentenceChunker().chunk_records('One sentence here. ' * 12, metadata)
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(chunk.base is chunks[0].base for chunk in chunks))
+
+        chunks[0].set('chunk_id', 'abc')
+        self.assertEqual(chunks[0].metadata['chunk_id'], 'abc')
+        self.assertNotIn('chunk_id', chunks[1].metadata)
+        self.assertEqual(metadata, {'source': 'a.txt', 'author': 'Ann'})
+
+    def test_chunk_ids_depend_on_document_and_text_only(self):
+        """Test chunk ids ignore position and whitespace but differ across documents."""
+        chunks = [Chunk('Shared  Text.', {'source': 'a.txt', 'chunk_index': 0}),
+                  Chunk('shared text.', {'source': 'a.txt', 'chunk_index': 5}),
+                  Chunk('Shared Text.', {'source': 'b.txt', 'chunk_index': 0}),
+                  Chunk('Shared Text.', {'source': 'b.txt', 'document_id': 'doc-1'})]
+        ids = [chunk.get('chunk_id') for chunk in ChunkIdStage().process(chunks)]
+        self.assertEqual(ids[0], ids[1])
+        self.assertEqual(len(set(ids)), 3)
+        self.assertEqual(ids[3], make_chunk_id({'document_id': 'doc-1'}, 'shared text.'))
+
+    def test_dedup_stage_drops_or_marks_normalized_duplicates(self):
+        """Test chunks equal after normalization are dropped, or marked in 'mark' mode."""
+        def chunks():
+            metadata = {'source': 'a.txt'}
+            return [Chunk(text, metadata)
+                    for text in ('Copyright  ACME.', 'Body text.', 'copyright acme.\n', 'Body text.')]
+
+        kept = list(DedupStage('drop').process(chunks()))
+        self.assertEqual([chunk.content for chunk in kept], ['Copyright  ACME.', 'Body text.'])
+        self.assertTrue(all(len(chunk.get('content_hash')) == 32 for chunk in kept))
+
+        marked = list(DedupStage('mark').process(chunks()))
+        self.assertEqual([chunk.get('duplicate') for chunk in marked], [None, None, 'request', 'request'])
+
+        with self.assertRaises(ValueError):
+            DedupStage('no_such_mode')
+
+    def test_near_dedup_stage_catches_edited_copies(self):
+        """Test lightly edited chunks are matched to the chunk they copy, unrelated ones are not."""
+        original = ("The service splits each uploaded document into chunks, normalizes their text and "
+                    "streams them back to the client together with source metadata for indexing.")
+        edited = original.replace("uploaded", "submitted")
+        unrelated = "Quarterly revenue grew in every region while operating costs stayed flat year over year."
+
+        def chunks():
+            return [Chunk(text, {'source': f'{index}.txt', 'chunk_index': 0})
+                    for index, text in enumerate((original, unrelated, edited, ''))]
+
+        kept = list(NearDedupStage('drop', threshold=0.6).process(chunks()))
+        self.assertEqual([chunk.get('source') for chunk in kept], ['0.txt', '1.txt', '3.txt'])
+
+        marked = list(NearDedupStage('mark', threshold=0.6).process(chunks()))
+        self.assertEqual(marked[2].get('near_duplicate_of'), {'source': '0.txt', 'chunk_index': 0})
+        self.assertGreaterEqual(marked[2].get('near_duplicate_similarity'), 0.6)
+        self.assertNotIn('near_duplicate_of', marked[1].metadata)
+
+        with self.assertRaises(ValueError):
+            NearDedupStage('drop', threshold=1.5)
+
+    def test_json_index_end_to_end(self):
+        """Test a JSON document streams through extraction, indexing and formatting."""
+        documents = [{
+            'type': 'txt',
+            'content': '{"key": "value", "nested": {"inner": "data"}}',
+            'metadata': {'source': 'test.json'}
+        }]
+        output = json.loads(b''.join(self.builder.build('json_index').run(documents)))
+        paths = {chunk['metadata']['json_path'] for chunk in output}
+        self.assertEqual(paths, {'key', 'nested.inner'})
+        self.assertTrue(all('text' in chunk for chunk in output))
+
+    def test_long_text_documents_are_segmented_in_parallel(self):
+        """Test txt documents keep the blank lines parallel segmentation splits at through extraction."""
+        text = "\n\n".join(f"Paragraph {i}   starts here. Dr. Smith wrote part {i}.\nIt ends here." for i in range(120))
+        documents = [{'content': text, 'type': 'txt', 'metadata': {'source': 'long.txt'}}]
+        chunker = self.builder.chunker_manager.get_strategy('sentence_chunker')
+        chunker.boundary_cache = SentenceBoundaryCache(10 ** 6)
+        chunker.parallel_min_chars = 1000
+        chunker.parallel_segment_chars = 500
+
+        results = []
+        def recording_parallel_offsets(*args):
+            offsets = parallel_sentence_offsets(*args)
+            results.append(offsets)
+            return offsets
+
+        params = {'segmenter': 'regex', 'max_sentences_per_chunk': 3, 'overlap_sentences': 0}
+        with mock.patch.object(sentence_chunker, 'parallel_sentence_offsets', recording_parallel_offsets):
+            output = json.loads(b''.join(self.builder.build('sentence_chunker', params).run(documents)))
+        self.assertEqual(len(results), 1)
+        self.assertIsNotNone(results[0])
+
+        extracted = TextExtractor().extract(text)
+        serial = SentenceChunker(boundary_cache=SentenceBoundaryCache(10 ** 6))
+        serial.parallel_min_chars = len(extracted) + 1
+        expected = serial.chunk_document(extracted, {}, params)
+        self.assertEqual([chunk['text'] for chunk in output], [chunk['content'] for chunk in expected])
+
+    def test_invalid_stage_configuration(self):
+        """Test unknown stage implementations are rejected."""
+        registry = ComponentRegistry(isolated_settings(self))
+        with self.assertRaises(ValueError):
+            PipelineBuilder(
+                registry.preprocessor,
+                registry.strategy_manager,
+                registry.chunker_manager,
+                registry.output_formatter,
+                stage_config={'clean': 'no_such_cleaner'}
+            )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,54 @@
 import unittest
 import os
+import base64
 from src.preprocessing.processor import PreprocessingModule
 from src.preprocessing.extractors import TextExtractor, PDFExtractor
+from src.preprocessing.extractors.pdf_backends import BackendSelector, PDFContent
+from src.preprocessing.extractors.pdf_backends.base import PDFBackend, pdfa_version
+from src.output.formatter import OutputFormatter
+from src.preprocessing.extractors.pdf_boilerplate import BoilerplateStripper
+from src.preprocessing.extractors.pdf_ocr import PageOCR
+
+class RecordingOCR(PageOCR):
+    """PageOCR that records requested pages instead of running Tesseract."""
+
+    @staticmethod
+    def is_available() -> bool:
+        return True
+
+    def _run_ocr(self, source, page_indices):
+        self.requested = list(page_indices)
+        return {index: f"ocr page {index}" for index in page_indices}
+
+class StubBackend(PDFBackend):
+    """Installed PDF backend that returns no pages."""
+
+    @property
+    def backend_name(self) -> str:
+        return "stub_default"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return True
+
+    def extract_stream(self, pdf_stream):
+        return PDFContent([])
+
+class StubFastBackend(StubBackend):
+    @property
+    def backend_name(self) -> str:
+        return "stub_fast"
+
+class StubMissingBackend(StubBackend):
+    """Backend whose library is not installed."""
+
+    @property
+    def backend_name(self) -> str:
+        return "stub_missing"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return False
 
 class TestPreprocessing(unittest.TestCase):
     def setUp(self):
@@ -16,6 +63,12 @@ class TestPreprocessing(unittest.TestCase):
         cleaned = self.text_extractor.extract(test_content)
         self.assertEqual(cleaned, "Test content with extra spaces")
 
+    def test_text_extraction_keeps_line_structure(self):
+        """Test text cleaning keeps line breaks and single blank lines between paragraphs."""
+        test_content = "\n# Title  \r\n\tFirst   line\x07\nSecond line\n\n\n\n- item  one\n"
+        cleaned = self.text_extractor.extract(test_content)
+        self.assertEqual(cleaned, "# Title\nFirst line\nSecond line\n\n- item one")
+
     def test_pdf_extraction(self):
         """Test PDF text extraction."""
         test_pdf_path = os.path.join(self.test_docs_dir, "Test_PDF1.pdf")
@@ -30,6 +83,133 @@ class TestPreprocessing(unittest.TestCase):
         print(f"\nExtracted PDF content length: {len(extracted)}")
         print(f"First 200 characters: {extracted[:200]}")
 
+    def test_pdf_file_and_content_extraction_match(self):
+        """Test memory-mapped file extraction matches in-memory extraction."""
+        test_pdf_path = os.path.join(self.test_docs_dir, "Test_PDF1.pdf")
+
+        if not os.path.exists(test_pdf_path):
+            self.skipTest(f"Test PDF not found at {test_pdf_path}")
+
+        with open(test_pdf_path, 'rb') as f:
+            encoded = base64.b64encode(f.read()).decode('ascii')
+
+        from_file = self.pdf_extractor.extract(file_path=test_pdf_path)
+        from_content = self.pdf_extractor.extract(content=encoded)
+        self.assertEqual(from_file, from_content)
+
+    def test_pdf_backend_selection(self):
+        """Test config- and size-driven PDF backend selection."""
+        selector = BackendSelector(backend='pypdf2')
+        self.assertEqual(selector.select(10 ** 9).backend_name, 'pypdf2')
+
+        selector = BackendSelector(fast_backends=['stub_missing', 'not_registered', 'stub_fast'],
+                                   fast_min_bytes=100)
+        for backend_class in (StubBackend, StubFastBackend, StubMissingBackend):
+            selector.register_backend(backend_class)
+        selector.default_backend = 'stub_default'
+        # Below fast_min_bytes or of unknown size: the default backend
+        self.assertEqual(selector.select(99).backend_name, 'stub_default')
+        self.assertEqual(selector.select().backend_name, 'stub_default')
+        # From fast_min_bytes on: the first installed fast backend
+        self.assertEqual(selector.select(100).backend_name, 'stub_fast')
+        self.assertEqual(selector.select(10 ** 9).backend_name, 'stub_fast')
+
+        # Without an installed fast backend, large documents use the default too
+        selector.fast_backends = ['stub_missing']
+        self.assertEqual(selector.select(10 ** 9).backend_name, 'stub_default')
+
+        with self.assertRaises(ValueError):
+            BackendSelector(backend='no_such_backend')
+
+    def test_pdf_backends_extract_text(self):
+        """Test every installed backend extracts text from the sample PDF."""
+        test_pdf_path = os.path.join(self.test_docs_dir, "Test_PDF1.pdf")
+
+        if not os.path.exists(test_pdf_path):
+            self.skipTest(f"Test PDF not found at {test_pdf_path}")
+
+        for backend_name in BackendSelector().get_available_backends():
+            extractor = PDFExtractor(backend=backend_name)
+            extracted = extractor.extract(file_path=test_pdf_path)
+            self.assertTrue(len(extracted) > 0, f"{backend_name} extracted no text")
+
+    def test_pdf_metadata_extracted_once_and_validates(self):
+        """Test every backend reports the same document metadata and chunks then pass validation."""
+        test_pdf_path = os.path.join(self.test_docs_dir, "Test_PDF1.pdf")
+
+        if not os.path.exists(test_pdf_path):
+            self.skipTest(f"Test PDF not found at {test_pdf_path}")
+
+        reported = {}
+        for backend_name in BackendSelector().get_available_backends():
+            _, metadata = PDFExtractor(backend=backend_name).extract_document(file_path=test_pdf_path)
+            # Boilerplate counts depend on each backend's text layout
+            reported[backend_name] = {key: value for key, value in metadata.items()
+                                      if not key.startswith('boilerplate_')}
+        metadata = reported['pypdf2']
+        self.assertTrue(all(other == metadata for other in reported.values()))
+        self.assertEqual((metadata['page_count'], metadata['page_width'], metadata['page_height']), (23, 720.0, 540.0))
+        self.assertEqual(metadata['pdf_version'], '1.7')
+        self.assertFalse(metadata['pdfa_compliant'])
+        self.assertEqual(metadata['author'], 'HHS/CMS')
+
+        with open(test_pdf_path, 'rb') as f:
+            encoded = base64.b64encode(f.read()).decode('ascii')
+        processed = self.preprocessor.process([{'type': 'pdf', 'content': encoded,
+                                                'metadata': {'source': 'Test_PDF1.pdf', 'author': 'Client'}}])
+        self.assertEqual(processed[0]['metadata']['page_count'], 23)
+        self.assertEqual(processed[0]['metadata']['author'], 'Client')
+        formatted = OutputFormatter().format([{'content': 'text', 'metadata': processed[0]['metadata']}])
+        self.assertFalse(formatted[0]['metadata']['has_validation_errors'])
+
+    def test_pdfa_version_from_xmp(self):
+        """Test PDF/A claims are read from XMP attributes and elements."""
+        self.assertEqual(pdfa_version(b'<rdf:Description pdfaid:part="2" pdfaid:conformance="b"/>'), '2B')
+        self.assertEqual(pdfa_version(b'<pdfaid:part>1</pdfaid:part><pdfaid:conformance>A</pdfaid:conformance>'), '1A')
+        self.assertIsNone(pdfa_version(b'<x:xmpmeta><dc:title>Report</dc:title></x:xmpmeta>'))
+
+    def test_boilerplate_stripped_from_page_edges(self):
+        """Test running headers and numbered footers are removed and the bytes reported."""
+        bodies = ["Revenue grew in every region.\nEurope led the increase.",
+                  "Costs stayed flat.\nTravel spending fell.",
+                  "Hiring slowed down.\nAttrition was low.",
+                  "Two products launched.\nBoth met their targets.",
+                  "Outlook remains stable.\nGuidance is unchanged."]
+        pages = [f"ACME Annual Report\n{body}\nPage {n} of 5" for n, body in enumerate(bodies, 1)]
+        pages[0] = bodies[0]  # A title page without header or footer
+
+        content = BoilerplateStripper().apply(PDFContent(list(pages)))
+        self.assertEqual(content.pages, bodies)
+        self.assertEqual(content.metadata['boilerplate_lines_removed'], 8)
+        self.assertEqual(content.metadata['boilerplate_bytes_removed'],
+                         len('\n'.join(pages).encode('utf-8')) - len(content.text.encode('utf-8')))
+
+        report = {'bytes_removed': 0, 'lines_removed': 0}
+        streamed = list(BoilerplateStripper(min_pages=3, sample_pages=4).iter_strip(iter(pages), report))
+        self.assertEqual(streamed, bodies)
+        self.assertEqual(report['lines_removed'], 8)
+
+        short = PDFContent(pages[1:3])
+        self.assertEqual(BoilerplateStripper().apply(short).pages, pages[1:3])
+
+    def test_selective_ocr_only_textless_pages(self):
+        """Test OCR runs only for empty or near-empty pages and keeps page order."""
+        ocr = RecordingOCR(min_text_chars=5)
+        content = PDFContent(['Real page text', '', '  \n ', 'abc', 'More real text'])
+
+        result = ocr.apply(content, b'%PDF')
+
+        self.assertEqual(ocr.requested, [1, 2, 3])
+        self.assertEqual(result.pages, [
+            'Real page text', 'ocr page 1', 'ocr page 2', 'ocr page 3', 'More real text'
+        ])
+        self.assertEqual(result.metadata['ocr_page_count'], 3)
+
+        fully_textual = PDFContent(['Plenty of text here'])
+        ocr.requested = None
+        ocr.apply(fully_textual, b'%PDF')
+        self.assertIsNone(ocr.requested)
+
     def test_document_processing(self):
         """Test complete document processing."""
         test_pdf_path = os.path.join(self.test_docs_dir, "Test_PDF1.pdf")
@@ -1,10 +1,17 @@
 import unittest
-from src.chunking.sentence_chunker import SentenceChunker
+from src.chunking.language import detect_language
+from src.chunking.parallel_segmentation import split_points
+from src.chunking.segmenters import RegexSegmenter
+from src.chunking.sentence_cache import SentenceBoundaryCache, SentenceModelPool, spans_to_offsets
+from src.chunking.sentence_chunker import SentenceChunker, UnsupportedLanguageError
+from src.chunking.cdc_chunker import CDCChunker
+from src.chunking.hierarchical_chunker import HierarchicalChunker
 
 class TestSentenceChunker(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
-        self.chunker = SentenceChunker()
+        # A private boundary cache, so hit and miss counts start at zero
+        self.chunker = SentenceChunker(boundary_cache=SentenceBoundaryCache(10 ** 6))
         self.test_content = (
             "This is the first sentence. This is the second sentence. "
             "Here comes the third one! And this is sentence four. "
@@ -54,6 +61,11 @@ class TestSentenceChunker(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.chunker.validate_params(invalid_params)
 
+        with self.assertRaisesRegex(UnsupportedLanguageError, "unsupported language 'klingon'"):
+            self.chunker.validate_params({'language': 'klingon', 'max_sentences_per_chunk': 3})
+        # The regex segmenter has no per-language models
+        self.chunker.validate_params({'language': 'klingon', 'segmenter': 'regex', 'max_sentences_per_chunk': 3})
+
     def test_min_sentence_length(self):
         """Test minimum sentence length filtering."""
         params = {
@@ -74,5 +86,124 @@ class TestSentenceChunker(unittest.TestCase):
                 if s.strip()
             ))
 
+    def test_rechunking_reuses_sentence_boundaries(self):
+        """Test re-chunking the same text with new params skips tokenization."""
+        first = self.chunker.chunk_document(self.test_content, self.metadata, {'max_sentences_per_chunk': 2, 'overlap_sentences': 0})
+        self.assertEqual(self.chunker.boundary_cache.misses, 1)
+        second = self.chunker.chunk_document(self.test_content, self.metadata, {'max_sentences_per_chunk': 4, 'overlap_sentences': 1})
+        self.assertEqual(self.chunker.boundary_cache.hits, 1)
+        self.assertNotEqual(len(first), len(second))
+
+        # Cached offsets produce the same chunks as a cold tokenization
+        cold = SentenceChunker(boundary_cache=SentenceBoundaryCache(10 ** 6)).chunk_document(self.test_content, self.metadata, {'max_sentences_per_chunk': 4, 'overlap_sentences': 1})
+        self.assertEqual(second, cold)
+
+    def test_chunk_variants_tokenize_once(self):
+        """Test a parameter sweep splits sentences once and matches single runs."""
+        param_sets = [
+            {'max_sentences_per_chunk': 2, 'overlap_sentences': 0},
+            {'config_id': 'wide', 'max_sentences_per_chunk': 4, 'overlap_sentences': 1}
+        ]
+        chunks = self.chunker.chunk_variants(self.test_content, self.metadata, param_sets)
+        self.assertEqual(self.chunker.boundary_cache.misses + self.chunker.boundary_cache.hits, 1)
+
+        for config_id, params in ((0, param_sets[0]), ('wide', {'max_sentences_per_chunk': 4, 'overlap_sentences': 1})):
+            variant = [c for c in chunks if c['metadata']['chunk_config_id'] == config_id]
+            expected = SentenceChunker().chunk_document(self.test_content, self.metadata, params)
+            self.assertEqual([c['content'] for c in variant], [c['content'] for c in expected])
+
+        with self.assertRaises(ValueError):
+            self.chunker.chunk_variants(self.test_content, self.metadata, [{'config_id': 'a'}, {'config_id': 'a'}])
+
+    def test_language_models_are_pooled(self):
+        """Test each language's punkt model is loaded once and reused."""
+        german = "Der Hund ist nicht in dem Haus. Die Katze ist auch nicht da."
+        self.chunker.chunk_document(german, self.metadata, {'language': 'german'})
+        loads = self.chunker.models.loads
+        self.chunker.chunk_document(self.test_content, self.metadata, {'language': 'english'})
+        self.chunker.chunk_document(german + " Noch ein Satz.", self.metadata, {'language': 'german'})
+        self.assertEqual(self.chunker.models.loads, loads)
+        self.assertIn('german', self.chunker.models.loaded_languages())
+
+        with self.assertRaises(ValueError):
+            self.chunker.validate_params({'max_sentences_per_chunk': 2, 'language': '../english'})
+
+    def test_auto_language_detection(self):
+        """Test language='auto' segments with the detected model and records it."""
+        french = "Le chat est dans la maison. Il dort pour la nuit et ne sort pas."
+        chunks = self.chunker.chunk_document(french, self.metadata, {'language': 'auto'})
+        self.assertEqual(chunks[0]['metadata']['language'], 'french')
+        self.assertEqual(detect_language("Il gatto è nella casa e non vuole uscire con gli amici."), 'italian')
+        self.assertEqual(detect_language("12345 !!!"), 'english')
+
+    def test_sentence_resources_are_shared(self):
+        """Test every sentence-based chunker uses the same model pool and default boundary cache."""
+        chunkers = [SentenceChunker(), CDCChunker(), HierarchicalChunker()]
+        self.assertTrue(all(chunker.models is self.chunker.models for chunker in chunkers))
+        self.assertTrue(all(chunker.boundary_cache is chunkers[0].boundary_cache for chunker in chunkers))
+
+    def test_model_pool_evicts_least_recently_used(self):
+        """Test the model pool keeps at most max_models languages."""
+        pool = SentenceModelPool(lambda language: language.upper(), max_models=2)
+        pool.get('english')
+        pool.get('german')
+        pool.get('english')
+        pool.get('french')
+        self.assertEqual(pool.loaded_languages(), ['english', 'french'])
+        self.assertEqual(pool.loads, 3)
+
+    def test_regex_segmenter_offsets(self):
+        """Test the regex segmenter keeps abbreviations, initials and decimals intact."""
+        text = "Dr. Smith paid $3.50 for coffee. Did J. R. Tolkien write it? \"Yes.\" he said.\n\nNew section"
+        spans = list(RegexSegmenter().span_tokenize(text))
+        self.assertEqual([text[start:end] for start, end in spans], [
+            "Dr. Smith paid $3.50 for coffee.",
+            "Did J. R. Tolkien write it?",
+            "\"Yes.\" he said.",
+            "New section"
+        ])
+
+    def test_segmenter_is_selectable_per_request(self):
+        """Test the segmenter parameter switches backends and keys the boundary cache."""
+        params = {'segmenter': 'regex', 'max_sentences_per_chunk': 2, 'overlap_sentences': 0}
+        chunks = self.chunker.chunk_document(self.test_content, self.metadata, params)
+        self.assertEqual(chunks[0]['content'], "This is the first sentence. This is the second sentence.")
+        self.chunker.chunk_document(self.test_content, self.metadata, {**params, 'segmenter': 'punkt'})
+        self.assertEqual(self.chunker.boundary_cache.misses, 2)
+
+        with self.assertRaises(ValueError):
+            self.chunker.chunk_document(self.test_content, self.metadata, {'segmenter': 'no_such'})
+
+    def test_parallel_segmentation_matches_serial(self):
+        """Test long documents segmented in the process pool match a serial run."""
+        paragraphs = [
+            f"Paragraph {i} starts here. Dr. Smith wrote part {i}.\nIt continues on a new line! Does it end? Yes."
+            for i in range(60)
+        ]
+        text = "\n\n".join(paragraphs)
+        cuts = split_points(text, 500)
+        self.assertGreater(len(cuts), 3)
+        self.assertTrue(all(text[cut - 2:cut] == "\n\n" for cut in cuts[1:-1]))
+
+        serial = SentenceChunker()
+        self.chunker.parallel_min_chars = 1000
+        self.chunker.parallel_segment_chars = 500
+        for segmenter in ('punkt', 'regex'):
+            self.assertEqual(
+                self.chunker.sentence_offsets(text, 'english', segmenter),
+                serial.sentence_offsets(text, 'english', segmenter)
+            )
+
+    def test_boundary_cache_evicts_least_recently_used(self):
+        """Test the boundary cache stays within its offset budget."""
+        cache = SentenceBoundaryCache(max_offsets=4)
+        cache.put('a', spans_to_offsets([(0, 5)]))
+        cache.put('b', spans_to_offsets([(0, 3)]))
+        cache.get('a')
+        cache.put('c', spans_to_offsets([(0, 7)]))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(list(cache.get('a')), [0, 5])
+        self.assertEqual(list(cache.get('c')), [0, 7])
+
 if __name__ == '__main__':
     unittest.main()
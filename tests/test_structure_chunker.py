@@ -0,0 +1,84 @@
+import unittest
+from src.chunking.structure_chunker import StructureChunker, scan_blocks
+
+class TestStructureChunker(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.chunker = StructureChunker()
+        self.test_content = (
+            "# User Guide\n\n"
+            "This guide explains the service.\n\n"
+            "## Installation\n\n"
+            "Follow these steps:\n\n"
+            "1. Download the package\n"
+            "2. Run the installer\n"
+            "   with administrator rights\n\n"
+            "3. Restart the machine\n\n"
+            "```bash\n"
+            "pip install service\n\n"
+            "service --version\n"
+            "```\n\n"
+            "## Usage\n\n"
+            "Call the API.\n\n"
+            "Troubleshooting\n"
+            "===============\n\n"
+            "2.1 Common Errors\n\n"
+            "Check the logs first.\n"
+        )
+
+    def test_scan_recognizes_blocks(self):
+        """Test headings, lists, code blocks and paragraphs are recognized."""
+        blocks = scan_blocks(self.test_content)
+        self.assertEqual([kind for kind, _, _ in blocks], [
+            'heading', 'paragraph', 'heading', 'paragraph', 'list', 'code',
+            'heading', 'paragraph', 'heading', 'heading', 'paragraph'
+        ])
+        self.assertEqual(blocks[4][1].count('\n'), 4)
+        self.assertTrue(blocks[5][1].endswith('service --version\n```'))
+        self.assertEqual([(text, level) for kind, text, level in blocks if kind == 'heading'], [
+            ('User Guide', 1), ('Installation', 2), ('Usage', 2), ('Troubleshooting', 1),
+            ('2.1 Common Errors', 2)
+        ])
+
+    def test_only_dotted_numbers_make_numbered_headings(self):
+        """Test standalone lines like '3 Apples' stay paragraphs while '3.2 Apples' is a heading."""
+        blocks = scan_blocks("Shopping\n\n3 Apples\n\n3.2 Apples\n\nRed ones.")
+        self.assertEqual([(kind, level) for kind, _, level in blocks], [
+            ('paragraph', 0), ('paragraph', 0), ('heading', 2), ('paragraph', 0)
+        ])
+
+    def test_chunks_follow_sections(self):
+        """Test no chunk spans two sections and each carries its section path."""
+        chunks = self.chunker.chunk_document(self.test_content, {'source': 'guide.md'})
+        self.assertEqual([chunk['metadata']['section_path'] for chunk in chunks], [
+            ['User Guide'],
+            ['User Guide', 'Installation'],
+            ['User Guide', 'Usage'],
+            ['Troubleshooting'],
+            ['Troubleshooting', '2.1 Common Errors']
+        ])
+        self.assertIn('3. Restart the machine', chunks[1]['content'])
+        self.assertEqual(chunks[1]['metadata']['block_types'], ['heading', 'paragraph', 'list', 'code'])
+        self.assertEqual(chunks[0]['metadata']['strategy'], 'structure_chunker')
+        self.assertEqual(chunks[0]['metadata']['source'], 'guide.md')
+
+    def test_blocks_split_only_when_over_budget(self):
+        """Test small budgets keep whole lists together and split oversized blocks."""
+        chunks = self.chunker.chunk_document(self.test_content, {}, {'max_chunk_chars': 100})
+        lists = [chunk for chunk in chunks if 'list' in chunk['metadata']['block_types']]
+        self.assertEqual(len(lists), 1)
+        self.assertIn('1. Download the package', lists[0]['content'])
+        self.assertIn('3. Restart the machine', lists[0]['content'])
+
+        long_paragraph = ' '.join(['word'] * 1000)
+        chunks = self.chunker.chunk_document(long_paragraph, {}, {'max_chunk_chars': 100})
+        self.assertTrue(all(len(chunk['content']) <= 100 for chunk in chunks))
+        self.assertEqual(' '.join(chunk['content'] for chunk in chunks), long_paragraph)
+
+    def test_invalid_params(self):
+        """Test a non-positive budget is rejected."""
+        with self.assertRaises(ValueError):
+            self.chunker.chunk_document(self.test_content, {}, {'max_chunk_chars': 0})
+
+if __name__ == '__main__':
+    unittest.main()